@@ -36,8 +36,9 @@ function submitFormClean(form) {
     }
   }
   // Any same-view control other than pagination returns to the first page.
-  if (sameView && !data.has("page")) {
+  if (sameView && !data.has("page") && !data.has("cursor")) {
     target.searchParams.delete("page");
+    target.searchParams.delete("cursor");
   }
   window.location.href = target.toString();
 }
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from plain.exceptions import ValidationError
+from plain.paginator import KeysetPage, KeysetPaginator, Page
 from plain.postgres import Q
 from plain.postgres.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from plain.postgres.fields.related_managers import BaseRelatedManager
@@ -51,6 +53,11 @@ class AdminModelListView(AdminListView):
     queryset_order: tuple[str, ...] = ()
     search_fields: tuple[str, ...] = ("id",)
 
+    # Unique, non-null columns to paginate by key, e.g. ("-created_at", "-id").
+    # Pages are then addressed by a signed cursor instead of a page number and
+    # the total is never counted, so a huge table stays fast at any depth.
+    keyset_order: tuple[str, ...] = ()
+
     # Filters can also be a dict mapping a filter name to a Q object,
     # which filters the queryset automatically.
     filters: tuple[str, ...] | dict[str, Q] = ()
@@ -78,6 +85,16 @@ class AdminModelListView(AdminListView):
 
         return f"{cls.model.model_options.model_name}/"
 
+    @cached_property
+    def page_obj(self) -> Page | KeysetPage | None:
+        # Sorting by a column asks for an order the keys can't follow, so it
+        # falls back to numbered pages.
+        if self.keyset_order and not self.request.query_params.get("order_by"):
+            return KeysetPaginator(
+                self.objects, self.get_page_size(), self.keyset_order
+            ).get_page(self.request.query_params.get("cursor"))
+        return super().page_obj
+
     def get_initial_objects(self) -> postgres.QuerySet:
         return self.get_initial_queryset()
 
@@ -4,6 +4,7 @@ from urllib.parse import urlparse
 
 from plain.htmx.views import HTMXView
 from plain.http import RedirectResponse, Response
+from plain.paginator import KeysetPage
 from plain.postgres import QuerySet
 from plain.templates.views import (
     CreateView,
@@ -93,6 +94,7 @@ class AdminListView(HTMXView, AdminView, ListView):
         context["search_fields"] = self.search_fields
 
         context["table_style"] = getattr(self, "_table_style", "default")
+        context["keyset_paginated"] = isinstance(self.page_obj, KeysetPage)
 
         context["get_object_id"] = self.get_object_id
         context["get_field_value"] = self.get_field_value
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from app.users.admin import UserAdmin
+from app.users.models import User
+from plain.paginator import KeysetPage, Page
+from plain.test import RequestFactory
+
+LIST_URL = "/admin/p/user"
+
+
+class KeysetUserList(UserAdmin.ListView):
+    keyset_order = ("-id",)
+    page_size = 2
+
+
+def _page(query: dict[str, str] | None = None):
+    return KeysetUserList(request=RequestFactory().get(LIST_URL, query)).page_obj
+
+
+def test_pages_by_cursor(db):
+    users = [User.query.create(username=f"u{i}") for i in range(5)]
+
+    first = _page()
+    assert isinstance(first, KeysetPage)
+    assert [u.id for u in first] == [users[4].id, users[3].id]
+
+    second = _page({"cursor": first.next_cursor})
+    assert [u.id for u in second] == [users[2].id, users[1].id]
+    assert second.has_previous()
+
+
+def test_column_sort_falls_back_to_numbered_pages(db):
+    User.query.create(username="a")
+
+    assert isinstance(_page({"order_by": "username"}), Page)
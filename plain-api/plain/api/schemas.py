@@ -1,6 +1,6 @@
-from typing import NotRequired, TypedDict
+from typing import Any, NotRequired, TypedDict
 
-__all__ = ["ErrorSchema", "FieldError"]
+__all__ = ["CursorPageSchema", "ErrorSchema", "FieldError"]
 
 
 class FieldError(TypedDict):
@@ -12,3 +12,9 @@ class ErrorSchema(TypedDict):
     id: str
     message: str
     errors: NotRequired[list[FieldError]]
+
+
+class CursorPageSchema(TypedDict):
+    results: list[Any]
+    next_cursor: str | None
+    previous_cursor: str | None
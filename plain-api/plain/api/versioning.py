@@ -1,8 +1,8 @@
-import json
 from functools import cached_property
 from typing import Any, ClassVar
 
 from plain.http import Request, Response
+from plain.json import get_json_codec
 from plain.views.exceptions import ResponseException
 
 from .views import APIView
@@ -108,14 +108,14 @@ class VersionedAPIView(APIView):
             return
 
         # Get the original request JSON
-        request_data = json.loads(request.body)
+        request_data = get_json_codec().loads(request.body)
 
         # Transform the request data for this version
         for change in changes:
             change().transform_request_forward(request, request_data)
 
         # Update the request body with the transformed data
-        request._body = json.dumps(request_data).encode("utf-8")
+        request._body = get_json_codec().dumps_bytes(request_data)
 
     def transform_response(self, response: Response) -> None:
         response_changes = []
@@ -139,11 +139,11 @@ class VersionedAPIView(APIView):
             return
 
         # Get the original response JSON
-        response_data = json.loads(response.content)
+        response_data = get_json_codec().loads(response.content)
 
         for change in reversed(response_changes):
             # Transform the response data for this version
             change().transform_response_backward(response, response_data)
 
         # Update the response body with the transformed data
-        response.content = json.dumps(response_data).encode("utf-8")
+        response.content = get_json_codec().dumps_bytes(response_data)
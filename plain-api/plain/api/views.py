@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping, Sequence
 from functools import cached_property
 from http.client import responses as http_status_phrases
 from typing import Any, ClassVar, cast
@@ -6,20 +6,24 @@ from typing import Any, ClassVar, cast
 from plain.exceptions import ValidationError
 from plain.forms.exceptions import FormFieldMissingError
 from plain.http import (
+    AsyncStreamingJsonResponse,
+    BadRequestError400,
     HTTPException,
     JsonResponse,
     NotFoundError404,
     Response,
+    StreamingJsonResponse,
     status_for_exception,
     status_omits_body,
 )
+from plain.paginator import InvalidCursor, KeysetPaginator
 from plain.utils import timezone
 from plain.utils.cache import patch_cache_control
 from plain.views.base import View
 from plain.views.exceptions import ResponseException
 
 from . import openapi
-from .schemas import ErrorSchema, FieldError
+from .schemas import CursorPageSchema, ErrorSchema, FieldError
 
 # Allow plain.api to be used without plain.postgres
 try:
@@ -36,12 +40,15 @@ __all__ = [
 
 # `Mapping[str, Any]` (vs `dict[str, Any]`) lets `def get(self) -> MyTypedDict:`
 # satisfy Liskov against the base view — TypedDicts aren't `dict` per PEP 589.
+# Iterators are streamed as a JSON array (see StreamingJsonResponse).
 type APIResult = (
     Response
     | None
     | Mapping[str, Any]
     | list[Any]
-    | tuple[int, dict[str, Any] | list[Any]]
+    | Iterator[Any]
+    | AsyncIterator[Any]
+    | tuple[int, dict[str, Any] | list[Any] | Iterator[Any] | AsyncIterator[Any]]
 )
 
 
@@ -217,8 +224,40 @@ class APIView(View[APIResult]):
                 return Response(status_code=status_code)
             return JsonResponse(result, status_code=status_code)
 
+        if isinstance(result, Iterator):
+            return StreamingJsonResponse(result, status_code=status_code)
+        if isinstance(result, AsyncIterator):
+            return AsyncStreamingJsonResponse(result, status_code=status_code)
+
         raise TypeError(f"Unexpected APIView return type: {type(result).__name__}")
 
+    def paginate(
+        self,
+        object_list: Any,
+        *,
+        ordering: Sequence[str],
+        per_page: int,
+        serialize: Callable[[Any], Any],
+    ) -> CursorPageSchema:
+        """Return one keyset page of `object_list`, picked by the `?cursor` param.
+
+        `ordering` must be unique and non-null together, e.g.
+        `("-created_at", "-id")`. Clients follow `next_cursor` and
+        `previous_cursor` instead of page numbers, and nothing is counted.
+        """
+        paginator = KeysetPaginator(object_list, per_page, ordering)
+        try:
+            page = paginator.page(self.request.query_params.get("cursor"))
+        except InvalidCursor as e:
+            # Unlike an HTML list, a client sending a bad cursor should hear
+            # about it rather than silently restart from the first page.
+            raise BadRequestError400(str(e)) from e
+        return {
+            "results": [serialize(obj) for obj in page],
+            "next_cursor": page.next_cursor,
+            "previous_cursor": page.previous_cursor,
+        }
+
     def handle_exception(self, exc: Exception) -> Response:
         if isinstance(exc, ValidationError):
             errors = _validation_field_errors(exc)
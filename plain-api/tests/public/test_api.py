@@ -1,3 +1,4 @@
+import json
 from typing import Literal, TypedDict
 
 import pytest
@@ -6,7 +7,7 @@ from plain.api.openapi.generator import OpenAPISchemaGenerator
 from plain.api.openapi.utils import schema_from_type
 from plain.api.openapi.validation import validate_openapi_schema
 from plain.api.views import APIKeyView, APIView
-from plain.http import HTTPException
+from plain.http import HTTPException, StreamingJsonResponse
 from plain.test import Client, RequestFactory
 from plain.urls import Router, path
 
@@ -71,6 +72,15 @@ def test_tuple_bodiless_status_with_data_raises():
         view.convert_result_to_response((204, {"deleted": True}))
 
 
+def test_iterator_return_value_streams_a_json_array():
+    """Returning an iterator (e.g. `QuerySet.iterator()`) streams it."""
+    view = APIView(request=RequestFactory().get("/"))
+    response = view.convert_result_to_response((201, ({"id": i} for i in range(3))))
+    assert isinstance(response, StreamingJsonResponse)
+    assert response.status_code == 201
+    assert json.loads(b"".join(response)) == [{"id": 0}, {"id": 1}, {"id": 2}]
+
+
 def test_versioned_api_view():
     client = Client()
     response = client.post(
@@ -970,3 +980,18 @@ def test_return_annotation_fills_in_200_when_schema_decorator_only_sets_summary(
     assert op["responses"]["200"]["content"]["application/json"]["schema"] == {
         "$ref": "#/components/schemas/Item"
     }
+
+
+def test_paginate_rejects_a_bad_cursor():
+    """A tampered cursor is a client error, not a silent restart."""
+
+    class ListView(APIView):
+        def get(self):
+            return self.paginate(
+                [], ordering=("-id",), per_page=10, serialize=lambda obj: obj
+            )
+
+    view = ListView(request=RequestFactory().get("/", {"cursor": "tampered"}))
+    response = view.get_response()
+    assert response.status_code == 400
+    assert json.loads(response.content)["id"] == "bad_request"
@@ -136,3 +136,35 @@ class TestAssetViewLocalRedirect:
     def test_unknown_path_returns_none(self, manifest):
         view = make_asset_view(manifest, "unknown.css")
         assert view.get_redirect_response("unknown.css") is None
+
+
+class TestAssetViewGetResponse:
+    """A real file served through the full View.get_response() dispatch."""
+
+    def make_view(self, tmp_path, manifest, **headers: str) -> AssetView:
+        asset = tmp_path / "app.js"
+        asset.write_text("console.log('hi')")
+
+        class _View(AssetView):
+            def get_manifest(self):
+                return manifest
+
+            def get_asset_path(self, path: str) -> str:
+                return str(tmp_path / path)
+
+        request = RequestFactory().get("/assets/app.js", headers=headers)
+        return _View(request=request, url_kwargs={"path": "app.js"})
+
+    def test_serves_the_file(self, tmp_path, manifest):
+        response = self.make_view(tmp_path, manifest).get_response()
+
+        assert response.status_code == 200
+        assert b"".join(response) == b"console.log('hi')"
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+    def test_matching_etag_is_not_modified(self, tmp_path, manifest):
+        etag = self.make_view(tmp_path, manifest).get_response().headers["ETag"]
+
+        view = self.make_view(tmp_path, manifest, **{"If-None-Match": etag})
+        assert view.get_response().status_code == 304
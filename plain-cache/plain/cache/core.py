@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import json
 from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+from plain.json import get_json_codec
 from plain.postgres import get_connection, transaction
 from plain.postgres.dialect import quote_name
 from plain.utils import timezone
@@ -215,7 +215,7 @@ class Cache:
 
         # `value::text` returns the new total as JSON text regardless of driver;
         # decode it to the same Python number `get()` would yield.
-        return json.loads(row[0])
+        return get_json_codec().loads(row[0])
 
     def decrement(
         self, key: str, delta: int = 1, *, expiration: Expiration = None
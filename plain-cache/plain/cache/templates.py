@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import hashlib
+import weakref
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.nodes import CallBlock, Node
+from jinja2.parser import Parser
+from jinja2.runtime import Context
+from opentelemetry import metrics, trace
+from plain.templates import register_template_extension
+
+from .core import cache
+from .views import _digest
+
+if TYPE_CHECKING:
+    from plain.http import Request
+
+_FRAGMENT_PREFIX = "plain.cache.fragment:"
+
+# How many of a template's fragment keys are remembered for the next render
+# of it to prefetch.
+_PREFETCH_LIMIT = 100
+
+_MISSING = object()
+
+tracer = trace.get_tracer("plain.cache")
+meter = metrics.get_meter("plain.cache")
+
+fragment_lookups_counter = meter.create_counter(
+    "plain.cache.fragment.lookups",
+    unit="{lookup}",
+    description="Template fragment cache lookups, by hit or miss.",
+)
+
+
+@dataclass
+class _RenderLookups:
+    """Fragment lookups made while rendering one template."""
+
+    found: dict[str, Any]
+    checked: set[str]
+    keys: list[str] = field(default_factory=list)
+
+
+@dataclass
+class FragmentLookups:
+    """How one fragment's lookups went while rendering for a request."""
+
+    name: str
+    hits: int = 0
+    misses: int = 0
+
+
+_request_fragments: weakref.WeakKeyDictionary[Request, dict[str, FragmentLookups]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_request_fragment_lookups(request: Request) -> list[FragmentLookups]:
+    """The fragments looked up rendering for `request`, in the order first used."""
+    return list(_request_fragments.get(request, {}).values())
+
+
+def _record_lookup(request: Request, name: str, hit: bool) -> None:
+    fragments = _request_fragments.setdefault(request, {})
+    if (lookups := fragments.get(name)) is None:
+        lookups = fragments[name] = FragmentLookups(name)
+    if hit:
+        lookups.hits += 1
+    else:
+        lookups.misses += 1
+
+
+@register_template_extension
+class FragmentCacheExtension(Extension):
+    """
+    `{% cache "name", vary_on..., expiration=... %}...{% endcache %}`
+    stores the rendered block in `plain.cache`.
+
+    Keys include a digest of the block's parsed body, so editing the block
+    invalidates it. The first lookup in a render fetches every key the
+    previous render of the template looked up in one `get_many()`.
+    """
+
+    tags = {"cache"}  # noqa: RUF012 — jinja2 types `tags` as an instance attribute; ClassVar here fails ty's LSP check
+
+    def __init__(self, environment: Any) -> None:
+        super().__init__(environment)
+        self._recent_keys: dict[str | None, list[str]] = {}
+        self._renders: weakref.WeakKeyDictionary[Context, _RenderLookups] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def parse(self, parser: Parser) -> Node:
+        lineno = next(parser.stream).lineno
+
+        args = [parser.parse_expression()]
+        expiration: nodes.Expr = nodes.Const(None)
+
+        while parser.stream.skip_if("comma"):
+            if (
+                parser.stream.current.type == "name"
+                and parser.stream.look().type == "assign"
+            ):
+                if parser.stream.current.value != "expiration":
+                    parser.fail(
+                        f"Unexpected keyword '{parser.stream.current.value}' in cache tag",
+                        parser.stream.current.lineno,
+                    )
+                parser.stream.skip(2)
+                expiration = parser.parse_expression()
+            else:
+                args.append(parser.parse_expression())
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        version = hashlib.sha256(f"{parser.name}\0{body!r}".encode()).hexdigest()[:16]
+
+        call = self.call_method(
+            "_render_cached",
+            args=[
+                nodes.Const(version),
+                nodes.List(args),
+                expiration,
+                nodes.ContextReference(),
+            ],
+        )
+
+        callblock = CallBlock(call, [], [], body)
+        callblock.set_lineno(lineno)
+
+        return callblock
+
+    def _render_cached(
+        self,
+        version: str,
+        args: list[Any],
+        expiration: Any,
+        context: Context,
+        caller: Any,
+    ) -> str:
+        name = str(args[0])
+        key = _FRAGMENT_PREFIX + _digest(version, *(str(arg) for arg in args))
+
+        with tracer.start_as_current_span(
+            f"cache fragment {name}",
+            kind=trace.SpanKind.INTERNAL,
+            attributes={
+                "plain.cache.fragment": name,
+                "template.filename": context.name or "",
+            },
+        ) as span:
+            content = self._lookup(context, key)
+            hit = content is not _MISSING
+            span.set_attribute("plain.cache.hit", hit)
+            fragment_lookups_counter.add(1, {"plain.cache.hit": hit})
+            if (request := context.get("request")) is not None:
+                _record_lookup(request, name, hit)
+
+            if not hit:
+                content = caller()
+                cache.set(key, str(content), expiration=expiration)
+
+        return content
+
+    def _lookup(self, context: Context, key: str) -> Any:
+        lookups = self._renders.get(context)
+        if lookups is None:
+            keys = {key, *self._recent_keys.get(context.name, ())}
+            lookups = _RenderLookups(found=cache.get_many(keys), checked=keys)
+            self._renders[context] = lookups
+            self._recent_keys[context.name] = lookups.keys
+
+        if len(lookups.keys) < _PREFETCH_LIMIT:
+            lookups.keys.append(key)
+
+        if key in lookups.checked:
+            return lookups.found.get(key, _MISSING)
+
+        return cache.get(key, _MISSING)
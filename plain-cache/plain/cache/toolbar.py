@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Any
+
+from plain.toolbar import ToolbarItem, register_toolbar_item
+
+from .templates import get_request_fragment_lookups
+
+
+@register_toolbar_item
+class FragmentCacheToolbarItem(ToolbarItem):
+    name = "Cache"
+    panel_template_name = "toolbar/cache.html"
+
+    def is_enabled(self) -> bool:
+        # The page's render is still going, so this covers the fragments
+        # looked up before the toolbar rendered.
+        return bool(get_request_fragment_lookups(self.request))
+
+    def get_template_context(self) -> dict[str, Any]:
+        context = super().get_template_context()
+        context["fragments"] = get_request_fragment_lookups(self.request)
+        return context
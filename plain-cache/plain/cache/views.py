@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import inspect
+from collections.abc import Callable, Iterable, Sequence
+from functools import partial
+from typing import Any
+
+from plain.http import Request, Response
+from plain.views import View
+
+from .core import Expiration, cache
+
+try:
+    from plain.sessions.exceptions import SessionNotAvailable
+    from plain.sessions.requests import get_request_session
+except ImportError:
+    get_request_session: Any = None
+
+__all__ = ["CachedResponseView", "invalidate_cached_responses"]
+
+_RESPONSE_PREFIX = "plain.cache.response:"
+_VARY_PREFIX = "plain.cache.vary:"
+_TAG_PREFIX = "plain.cache.tag:"
+
+
+def invalidate_cached_responses(*tags: str) -> None:
+    """Expire every cached response stored under any of `tags`.
+
+    Each tag has a version counter that's part of the cache key, so bumping
+    it orphans the old entries in one write per tag — they're never read
+    again and the `clear_expired` chore deletes them once their TTL lapses.
+    """
+    for tag in tags:
+        cache.increment(_TAG_PREFIX + tag)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _vary_headers(response: Response) -> list[str] | None:
+    """Request headers the response varies on, or None for `Vary: *`."""
+    vary = response.headers.get("Vary") or ""
+    headers = [header.strip().lower() for header in vary.split(",") if header.strip()]
+    if "*" in headers:
+        return None
+    return sorted(set(headers))
+
+
+def _is_storable(response: Response) -> bool:
+    if response.status_code != 200 or response.streaming or response.cookies:
+        return False
+    cache_control = response.headers.get("Cache-Control") or ""
+    directives = {d.strip().lower() for d in cache_control.split(",")}
+    return not directives & {"private", "no-store"}
+
+
+def _modified_session(request: Request) -> bool:
+    """Whether the view wrote to the session, which SessionMiddleware turns
+    into a session cookie after the view returns — too late for the cookie
+    check in `_is_storable`. Reads are fine: only requests without cookies
+    are cached, and their session is always empty."""
+    if get_request_session is None:
+        return False
+    try:
+        session = get_request_session(request)
+    except SessionNotAvailable:
+        return False
+    return session.modified
+
+
+class CachedResponseView(View):
+    """Serve GET/HEAD responses from `plain.cache` instead of re-rendering.
+
+    A hit replaces the handler, so `before_request` and `after_response`
+    still run — use it for pages whose output is the same for everyone who
+    sends the same URL and the same values for the headers the response
+    lists in `Vary`.
+
+    Requests with cookies are never cached, since anything from a session
+    to a preference can change the page. Only 200 responses with no cookies
+    and no `Cache-Control: private` or `no-store` are stored, from views
+    that didn't write to the session, so a page that marks itself private for
+    logged-in users (as `AuthView` does) is only ever cached in its
+    anonymous form. Async handlers are not cached.
+    """
+
+    cache_expiration: Expiration = 60
+    cache_tags: Sequence[str] = ()
+
+    def get_cache_tags(self) -> Sequence[str]:
+        """Tags to file the response under, for `invalidate_cached_responses`."""
+        return self.cache_tags
+
+    def get_request_handler(self) -> Callable[[], Any] | None:
+        handler = super().get_request_handler()
+        if (
+            handler is None
+            or self.request.method not in ("GET", "HEAD")
+            or inspect.iscoroutinefunction(handler)
+            or self.request.cookies
+        ):
+            return handler
+        return partial(self._cached_handler, handler)
+
+    def _cached_handler(self, handler: Callable[[], Any]) -> Response:
+        # Everything but the Vary values, which aren't known until the
+        # response has been rendered once — the list is stored under its
+        # own key and read back together with the tag versions.
+        query = sorted(self.request.query_params.lists())
+        base = _digest(self.request.host, self.request.path, repr(query))
+        tags = list(self.get_cache_tags())
+        tag_keys = [_TAG_PREFIX + tag for tag in tags]
+        found = cache.get_many([_VARY_PREFIX + base, *tag_keys])
+        tag_versions = [str(found.get(key, 0)) for key in tag_keys]
+
+        vary = found.get(_VARY_PREFIX + base)
+        if vary is not None:
+            stored = cache.get(self._response_key(base, vary, tags, tag_versions))
+            if stored is not None:
+                return self._response_from_cache(stored)
+
+        response = self.convert_result_to_response(handler())
+        if not _modified_session(self.request):
+            self._store_response(response, base, tags, tag_versions)
+        return response
+
+    def _response_key(
+        self,
+        base: str,
+        vary: Iterable[str],
+        tags: Sequence[str],
+        tag_versions: Sequence[str],
+    ) -> str:
+        return _RESPONSE_PREFIX + _digest(
+            base,
+            *(f"{header}={self.request.headers.get(header, '')}" for header in vary),
+            *(f"{tag}={version}" for tag, version in zip(tags, tag_versions)),
+        )
+
+    def _store_response(
+        self,
+        response: Response,
+        base: str,
+        tags: Sequence[str],
+        tag_versions: Sequence[str],
+    ) -> None:
+        if not _is_storable(response):
+            return
+        vary = _vary_headers(response)
+        if vary is None:
+            return
+        stored: dict[str, Any] = {
+            # None values included: a view that removed a default header
+            # must not get it back from DefaultHeadersMiddleware on a hit.
+            "headers": list(response.headers.items()),
+            # Values are JSON, so the body travels as base64.
+            "body": base64.b64encode(response.content).decode("ascii"),
+        }
+        cache.set_many(
+            {
+                _VARY_PREFIX + base: vary,
+                self._response_key(base, vary, tags, tag_versions): stored,
+            },
+            expiration=self.cache_expiration,
+        )
+
+    def _response_from_cache(self, stored: dict[str, Any]) -> Response:
+        return Response(
+            base64.b64decode(stored["body"]),
+            headers=dict(stored["headers"]),
+        )
@@ -3,4 +3,9 @@ URLS_ROUTER = "app.urls.AppRouter"
 INSTALLED_PACKAGES = [
     "plain.postgres",
     "plain.cache",
+    "plain.sessions",
+    "plain.templates",
+]
+MIDDLEWARE = [
+    "plain.sessions.middleware.SessionMiddleware",
 ]
@@ -1,6 +1,35 @@
-from plain.urls import Router
+from plain.cache.views import CachedResponseView
+from plain.http import ForbiddenError403, Response
+from plain.sessions.requests import get_request_session
+from plain.urls import Router, path
+
+
+class SessionPageView(CachedResponseView):
+    renders = 0
+
+    def get(self) -> Response:
+        type(self).renders += 1
+        session = get_request_session(self.request)
+        session["visits"] = session.get("visits", 0) + 1
+        return Response(f"visit {session['visits']}")
+
+
+class GuardedPageView(CachedResponseView):
+    renders = 0
+    allowed = True
+
+    def before_request(self) -> None:
+        if not type(self).allowed:
+            raise ForbiddenError403("Closed")
+
+    def get(self) -> Response:
+        type(self).renders += 1
+        return Response("guarded")
 
 
 class AppRouter(Router):
     namespace = ""
-    urls = ()
+    urls = (
+        path("session", SessionPageView),
+        path("guarded", GuardedPageView),
+    )
@@ -0,0 +1,131 @@
+"""CachedResponseView: Vary-aware keys, storability rules, and tags."""
+
+from __future__ import annotations
+
+from app.urls import GuardedPageView, SessionPageView
+from plain.cache.views import CachedResponseView, invalidate_cached_responses
+from plain.http import Response
+from plain.test import Client, RequestFactory
+from plain.utils.cache import patch_cache_control, patch_vary_headers
+
+rf = RequestFactory()
+
+
+class _CountingView(CachedResponseView):
+    renders = 0
+    cache_tags = ("marketing",)
+
+    def get(self) -> Response:
+        type(self).renders += 1
+        response = Response(f"render {self.renders}")
+        response.headers["X-Frame-Options"] = None
+        patch_vary_headers(response, ["Accept-Language"])
+        return response
+
+
+def _get(view_class: type[CachedResponseView], path: str = "/", **headers: str):
+    return view_class(request=rf.get(path, headers=headers)).get_response()
+
+
+def test_second_request_is_served_from_cache(db):
+    _CountingView.renders = 0
+    first = _get(_CountingView)
+    second = _get(_CountingView)
+    assert _CountingView.renders == 1
+    assert second.content == first.content == b"render 1"
+    assert second.headers["Content-Type"] == first.headers["Content-Type"]
+    # A header the view removed stays removed on a hit.
+    assert "X-Frame-Options" in second.headers
+    assert second.headers["X-Frame-Options"] is None
+
+
+def test_key_includes_query_and_vary_values(db):
+    _CountingView.renders = 0
+    _get(_CountingView, "/?b=2&a=1")
+    _get(_CountingView, "/?a=1&b=2")  # same query, different order
+    assert _CountingView.renders == 1
+
+    _get(_CountingView, "/?a=1")
+    assert _CountingView.renders == 2
+
+    _get(_CountingView, **{"Accept-Language": "fr"})
+    _get(_CountingView, **{"Accept-Language": "de"})
+    _get(_CountingView, **{"Accept-Language": "fr"})
+    assert _CountingView.renders == 4
+
+
+def test_tag_invalidation(db):
+    _CountingView.renders = 0
+    _get(_CountingView)
+    invalidate_cached_responses("marketing")
+    assert _get(_CountingView).content == b"render 2"
+    assert _get(_CountingView).content == b"render 2"
+
+
+def test_private_no_store_and_cookies_are_not_stored(db):
+    class PrivateView(CachedResponseView):
+        renders = 0
+
+        def get(self) -> Response:
+            type(self).renders += 1
+            response = Response("private")
+            patch_cache_control(response, private=True)
+            return response
+
+    class CookieView(CachedResponseView):
+        renders = 0
+
+        def get(self) -> Response:
+            type(self).renders += 1
+            response = Response("cookie")
+            response.set_cookie("seen", "1")
+            return response
+
+    for view_class in (PrivateView, CookieView):
+        _get(view_class)
+        _get(view_class)
+        assert view_class.renders == 2
+
+
+def test_unsafe_methods_bypass_the_cache(db):
+    class FormView(CachedResponseView):
+        posts = 0
+
+        def post(self) -> Response:
+            type(self).posts += 1
+            return Response("ok")
+
+    for _ in range(2):
+        FormView(request=rf.post("/")).get_response()
+    assert FormView.posts == 2
+
+
+def test_pages_that_write_the_session_are_not_stored(db):
+    SessionPageView.renders = 0
+    assert Client().get("/session").cookies["sessionid"]
+    assert Client().get("/session").cookies["sessionid"]
+    assert SessionPageView.renders == 2
+
+
+def test_requests_with_cookies_bypass_the_cache(db):
+    GuardedPageView.renders = 0
+    GuardedPageView.allowed = True
+    Client().get("/guarded")
+    Client().get("/guarded")
+    assert GuardedPageView.renders == 1
+
+    client = Client()
+    client.cookies["sessionid"] = "someone"
+    client.get("/guarded")
+    assert GuardedPageView.renders == 2
+
+
+def test_hits_still_run_before_request(db):
+    GuardedPageView.allowed = True
+    assert Client().get("/guarded").status_code == 200
+
+    GuardedPageView.allowed = False
+    try:
+        assert Client().get("/guarded").status_code == 403
+    finally:
+        GuardedPageView.allowed = True
@@ -0,0 +1,48 @@
+"""{% cache %}: rendered fragments are stored in plain.cache and looked up
+together on the next render."""
+
+from __future__ import annotations
+
+from plain.cache import cache
+from plain.cache.templates import FragmentLookups, get_request_fragment_lookups
+from plain.templates.jinja import environment
+from plain.test import RequestFactory
+
+PAGE = """\
+{% cache "nav", expiration=60 %}nav:{{ user }}{% endcache %}
+{% for item in items %}{% cache "item", item %}<i>{{ item }}:{{ user }}</i>{% endcache %}{% endfor %}"""
+
+
+def test_fragments_are_served_from_the_cache(db):
+    template = environment.from_string(PAGE)
+    assert template.render(user="a", items=[1, 2]) == "nav:a\n<i>1:a</i><i>2:a</i>"
+
+    # Cached under the vary_on values, not the rest of the context.
+    assert template.render(user="b", items=[2, 3]) == "nav:a\n<i>2:a</i><i>3:b</i>"
+
+
+def test_next_render_prefetches_in_one_query(db, monkeypatch):
+    template = environment.from_string(PAGE)
+    template.render(user="a", items=[1, 2])
+
+    lookups = []
+    monkeypatch.setattr(cache, "get", lambda *args: lookups.append(args))
+    assert template.render(user="b", items=[1, 2]) == "nav:a\n<i>1:a</i><i>2:a</i>"
+    assert lookups == []
+
+
+def test_editing_the_block_invalidates_it(db):
+    environment.from_string('{% cache "x" %}old{% endcache %}').render()
+    assert environment.from_string('{% cache "x" %}new{% endcache %}').render() == "new"
+
+
+def test_lookups_are_totalled_per_request(db):
+    request = RequestFactory().get("/")
+    template = environment.from_string(PAGE)
+    template.render(request=request, user="a", items=[1, 1])
+
+    assert get_request_fragment_lookups(request) == [
+        FragmentLookups("nav", hits=0, misses=1),
+        FragmentLookups("item", hits=1, misses=1),
+    ]
+    assert get_request_fragment_lookups(RequestFactory().get("/")) == []
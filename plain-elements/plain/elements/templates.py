@@ -2,35 +2,40 @@ from __future__ import annotations
 
 import os
 import re
-from typing import Any
+from typing import Any, cast
 
 from jinja2 import nodes, pass_context
-from jinja2.environment import Environment
+from jinja2.environment import Environment, Template
 from jinja2.ext import Extension
 from jinja2.parser import Parser
 from jinja2.runtime import Context
 from plain.templates import register_template_extension
+from plain.templates.jinja import record_template_load
 from plain.utils.safestring import SafeString, mark_safe
 
 
 @pass_context
 def Element(ctx: Context, _element_name: str, **kwargs: Any) -> SafeString:
-    element_path_name = _element_name.replace(".", os.sep)
-    template = ctx.environment.get_template(f"elements/{element_path_name}.html")
+    environment = ctx.environment
+    extension = cast(
+        ElementsExtension, environment.extensions[ElementsExtension.identifier]
+    )
+    template = extension.get_element_template(_element_name)
 
     if "caller" in kwargs and "children" not in kwargs:
         # If we have a caller, we need to pass it as the children
         kwargs["children"] = kwargs["caller"]()
 
-    output = template.render(
-        {
-            # Note that this passes globals, but not things like loop variables
-            # so for the most part you need to manually pass the kwargs you want
-            **ctx.get_all(),
-            **kwargs,
-        }
+    # The element's attributes are layered over the page's variables instead
+    # of merged into a copy of them. Note that this passes globals, but not
+    # things like loop variables so for the most part you need to manually
+    # pass the kwargs you want
+    context = environment.context_class(
+        environment, ctx.get_all(), template.name, template.blocks
     )
-    return mark_safe(output)
+    context.vars.update(kwargs)
+
+    return mark_safe(environment.concat(template.root_render_func(context)))
 
 
 @register_template_extension
@@ -42,6 +47,10 @@ class ElementsExtension(Extension):
         # Make the Element function available in connection with this extension
         env.globals["Element"] = Element  # ty: ignore[invalid-assignment]
 
+        # Element templates by name, loaded once unless the environment
+        # reloads changed templates.
+        self._element_templates: dict[str, Template] = {}
+
         self._CAP_TAG = r"(?:[a-z_]+\.)?[A-Z][A-Za-z0-9_]*"
 
         # Jinja comments may mention capitalized tags as documentation —
@@ -61,6 +70,29 @@ class ElementsExtension(Extension):
             rf"</\1>"
         )
 
+    def bind(self, environment: Environment) -> ElementsExtension:
+        # Overlays get a copy of the extension, not a share of its templates.
+        rv = super().bind(environment)
+        rv._element_templates = {}
+        return rv
+
+    def get_element_template(self, element_name: str) -> Template:
+        if self.environment.auto_reload:
+            return self._load_element_template(element_name)
+
+        try:
+            template = self._element_templates[element_name]
+        except KeyError:
+            template = self._load_element_template(element_name)
+            self._element_templates[element_name] = template
+        else:
+            record_template_load(template)
+        return template
+
+    def _load_element_template(self, element_name: str) -> Template:
+        element_path_name = element_name.replace(".", os.sep)
+        return self.environment.get_template(f"elements/{element_path_name}.html")
+
     def parse(self, parser: Parser) -> nodes.Output:
         # Consume {% use_elements %} and output nothing
         parser.stream.skip()
@@ -144,5 +176,11 @@ class ElementsExtension(Extension):
         if attrs_str:
             attrs_str = ", " + attrs_str
 
+        if not children:
+            # Without a body there's no caller to build on every render.
+            if "children" not in attrs:
+                attrs_str += ', children=""'
+            return f'{{{{ Element("{element_name}"{attrs_str}) }}}}'
+
         call = f'{{% call Element("{element_name}"{attrs_str}) %}}{children}{{% endcall %}}'
         return call.strip()
@@ -6,7 +6,7 @@ def _make_env(templates: dict[str, str]):
     """Spin up a Jinja env with our extension and in‑memory templates."""
     return Environment(
         loader=DictLoader(templates),
-        extensions=[ElementsExtension],  # ty: ignore[invalid-argument-type] (jinja2 Extension metaclass widens to list[type])
+        extensions=[ElementsExtension],
         autoescape=False,  # keep it simple for the test
     )
 
@@ -156,6 +156,50 @@ def test_element_child_variable():
     assert out == "Hello bar"
 
 
+def test_self_closing_element_has_empty_children():
+    env = _make_env(
+        {
+            "index.html": "{% use_elements %}[<MyElement />][<MyElement children={'x'} />]",
+            "elements/MyElement.html": "({{ children }})",
+        }
+    )
+    out = env.get_template("index.html").render()
+    assert out == "[()][(x)]"
+
+
+def test_element_sees_page_variables():
+    env = _make_env(
+        {
+            "index.html": "{% use_elements %}{% set title = 'Page' %}<MyElement foo='bar' />",
+            "elements/MyElement.html": "{{ title }} {{ site }} {{ foo }}",
+        }
+    )
+    out = env.get_template("index.html").render(site="Plain")
+    assert out == "Page Plain bar"
+
+
+def test_element_templates_load_once_without_auto_reload():
+    templates = {
+        "index.html": "{% use_elements %}<MyElement />",
+        "elements/MyElement.html": "one",
+    }
+
+    env = _make_env(templates)
+    assert env.get_template("index.html").render() == "one"
+    templates["elements/MyElement.html"] = "two"
+    assert env.get_template("index.html").render() == "two"
+
+    env = _make_env(templates)
+    env.auto_reload = False
+    assert env.get_template("index.html").render() == "two"
+    templates["elements/MyElement.html"] = "three"
+    assert env.get_template("index.html").render() == "two"
+
+    # An overlay has its own templates.
+    overlay = env.overlay(loader=DictLoader(templates))
+    assert overlay.get_template("index.html").render() == "three"
+
+
 # def test_element_child_braced():
 #     env = _make_env(
 #         {
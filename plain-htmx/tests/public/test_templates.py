@@ -6,7 +6,7 @@ from plain.htmx.templates import HTMXFragmentExtension, render_template_fragment
 
 
 def make_env():
-    return jinja2.Environment(extensions=[HTMXFragmentExtension])  # ty: ignore[invalid-argument-type] (jinja2 Extension metaclass widens to list[type])
+    return jinja2.Environment(extensions=[HTMXFragmentExtension])
 
 
 def test_fragment_full_page_render():
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import sys
+
+import click
+from plain.cli import register_cli
+
+from .prerender import build_pages, get_prerendered_path
+
+
+@register_cli("pages")
+@click.group()
+def cli() -> None:
+    """Static pages"""
+
+
+@cli.command()
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only render pages whose source or templates changed since the last build",
+)
+@click.option(
+    "--host",
+    default="",
+    help="Host header to render with (defaults to the first ALLOWED_HOSTS entry)",
+)
+def build(incremental: bool, host: str) -> None:
+    """Prerender pages to static HTML"""
+    counts = {"built": 0, "unchanged": 0, "skipped": 0, "error": 0}
+
+    for result in build_pages(incremental=incremental, host=host):
+        counts[result.status] += 1
+
+        if result.status == "built":
+            click.echo(f"Built {result.url}")
+        elif result.status == "skipped":
+            click.secho(f"Skipped {result.url} ({result.message})", fg="yellow")
+        elif result.status == "error":
+            click.secho(f"{result.url}: {result.message}", fg="red", err=True)
+
+    click.secho(
+        f"Prerendered {counts['built']} pages to {get_prerendered_path()}"
+        f" ({counts['unchanged']} unchanged, {counts['skipped']} dynamic)",
+        fg="green",
+    )
+
+    if counts["error"]:
+        click.secho(f"{counts['error']} pages failed to render", fg="red", err=True)
+        sys.exit(1)
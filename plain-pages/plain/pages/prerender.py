@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from plain.runtime import PLAIN_TEMP_PATH, settings
+from plain.templates.jinja import recording_template_loads
+from plain.urls import reverse
+
+from .pages import Page
+from .registry import pages_registry
+
+__all__ = ["build_pages", "get_prerendered_file", "get_prerendered_path"]
+
+# Set while `build_pages` renders, so `PageView` renders the page instead of
+# serving the file that is being rebuilt.
+_building: ContextVar[bool] = ContextVar("plain.pages.building", default=False)
+
+
+def get_prerendered_path() -> Path:
+    """
+    Get the path at runtime to the prerendered pages directory.
+
+    Lives next to the compiled assets, and like them is written at build time.
+    """
+    return PLAIN_TEMP_PATH / "pages" / "prerendered"
+
+
+def get_prerendered_file(page: Page) -> Path | None:
+    """The prerendered HTML for a page, or None to render it on request."""
+    if settings.DEBUG or _building.get():
+        return None
+
+    url_path = page.get_url_path()
+    if url_path is None:
+        return None
+
+    path = get_prerendered_path() / url_path / "index.html"
+    return path if path.is_file() else None
+
+
+def is_prerendered(page: Page) -> bool:
+    """Whether `plain pages build` should render this page ahead of time."""
+    return (
+        not page.is_redirect()
+        and not page.is_asset()
+        and page.get_url_path() is not None
+        and page.vars.get("prerender", True)
+    )
+
+
+@dataclass
+class BuildResult:
+    url_name: str
+    url: str
+    status: str  # "built", "unchanged", "skipped" or "error"
+    message: str = ""
+
+
+def build_pages(*, incremental: bool = False, host: str = "") -> Iterator[BuildResult]:
+    """
+    Render every prerenderable page to `get_prerendered_path()`.
+
+    Pages are requested through the test client, so the files hold exactly
+    what the view would have returned. A response that sets a cookie, or is
+    not a 200 text/html, depends on the request and stays dynamic.
+
+    With `incremental`, a page is only rendered again when its source or one
+    of the templates its last render loaded has changed.
+    """
+    # Only the build needs the test client, not the views serving the files
+    from plain.test import Client
+
+    target_dir = get_prerendered_path()
+    manifest_path = target_dir / "manifest.json"
+
+    previous: dict[str, Any] = {}
+    if manifest_path.exists():
+        previous = json.loads(manifest_path.read_text())
+
+    manifest: dict[str, Any] = {}
+    headers = {"Host": host or _default_host(), "Accept": "text/html"}
+    token = _building.set(True)
+
+    try:
+        for page in pages_registry.iter_pages():
+            if not is_prerendered(page):
+                continue
+
+            url_path = page.get_url_path()
+            url_name = page.get_url_name()
+            assert url_path is not None
+            assert url_name is not None
+            url = reverse(f"pages:{url_name}")
+            output_path = target_dir / url_path / "index.html"
+
+            entry = previous.get(url_name)
+            if (
+                incremental
+                and entry
+                and output_path.exists()
+                and _gzip_path(output_path).exists()
+                and _is_current(entry["dependencies"])
+            ):
+                manifest[url_name] = entry
+                yield BuildResult(url_name, url, "unchanged")
+                continue
+
+            with recording_template_loads() as loaded:
+                # A new client each time, so no page sees another's cookies
+                client = Client(raise_request_exception=False, headers=headers)
+                response = client.get(url)
+
+            if response.exception:
+                _remove(output_path)
+                yield BuildResult(url_name, url, "error", str(response.exception))
+                continue
+
+            if reason := _dynamic_reason(response):
+                _remove(output_path)
+                yield BuildResult(url_name, url, "skipped", reason)
+                continue
+
+            _write(output_path, response.content)
+            manifest[url_name] = {
+                "file": str(output_path.relative_to(target_dir)),
+                "dependencies": {
+                    path: _hash_file(path) for path in {page.absolute_path, *loaded}
+                },
+            }
+            yield BuildResult(url_name, url, "built")
+    finally:
+        _building.reset(token)
+
+    # Drop the files of pages that are gone or are no longer prerendered
+    for url_name, entry in previous.items():
+        if url_name not in manifest:
+            _remove(target_dir / entry["file"])
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def _default_host() -> str:
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*":
+            return host.lstrip(".")
+    return "localhost"
+
+
+def _dynamic_reason(response: Any) -> str:
+    if response.status_code != 200:
+        return f"status {response.status_code}"
+
+    content_type = response.headers.get("Content-Type", "")
+    if not content_type.startswith("text/html"):
+        return f"content type {content_type}"
+
+    if response.cookies:
+        return "sets a cookie"
+
+    # The session middleware adds this when the page read the session, like
+    # looking up the current user
+    vary = {
+        header.strip().lower() for header in response.headers.get("Vary", "").split(",")
+    }
+    if "cookie" in vary or "*" in vary:
+        return "varies by cookie"
+
+    # A file would keep this nonce, while the Content-Security-Policy header
+    # it's served with gets a new one each request, blocking the page's scripts
+    if response.request.csp_nonce.encode() in response.content:
+        return "uses the CSP nonce"
+
+    return ""
+
+
+def _is_current(dependencies: dict[str, str]) -> bool:
+    for path, digest in dependencies.items():
+        try:
+            if _hash_file(path) != digest:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _hash_file(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _write(path: Path, content: bytes) -> None:
+    """Write the page and its gzip variant, leaving identical files alone."""
+    gzip_path = _gzip_path(path)
+    if path.exists() and gzip_path.exists() and path.read_bytes() == content:
+        return
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Replace, so a running server never reads a partial file
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+    gzip_tmp_path = path.with_name(f".{path.name}.gz.tmp")
+    with gzip.GzipFile(gzip_tmp_path, "wb", mtime=0) as f:
+        f.write(content)
+    os.replace(gzip_tmp_path, gzip_path)
+
+
+def _remove(path: Path) -> None:
+    path.unlink(missing_ok=True)
+    _gzip_path(path).unlink(missing_ok=True)
+
+
+def _gzip_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.gz")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 
 from plain.runtime import settings
 from plain.urls import URLPattern, reverse
@@ -106,6 +107,13 @@ class PagesRegistry:
             url_name = url_path_obj.name
             self._url_name_mappings[url_name] = relative_path
 
+    def iter_pages(self) -> Iterator[Page]:
+        """Iterate the routable pages, without the markdown companions."""
+        companion_md_paths = set(self._companions.values())
+        for relative_path in self._path_mappings:
+            if relative_path not in companion_md_paths:
+                yield self.get_page_from_path(relative_path)
+
     def get_page_from_name(self, url_name: str) -> Page:
         """Get a page by its URL name."""
         try:
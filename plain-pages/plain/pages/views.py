@@ -9,6 +9,7 @@ from plain.http import (
     RedirectResponse,
     Response,
 )
+from plain.http.response import ResponseHeaders
 from plain.runtime import settings
 from plain.templates.views import TemplateView
 from plain.utils.cache import patch_vary_headers
@@ -16,6 +17,7 @@ from plain.views import View
 
 from .exceptions import PageNotFoundError, RedirectPageError
 from .pages import Page
+from .prerender import get_prerendered_file, get_prerendered_path
 from .registry import pages_registry
 
 __all__ = ["PageView"]
@@ -55,10 +57,19 @@ class PageView(PageViewMixin, TemplateView):
         preferred = self.request.get_preferred_type(*types)
         return preferred in ("text/markdown", "text/plain")
 
+    def _html_response(self) -> Response:
+        """Serve the page's prerendered HTML, or render it if there is none."""
+        if get_prerendered_file(self.page):
+            view = PrerenderedPageView(request=self.request, url_kwargs=self.url_kwargs)
+            view.page = self.page
+            return view.get()
+
+        return super().get()
+
     def get(self) -> Response:
         """Check Accept header and serve markdown if requested."""
         if not settings.PAGES_SERVE_MARKDOWN:
-            return super().get()
+            return self._html_response()
 
         # Standalone markdown page -- markdown is preferred by default.
         # Type order matters: first type listed wins ties, so markdown
@@ -66,7 +77,7 @@ class PageView(PageViewMixin, TemplateView):
         if self.page.is_markdown():
             if self._prefers_markdown("text/markdown", "text/plain", "text/html"):
                 return self._markdown_response(self.page)
-            response = super().get()
+            response = self._html_response()
             patch_vary_headers(response, ["Accept"])
             return response
 
@@ -74,17 +85,17 @@ class PageView(PageViewMixin, TemplateView):
         # Type order matters: text/html first so HTML wins ties.
         url_name = self.page.get_url_name()
         if not url_name:
-            return super().get()
+            return self._html_response()
 
         companion = pages_registry.get_markdown_companion(url_name)
         if not companion:
-            return super().get()
+            return self._html_response()
 
         if self._prefers_markdown("text/html", "text/markdown", "text/plain"):
             return self._markdown_response(companion)
 
         # HTML response varies by Accept when a companion exists
-        response = super().get()
+        response = self._html_response()
         patch_vary_headers(response, ["Accept"])
         return response
 
@@ -121,6 +132,32 @@ class PageAssetView(PageViewMixin, AssetView):
         return self.page.absolute_path
 
 
+class PrerenderedPageView(PageViewMixin, AssetView):
+    """
+    Serve the HTML `plain pages build` wrote for a page the way assets are
+    served: the gzip variant when the client accepts it, and 304s from the
+    file's ETag and Last-Modified.
+    """
+
+    def get_url_path(self) -> str | None:
+        return f"{self.page.get_url_path()}index.html"
+
+    def get_asset_path(self, path: str) -> str:
+        return str(get_prerendered_path() / path)
+
+    def get_debug_asset_path(self, path: str) -> str:
+        return self.get_asset_path(path)
+
+    def update_headers(self, headers: ResponseHeaders, path: str) -> ResponseHeaders:
+        # Revalidate on every use, as the page could change with any deploy
+        headers.setdefault("Cache-Control", "no-cache")
+        headers = super().update_headers(headers, path)
+        del headers["Access-Control-Allow-Origin"]
+        if "Content-Type" in headers:
+            headers["Content-Type"] = "text/html; charset=utf-8"
+        return headers
+
+
 class PageMarkdownView(PageViewMixin, TemplateView):
     def get(self) -> Response:
         """Serve the markdown content without frontmatter."""
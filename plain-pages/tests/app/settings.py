@@ -1,6 +1,7 @@
 SECRET_KEY = "test"
 URLS_ROUTER = "app.urls.AppRouter"
 INSTALLED_PACKAGES = [
+    "plain.assets",
     "plain.templates",
     "plain.pages",
 ]
@@ -0,0 +1,149 @@
+import gzip
+import json
+
+import pytest
+from click.testing import CliRunner
+from plain.http import Response
+from plain.pages import cli, prerender
+from plain.pages.views import PageView
+from plain.test import Client, RequestFactory
+from plain.urls import get_resolver
+
+
+@pytest.fixture
+def prerendered(tmp_path, monkeypatch):
+    monkeypatch.setattr(prerender, "PLAIN_TEMP_PATH", tmp_path)
+    return tmp_path / "pages" / "prerendered"
+
+
+def _get_page(path: str, **headers: str):
+    """Call the view directly, as the test client closes streamed files."""
+    request = RequestFactory().get(path, headers=headers)
+    request.resolver_match = get_resolver().resolve(path)
+    return PageView(request=request).get()
+
+
+def _build(**kwargs) -> dict[str, str]:
+    return {result.url: result.status for result in prerender.build_pages(**kwargs)}
+
+
+def test_build_writes_html_and_gzip(prerendered):
+    results = _build()
+    assert results["/about"] == "built"
+    assert results["/"] == "built"
+    assert "/dynamic" not in results
+    assert results["/nonce"] == "skipped"
+
+    html = (prerendered / "about" / "index.html").read_bytes()
+    assert b"<h1>About</h1>" in html
+    assert (
+        gzip.decompress((prerendered / "about" / "index.html.gz").read_bytes()) == html
+    )
+    assert (prerendered / "index.html").exists()
+    assert not (prerendered / "dynamic").exists()
+
+
+def test_serves_prerendered_file(prerendered):
+    _build()
+    (prerendered / "about" / "index.html").write_text("<p>From the build</p>")
+
+    response = _get_page("/about")
+    assert response.status_code == 200
+    assert b"".join(response.streaming_content) == b"<p>From the build</p>"
+    assert response.headers["Content-Type"] == "text/html; charset=utf-8"
+    assert response.headers["Cache-Control"] == "no-cache"
+    assert "Access-Control-Allow-Origin" not in response.headers
+
+    response = Client().get(
+        "/about", headers={"If-None-Match": response.headers["ETag"]}
+    )
+    assert response.status_code == 304
+
+
+def test_serves_gzip_variant(prerendered):
+    _build()
+
+    response = _get_page("/about", **{"Accept-Encoding": "gzip"})
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert b"<h1>About</h1>" in gzip.decompress(b"".join(response.streaming_content))
+
+
+def test_missing_file_renders_dynamically(prerendered):
+    _build()
+    (prerendered / "about" / "index.html").unlink()
+
+    response = Client().get("/about")
+    assert response.status_code == 200
+    assert b"<h1>About</h1>" in response.content
+    assert "ETag" not in response.headers
+
+
+def test_markdown_negotiation_still_applies(prerendered):
+    _build()
+
+    response = Client().get("/", headers={"Accept": "text/markdown"})
+    assert response.headers["Content-Type"] == "text/plain; charset=utf-8"
+    assert b"# Welcome" in response.content
+
+
+def test_incremental_build_skips_unchanged_pages(prerendered):
+    _build()
+    manifest = json.loads((prerendered / "manifest.json").read_text())
+
+    # The layout templates a page rendered with are dependencies too
+    dependencies = manifest["index"]["dependencies"]
+    assert any(path.endswith("app/templates/page.html") for path in dependencies)
+
+    results = _build(incremental=True)
+    assert results["/"] == "unchanged"
+    assert results["/about"] == "unchanged"
+
+    source = next(path for path in dependencies if path.endswith("index.md"))
+    manifest["index"]["dependencies"][source] = "changed"
+    (prerendered / "manifest.json").write_text(json.dumps(manifest))
+
+    results = _build(incremental=True)
+    assert results["/"] == "built"
+    assert results["/about"] == "unchanged"
+
+
+def test_pages_that_depend_on_the_request_stay_dynamic(prerendered):
+    results = {r.url: r for r in prerender.build_pages()}
+    assert results["/nonce"].status == "skipped"
+    assert results["/nonce"].message == "uses the CSP nonce"
+    assert not (prerendered / "nonce").exists()
+
+    response = Response("<p>Hi</p>", headers={"Vary": "Accept-Encoding, Cookie"})
+    assert prerender._dynamic_reason(response) == "varies by cookie"
+
+
+def test_build_restores_a_missing_gzip_variant(prerendered):
+    _build()
+    (prerendered / "about" / "index.html.gz").unlink()
+
+    assert _build(incremental=True)["/about"] == "built"
+    assert (prerendered / "about" / "index.html.gz").exists()
+
+    (prerendered / "about" / "index.html.gz").unlink()
+    _build()
+    assert (prerendered / "about" / "index.html.gz").exists()
+
+
+def test_full_build_removes_pages_no_longer_prerendered(prerendered):
+    _build()
+    manifest = json.loads((prerendered / "manifest.json").read_text())
+    manifest["gone"] = {"file": "gone/index.html", "dependencies": {}}
+    (prerendered / "manifest.json").write_text(json.dumps(manifest))
+    (prerendered / "gone").mkdir()
+    (prerendered / "gone" / "index.html").write_text("old")
+
+    _build()
+    assert not (prerendered / "gone" / "index.html").exists()
+
+
+def test_build_command(prerendered):
+    result = CliRunner().invoke(cli.cli, ["build"])
+    assert result.exit_code == 0, result.output
+    assert "Built /about\n" in result.output
+    assert "Prerendered" in result.output
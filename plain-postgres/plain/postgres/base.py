@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any, Self
 if TYPE_CHECKING:
     from plain.postgres.meta import Meta
     from plain.postgres.options import Options
+    from plain.postgres.query import AutoPrefetchGroup
 
 import plain.runtime
 import psycopg
@@ -79,6 +80,10 @@ class ModelState:
     # message, and related-manager unsaved checks.
     adding = True
 
+    # The sibling instances this one was loaded with, when its QuerySet used
+    # auto_prefetch(). Read by the relation accessors on a cache miss.
+    auto_prefetch: AutoPrefetchGroup | None = None
+
     def __init__(self) -> None:
         self.fields_cache: dict[str, Any] = {}
 
@@ -242,6 +247,8 @@ class Model(metaclass=ModelBase):
         state = self.__dict__.copy()
         state["_state"] = copy.copy(state["_state"])
         state["_state"].fields_cache = state["_state"].fields_cache.copy()
+        # The sibling group is only meaningful in the process that loaded it.
+        state["_state"].auto_prefetch = None
         # memoryview cannot be pickled, so cast it to bytes and store
         # separately.
         _memoryview_attrs = []
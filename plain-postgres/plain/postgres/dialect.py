@@ -15,6 +15,7 @@ from functools import lru_cache, partial
 from typing import TYPE_CHECKING, Any
 
 import psycopg
+from plain.json import PlainJSONEncoder, get_json_codec
 from plain.postgres.constants import OnConflict
 from plain.postgres.utils import split_tzname_delta
 from plain.utils import timezone
@@ -99,11 +100,19 @@ PATTERN_OPS: dict[str, str] = {
 def get_json_dumps(
     encoder: type[json.JSONEncoder] | None,
 ) -> Callable[..., str]:
+    # No encoder and PlainJSONEncoder are what the JSON_CODEC setting
+    # reproduces; any other encoder class needs the stdlib.
     if encoder is None:
-        return json.dumps
+        return partial(_codec_dumps, strict=True)
+    if encoder is PlainJSONEncoder:
+        return _codec_dumps
     return partial(json.dumps, cls=encoder)
 
 
+def _codec_dumps(value: Any, *, strict: bool = False) -> str:
+    return get_json_codec().dumps(value, strict=strict)
+
+
 def quote_name(name: str) -> str:
     """
     Return a quoted version of the given table, index, or column name.
@@ -4,6 +4,7 @@ import json
 from collections.abc import Callable, Sequence
 from typing import TYPE_CHECKING, Any
 
+from plain.json import get_json_codec
 from plain.postgres import expressions, lookups
 from plain.postgres.constants import LOOKUP_SEP
 from plain.postgres.dialect import adapt_json_value
@@ -71,6 +72,8 @@ class JSONField(DefaultableField):
         if isinstance(expression, KeyTransform) and not isinstance(value, str):
             return value
         try:
+            if self.decoder is None:
+                return get_json_codec().loads(value)
             return json.loads(value, cls=self.decoder)
         except json.JSONDecodeError:
             return value
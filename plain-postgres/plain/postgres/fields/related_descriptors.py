@@ -126,20 +126,16 @@ class ForwardForeignKeyDescriptor:
         try:
             rel_obj = self.field.get_cached_value(instance)
         except KeyError:
-            # _get_raw_value loads the foreign key column on demand if it was
-            # deferred (.only()/.defer()), so we always see the real key here.
-            pk_value = self.field._get_raw_value(instance)
-            rel_obj = None
-            if pk_value is not None:
-                remote_model = self.field.remote_field.model
-                target_name = self.field.target_field.name
-                assert target_name is not None
-                # The database FK constraint guarantees the row exists, so build
-                # a partial related instance with only its primary key loaded --
-                # no query. Accessing any other field triggers the full-row
-                # deferred load.
-                rel_obj = remote_model.from_db([target_name], [pk_value])
-            self.field.set_cached_value(instance, rel_obj)
+            # Loaded with auto_prefetch(): fetch the relation for every sibling
+            # in one query and read this instance's share from its cache.
+            group = instance._state.auto_prefetch
+            if group is not None and group.fetch(
+                self, self.field.name, self.get_queryset(), self._is_resolved
+            ):
+                rel_obj = self.field.get_cached_value(instance)
+            else:
+                rel_obj = self._partial_related_object(instance)
+                self.field.set_cached_value(instance, rel_obj)
 
         # Checked on every access, including a cached None: a non-nullable
         # foreign key with no value must raise consistently, not just once.
@@ -149,6 +145,28 @@ class ForwardForeignKeyDescriptor:
             )
         return rel_obj
 
+    def _is_resolved(self, instance: Any) -> bool:
+        # A null foreign key resolves to None without a query, so it doesn't
+        # make a sibling worth batching. A deferred column isn't loaded here.
+        if self.is_cached(instance):
+            return True
+        name = self.field.name
+        return name in instance.__dict__ and instance.__dict__[name] is None
+
+    def _partial_related_object(self, instance: Any) -> Any | None:
+        # _get_raw_value loads the foreign key column on demand if it was
+        # deferred (.only()/.defer()), so we always see the real key here.
+        pk_value = self.field._get_raw_value(instance)
+        if pk_value is None:
+            return None
+        remote_model = self.field.remote_field.model
+        target_name = self.field.target_field.name
+        assert target_name is not None
+        # The database FK constraint guarantees the row exists, so build a
+        # partial related instance with only its primary key loaded -- no
+        # query. Accessing any other field triggers the full-row deferred load.
+        return remote_model.from_db([target_name], [pk_value])
+
     def __set__(self, instance: Any, value: Any) -> None:
         """
         Set the related object (or its raw key) through the forward relation.
@@ -84,11 +84,18 @@ class ReverseForeignKeyManager(BaseRelatedManager[T, QS]):
     allow_null: bool
 
     def __init__(
-        self, instance: Model, field: ForeignKeyField, related_model: type[Model]
+        self,
+        instance: Model,
+        field: ForeignKeyField,
+        related_model: type[Model],
+        accessor_name: str | None = None,
     ):
         assert field.name is not None, "Field must have a name"
         self.model = cast(type[T], related_model)
         self.instance = instance
+        # The ReverseForeignKey attribute this manager was reached through,
+        # which is what auto-prefetch has to traverse on the siblings.
+        self.accessor_name = accessor_name
         # ForeignKeyField is itself a descriptor type (it inherits the field
         # descriptor protocol), so ty reads this plain attribute as a
         # descriptor slot; storing the field object on it is fine.
@@ -133,13 +140,29 @@ class ReverseForeignKeyManager(BaseRelatedManager[T, QS]):
                 f"{self.instance.__class__.__name__!r} instance needs to have a "
                 f"primary key value before this relationship can be used."
             )
+        cache_name = self.field.remote_field.get_cache_name()
         try:
-            return self.instance._prefetched_objects_cache[
-                self.field.remote_field.get_cache_name()
-            ]
+            return self.instance._prefetched_objects_cache[cache_name]
         except (AttributeError, KeyError):
-            queryset = self.model.query
-            return cast(QS, self._apply_rel_filters(queryset))
+            pass
+
+        # Loaded with auto_prefetch(): fetch the relation for every sibling in
+        # one query, then serve this instance from its prefetch cache.
+        group = self.instance._state.auto_prefetch
+        if (
+            group is not None
+            and self.accessor_name is not None
+            and group.fetch(
+                self,
+                self.accessor_name,
+                self.model.query,
+                lambda obj: cache_name in getattr(obj, "_prefetched_objects_cache", {}),
+            )
+        ):
+            return self.instance._prefetched_objects_cache[cache_name]
+
+        queryset = self.model.query
+        return cast(QS, self._apply_rel_filters(queryset))
 
     def get_prefetch_queryset(
         self, instances: Iterable[Model], queryset: QuerySet | None = None
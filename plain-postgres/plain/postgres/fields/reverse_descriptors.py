@@ -174,6 +174,7 @@ class ReverseForeignKey(BaseReverseDescriptor[T, QS]):
             instance=instance,
             field=self._resolved_field,
             related_model=self._resolved_model,
+            accessor_name=self.name,
         )
 
 
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
 import importlib.metadata
+import itertools
 import re
+import sys
 import time
 import traceback
 import weakref
@@ -15,6 +18,8 @@ from opentelemetry.metrics import CallbackOptions, Observation
 from opentelemetry.semconv.metrics.db_metrics import DB_CLIENT_OPERATION_DURATION
 
 if TYPE_CHECKING:
+    from types import FrameType
+
     from opentelemetry.trace import Span
     from plain.postgres.connection import DatabaseConnection
     from plain.postgres.sources import PoolSource
@@ -218,6 +223,23 @@ def register_pool_observables(pool_source: PoolSource) -> None:
         )
 
 
+# Matches: "quoted" (PostgreSQL), unquoted.name — after the SQL keyword that
+# precedes the table name for each operation.
+_IDENTIFIER_PATTERN = r'("([^"]+)"|([\w.]+))'
+_TARGET_PATTERNS = {
+    operation: re.compile(rf"{keyword}\s+{_IDENTIFIER_PATTERN}", re.IGNORECASE)
+    for operation, keyword in (
+        ("SELECT", "FROM"),
+        ("DELETE", "FROM"),
+        ("INSERT", "INTO"),
+        ("UPDATE", "UPDATE"),
+    )
+}
+
+
+# Queries are parameterized, so an app runs a bounded set of distinct SQL
+# strings and nearly every call is a cache hit.
+@functools.lru_cache(maxsize=2048)
 def extract_operation_and_target(sql: str) -> tuple[str, str | None, str | None]:
     """Extract operation, table name, and collection from SQL.
 
@@ -228,25 +250,13 @@ def extract_operation_and_target(sql: str) -> tuple[str, str | None, str | None]
     # Strip leading parentheses (e.g. UNION queries: "(SELECT ... UNION ...)")
     operation = sql_upper.lstrip("(").split()[0] if sql_upper else "UNKNOWN"
 
-    # Pattern to match quoted and unquoted identifiers
-    # Matches: "quoted" (PostgreSQL), unquoted.name
-    identifier_pattern = r'("([^"]+)"|([\w.]+))'
-
-    # Map operations to the SQL keyword that precedes the table name.
-    keyword_by_operation = {
-        "SELECT": "FROM",
-        "DELETE": "FROM",
-        "INSERT": "INTO",
-        "UPDATE": "UPDATE",
-    }
-
     # Extract table/collection name based on operation
     collection_name = None
     summary = operation
 
-    keyword = keyword_by_operation.get(operation)
-    if keyword:
-        match = re.search(rf"{keyword}\s+{identifier_pattern}", sql, re.IGNORECASE)
+    pattern = _TARGET_PATTERNS.get(operation)
+    if pattern:
+        match = pattern.search(sql)
         if match:
             collection_name = _clean_identifier(match.group(1))
             summary = f"{operation} {collection_name}"
@@ -392,6 +402,28 @@ def db_span(
                 returned_rows_histogram.record(count, metric_attrs)
 
 
+# Stamped on auto-prefetch spans: how many per-instance queries the batched
+# load replaced. `plain request` sums it per trace.
+AUTO_PREFETCH_SAVED_QUERIES = "plain.postgres.auto_prefetch.saved_queries"
+
+
+@contextmanager
+def auto_prefetch_span(
+    model: type, relation: str, instance_count: int
+) -> Generator[None]:
+    """Wrap one auto-prefetch load in an INTERNAL span.
+
+    The prefetch query itself gets its regular db span as a child, so a trace
+    shows which relation access triggered it and what it stood in for.
+    """
+    with tracer.start_as_current_span(
+        f"auto_prefetch {model.__name__}.{relation}",
+        kind=SpanKind.INTERNAL,
+        attributes={AUTO_PREFETCH_SAVED_QUERIES: instance_count - 1},
+    ):
+        yield
+
+
 @contextmanager
 def suppress_db_tracing() -> Generator[None]:
     token = otel_context.attach(otel_context.set_value(_SUPPRESS_KEY, True))
@@ -401,9 +433,9 @@ def suppress_db_tracing() -> Generator[None]:
         otel_context.detach(token)
 
 
-def _is_internal_frame(frame: traceback.FrameSummary) -> bool:
-    """Return True if the frame is internal to plain.postgres or contextlib."""
-    filepath = frame.filename
+@functools.lru_cache(maxsize=1024)
+def _is_internal_file(filepath: str) -> bool:
+    """Return True if the file is internal to plain.postgres or contextlib."""
     if not filepath:
         return True
     if "/plain/postgres/" in filepath:
@@ -416,28 +448,34 @@ def _get_code_attributes() -> dict[str, Any]:
 
     Returns a dict of OpenTelemetry code attributes.
     """
-    stack = traceback.extract_stack()
-
-    # Find the first user code frame (outermost non-internal frame from the top of the call stack)
-    for frame in reversed(stack):
-        if _is_internal_frame(frame):
-            continue
-
-        attrs: dict[str, Any] = {
-            CODE_FILE_PATH: frame.filename,
-        }
-        if frame.lineno:
-            attrs[CODE_LINE_NUMBER] = frame.lineno
-        if frame.name:
-            attrs[CODE_FUNCTION_NAME] = frame.name
-        if frame.colno:
-            attrs[CODE_COLUMN_NUMBER] = frame.colno
-
-        # Add full stack trace only in DEBUG mode (expensive)
-        if settings.DEBUG:
-            filtered_stack = [f for f in stack if not _is_internal_frame(f)]
-            attrs[CODE_STACKTRACE] = "".join(traceback.format_list(filtered_stack))
-
-        return attrs
+    # Walk out from the caller and stop at the first user code frame, rather
+    # than extracting (and reading source lines for) the whole stack.
+    frame: FrameType | None = sys._getframe(1)
+    while frame is not None and _is_internal_file(frame.f_code.co_filename):
+        frame = frame.f_back
+    if frame is None:
+        return {}
+
+    code = frame.f_code
+    attrs: dict[str, Any] = {
+        CODE_FILE_PATH: code.co_filename,
+        CODE_FUNCTION_NAME: code.co_name,
+    }
+    if lineno := frame.f_lineno:
+        attrs[CODE_LINE_NUMBER] = lineno
+    # co_positions() has one entry per 2-byte instruction.
+    if frame.f_lasti >= 0:
+        position = next(itertools.islice(code.co_positions(), frame.f_lasti // 2, None))
+        if colno := position[2]:
+            attrs[CODE_COLUMN_NUMBER] = colno
+
+    # Add full stack trace only in DEBUG mode (expensive)
+    if settings.DEBUG:
+        filtered_stack = [
+            f
+            for f in traceback.extract_stack(frame)
+            if not _is_internal_file(f.filename)
+        ]
+        attrs[CODE_STACKTRACE] = "".join(traceback.format_list(filtered_stack))
 
-    return {}
+    return attrs
@@ -4,9 +4,12 @@ The main QuerySet implementation. This provides the public API for the ORM.
 
 from __future__ import annotations
 
+import array
 import copy
+import json
 import operator
 import warnings
+import weakref
 from collections.abc import Callable, Iterator, Sequence
 from functools import cached_property
 from itertools import islice
@@ -29,9 +32,12 @@ from plain.postgres.exceptions import (
 from plain.postgres.expressions import Case, F, ResolvableExpression, Value, When
 from plain.postgres.fields import (
     Field,
+    FloatField,
+    IntegerField,
     PrimaryKeyField,
 )
 from plain.postgres.functions import Cast
+from plain.postgres.otel import auto_prefetch_span
 from plain.postgres.query_utils import Q
 from plain.postgres.sql import (
     AND,
@@ -78,6 +84,23 @@ class ModelIterable(BaseIterable):
     """Iterable that yields a model instance for each row."""
 
     def __iter__(self) -> Iterator[Model]:
+        instances = self._instances()
+        # A streamed result holds the connection until it is exhausted, so
+        # nothing can query for its siblings mid-iteration -- only fetchall()
+        # results are grouped for auto-prefetch.
+        if not self.queryset._auto_prefetch or self.chunked_fetch:
+            return instances
+        return self._grouped(instances)
+
+    def _grouped(self, instances: Iterator[Model]) -> Iterator[Model]:
+        # Every sibling has to exist before the first one is handed out, or
+        # the first relation access would only see itself.
+        group = list(instances)
+        if group:
+            AutoPrefetchGroup(group)
+        yield from group
+
+    def _instances(self) -> Iterator[Model]:
         queryset = self.queryset
         compiler = queryset.sql_query.get_compiler()
         # Execute the query. This will also fill compiler.select, klass_info,
@@ -250,6 +273,19 @@ class FlatValuesListIterable(BaseIterable):
             yield row[0]
 
 
+def _column_typecode(expression: Any) -> str | None:
+    """The array.array typecode a selected column packs into, if numeric."""
+    field = getattr(expression, "_output_field_or_none", None)
+    if field is not None and getattr(field, "remote_field", None) is not None:
+        # A foreign key column holds its target's key.
+        field = field.target_field
+    if isinstance(field, IntegerField | PrimaryKeyField):
+        return "q"
+    if isinstance(field, FloatField):
+        return "d"
+    return None
+
+
 class QuerySet[T: "Model"]:
     """
     Represent a lazy database lookup for a set of objects.
@@ -280,6 +316,7 @@ class QuerySet[T: "Model"]:
     _sticky_filter: bool
     _prefetch_related_lookups: tuple[Any, ...]
     _prefetch_done: bool
+    _auto_prefetch: bool
     _known_related_objects: dict[Any, dict[Any, Any]]
     _iterable_class: type[BaseIterable]
     _fields: tuple[str, ...] | None
@@ -299,6 +336,7 @@ class QuerySet[T: "Model"]:
         instance._sticky_filter = False
         instance._prefetch_related_lookups = ()
         instance._prefetch_done = False
+        instance._auto_prefetch = False
         instance._known_related_objects = {}
         instance._iterable_class = ModelIterable
         instance._fields = None
@@ -533,6 +571,69 @@ class QuerySet[T: "Model"]:
         # PostgreSQL always supports server-side cursors for chunked fetches
         return self._iterator(use_chunked_fetch=True, chunk_size=chunk_size)
 
+    def to_columns(self, *fields: str, numpy: bool = False) -> dict[str, Any]:
+        """
+        Evaluate the query column-wise: a dict of column name to that
+        column's values, in row order.
+
+        Integer and float columns are packed into an array.array ("q" and
+        "d"); anything else -- or a numeric column that turns out to hold a
+        NULL -- is a list. Rows are streamed from a server-side cursor and
+        appended straight into the columns, so no per-row tuple or dict is
+        kept around. With numpy=True, the packed columns become NumPy arrays
+        sharing the same memory.
+
+        Takes field names like values(), or reads the fields of a values() /
+        values_list() QuerySet when called with none.
+        """
+        if numpy:
+            try:
+                import numpy as np  # ty: ignore[unresolved-import]
+            except ImportError as exc:
+                raise ImportError(
+                    "numpy is required for to_columns(numpy=True). "
+                    "Install it with: pip install numpy"
+                ) from exc
+
+        qs = self.values(*fields) if fields or self._fields is None else self
+        query = qs.sql_query
+        names = [*query.values_select, *query.annotation_select]
+        compiler = query.get_compiler()
+        rows = compiler.results_iter(chunked_fetch=True)
+
+        # compiler.select is filled in by the query setup above.
+        assert compiler.select is not None
+        columns: list[Any] = []
+        for expression, _sql, _alias in compiler.select[: len(names)]:
+            typecode = _column_typecode(expression)
+            columns.append(array.array(typecode) if typecode else [])
+
+        appends = [column.append for column in columns]
+        for row in rows:
+            for i, value in enumerate(row):
+                try:
+                    appends[i](value)
+                except TypeError:
+                    # A NULL in a packed column: it can't be represented
+                    # there, so the column falls back to a list.
+                    columns[i] = columns[i].tolist()
+                    appends[i] = columns[i].append
+                    appends[i](value)
+
+        if numpy:
+            columns = [
+                np.frombuffer(column, dtype=column.typecode)
+                if isinstance(column, array.array)
+                else column
+                for column in columns
+            ]
+
+        by_name = dict(zip(names, columns))
+        if qs._fields:
+            # values_list() fields keep the order they were asked for.
+            return {name: by_name[name] for name in qs._fields} | by_name
+        return by_name
+
     def aggregate(self, *args: Any, **kwargs: Any) -> dict[str, Any]:
         """
         Return a dictionary containing the calculations (aggregation)
@@ -571,6 +672,51 @@ class QuerySet[T: "Model"]:
 
         return self.sql_query.get_count()
 
+    def estimated_count(self, *, threshold: int = 1000) -> int:
+        """
+        Return an approximate number of records without scanning the table.
+
+        An unfiltered queryset reads the table's `pg_class.reltuples`; anything
+        else uses the planner's row estimate from `EXPLAIN`. Both are only as
+        fresh as the last ANALYZE, so an estimate below `threshold` is replaced
+        by an exact `count()`, which is cheap at that size. A table that has
+        never been analyzed has no statistics to estimate from, and is counted
+        exactly too.
+        """
+        if self._result_cache is not None:
+            return len(self._result_cache)
+
+        query = self.sql_query
+        if query.is_empty():
+            return 0
+
+        with get_connection().cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                [self.model.model_options.db_table],
+            )
+            row = cursor.fetchone()
+
+        # -1 until the table has been vacuumed or analyzed once. The planner
+        # would fall back to a default guess, which can be far off either way.
+        if row is None or row[0] < 0:
+            return self.count()
+
+        if (
+            not query.has_filters()
+            and not query.is_sliced
+            and not query.distinct
+            and query.group_by is None
+        ):
+            estimate = row[0]
+        else:
+            plan = json.loads(self.explain(format="json"))
+            estimate = int(plan[0]["Plan"]["Plan Rows"])
+
+        if estimate < threshold:
+            return self.count()
+        return estimate
+
     def get(self, *args: Any, **kwargs: Any) -> T:
         """
         Perform the query and return a single object matching the given
@@ -1217,6 +1363,29 @@ class QuerySet[T: "Model"]:
             clone._prefetch_related_lookups = clone._prefetch_related_lookups + lookups
         return clone
 
+    def auto_prefetch(self, enabled: bool = True) -> Self:
+        """
+        Return a new QuerySet instance whose results load relations for
+        each other.
+
+        Instances loaded together remember their siblings. The first lazy
+        access of a forward or reverse foreign key on any of them fetches
+        that relation for every sibling in one query, the way
+        prefetch_related() would have. Related objects loaded this way
+        auto-prefetch too, so nested relations batch as well. Results
+        streamed with iterator() are not grouped.
+
+        Call auto_prefetch(False) to turn it back off.
+        """
+        if self._fields is not None:
+            raise TypeError(
+                "Cannot call auto_prefetch() after .values() or .values_list()"
+            )
+
+        clone = self._chain()
+        clone._auto_prefetch = enabled
+        return clone
+
     def annotate(self, *args: Any, **kwargs: Any) -> Self:
         """
         Return a query set in which the returned objects have been annotated
@@ -1428,6 +1597,7 @@ class QuerySet[T: "Model"]:
         )
         c._sticky_filter = self._sticky_filter
         c._prefetch_related_lookups = self._prefetch_related_lookups[:]
+        c._auto_prefetch = self._auto_prefetch
         c._known_related_objects = self._known_related_objects
         c._iterable_class = self._iterable_class
         c._fields = self._fields
@@ -2066,6 +2236,58 @@ def prefetch_one_level(
     return all_related_objects, additional_lookups
 
 
+class AutoPrefetchGroup:
+    """
+    Model instances loaded together by an auto_prefetch() QuerySet.
+
+    Each member points at the group from its model state. When a relation
+    accessor misses its cache, fetch() loads that relation for every member
+    that still needs it with prefetch_one_level(), so N lazy accesses cost one
+    query. Members are held weakly: the group never keeps a streamed chunk
+    alive on its own.
+    """
+
+    def __init__(self, instances: list[Model]):
+        self._refs = [weakref.ref(obj) for obj in instances]
+        for obj in instances:
+            obj._state.auto_prefetch = self
+
+    def fetch(
+        self,
+        prefetcher: Any,
+        through_attr: str,
+        queryset: QuerySet[Any],
+        is_fetched: Callable[[Model], bool],
+    ) -> bool:
+        """
+        Load `through_attr` for every member that hasn't loaded it yet.
+
+        Return False without querying when the accessing instance is the
+        only one pending -- the caller's regular single-instance path is at
+        least as cheap.
+        """
+        pending = [
+            obj
+            for ref in self._refs
+            if (obj := ref()) is not None and not is_fetched(obj)
+        ]
+        if len(pending) < 2:
+            return False
+
+        for obj in pending:
+            if not hasattr(obj, "_prefetched_objects_cache"):
+                obj._prefetched_objects_cache = {}
+
+        with auto_prefetch_span(type(pending[0]), through_attr, len(pending)):
+            prefetch_one_level(
+                pending,
+                prefetcher,
+                Prefetch(through_attr, queryset=queryset.auto_prefetch()),
+                0,
+            )
+        return True
+
+
 class RelatedPopulator:
     """
     RelatedPopulator is used for select_related() object instantiation.
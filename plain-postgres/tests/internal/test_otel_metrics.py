@@ -7,6 +7,7 @@ response row recording, and server.* span attributes.
 from __future__ import annotations
 
 import concurrent.futures
+import sys
 import threading
 from typing import Any, ClassVar
 
@@ -110,6 +111,29 @@ class TestQuerySpanAttributes:
         assert not stack_walks
 
 
+class TestPerQueryOverhead:
+    def test_code_attributes_point_at_the_calling_line(self) -> None:
+        attrs = postgres_otel._get_code_attributes()
+        line = sys._getframe().f_lineno - 1
+
+        assert attrs["code.file.path"] == __file__
+        assert attrs["code.line.number"] == line
+        assert attrs["code.function.name"] == (
+            "test_code_attributes_point_at_the_calling_line"
+        )
+
+    def test_sql_summary_is_memoized(self) -> None:
+        sql = 'SELECT "examples_widget"."id" FROM "examples_widget" LIMIT 1'
+        postgres_otel.extract_operation_and_target.cache_clear()
+
+        first = postgres_otel.extract_operation_and_target(sql)
+        second = postgres_otel.extract_operation_and_target(sql)
+
+        assert first == ("SELECT", "SELECT examples_widget", "examples_widget")
+        assert second is first
+        assert postgres_otel.extract_operation_and_target.cache_info().hits == 1
+
+
 class TestReturnedRowsMetric:
     @pytest.mark.usefixtures("db")
     def test_select_records_returned_rows(
@@ -0,0 +1,115 @@
+import pickle
+
+from app.examples.models.delete import ChildCascade, ChildSetNull, DeleteParent
+
+
+def _family():
+    parent1 = DeleteParent.query.create(name="Parent 1")
+    parent2 = DeleteParent.query.create(name="Parent 2")
+    DeleteParent.query.create(name="Parent 3")  # no children
+    ChildCascade.query.create(parent=parent1)
+    ChildCascade.query.create(parent=parent1)
+    ChildCascade.query.create(parent=parent2)
+
+
+def test_forward_fk_loads_for_all_siblings_in_one_query(db, capture_queries):
+    _family()
+
+    with capture_queries() as queries:
+        names = [
+            child.parent.name
+            for child in ChildCascade.query.auto_prefetch().order_by("id")
+        ]
+
+    # One query for the children, one batched query for every parent.
+    assert len(queries) == 2
+    assert names == ["Parent 1", "Parent 1", "Parent 2"]
+
+
+def test_forward_fk_without_auto_prefetch_is_unchanged(db, capture_queries):
+    _family()
+
+    with capture_queries() as queries:
+        names = [child.parent.name for child in ChildCascade.query.order_by("id")]
+
+    # A deferred full-row load per child.
+    assert len(queries) == 4
+    assert names == ["Parent 1", "Parent 1", "Parent 2"]
+
+
+def test_nullable_forward_fk(db, capture_queries):
+    parent = DeleteParent.query.create(name="Parent")
+    ChildSetNull.query.create(parent=parent)
+    # The field is required, so skip validation to store a null parent
+    ChildSetNull.query.bulk_create([ChildSetNull(parent=None)])
+
+    with capture_queries() as queries:
+        parents = [child.parent for child in ChildSetNull.query.auto_prefetch()]
+
+    # The null row needs no query, so the one remaining parent takes the
+    # regular lazy path and no batched query runs.
+    assert len(queries) == 1
+    assert sorted(p.name if p else "" for p in parents) == ["", "Parent"]
+
+
+def test_reverse_fk_loads_for_all_siblings_in_one_query(db, capture_queries):
+    _family()
+
+    with capture_queries() as queries:
+        counts = {
+            parent.name: len(parent.childcascade_set.query)
+            for parent in DeleteParent.query.auto_prefetch()
+        }
+
+    assert len(queries) == 2
+    assert counts == {"Parent 1": 2, "Parent 2": 1, "Parent 3": 0}
+
+
+def test_related_objects_inherit_auto_prefetch(db, capture_queries):
+    _family()
+
+    with capture_queries() as queries:
+        for child in ChildCascade.query.auto_prefetch():
+            # Parents were loaded together, so their own reverse relation is
+            # batched as well.
+            list(child.parent.childcascade_set.query)
+
+    assert len(queries) == 3
+
+
+def test_single_instance_keeps_the_lazy_path(db, capture_queries):
+    _family()
+    child = ChildCascade.query.auto_prefetch().order_by("id").first()
+    assert child is not None
+
+    with capture_queries() as queries:
+        assert child.parent.id is not None
+
+    # A lone instance still gets the query-free partial parent.
+    assert len(queries) == 0
+
+
+def test_iterator_results_are_not_grouped(db):
+    # A streamed result holds the connection, so siblings can't be fetched
+    # mid-iteration.
+    _family()
+
+    for child in ChildCascade.query.auto_prefetch().iterator():
+        assert child._state.auto_prefetch is None
+
+
+def test_auto_prefetch_can_be_turned_off(db):
+    qs = ChildCascade.query.auto_prefetch()
+    assert qs._auto_prefetch
+    assert not qs.auto_prefetch(False)._auto_prefetch
+    assert qs.filter(id__gt=0)._auto_prefetch
+
+
+def test_pickled_instance_drops_its_group(db):
+    _family()
+    child = next(iter(ChildCascade.query.auto_prefetch()))
+    assert child._state.auto_prefetch is not None
+
+    restored = pickle.loads(pickle.dumps(child))
+
+    assert restored._state.auto_prefetch is None
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from app.examples.models.delete import DeleteParent
+from app.examples.models.querysets import DefaultQuerySetModel
+from plain.paginator import Paginator
+from plain.postgres.db import get_connection
+
+
+def _analyze() -> None:
+    with get_connection().cursor() as cursor:
+        cursor.execute(f"ANALYZE {DeleteParent.model_options.db_table}")
+
+
+def test_small_estimates_fall_back_to_an_exact_count(db):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(5)])
+    _analyze()
+
+    assert DeleteParent.query.estimated_count() == 5
+    assert DeleteParent.query.filter(name="p1").estimated_count() == 1
+
+
+def test_unfiltered_reads_table_statistics(db, capture_queries):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(50)])
+    _analyze()
+
+    with capture_queries() as queries:
+        estimate = DeleteParent.query.estimated_count(threshold=0)
+
+    assert estimate == 50
+    assert len(queries) == 1
+    assert "pg_class" in queries[0]["sql"]
+
+
+def test_filtered_uses_the_planner_estimate(db, capture_queries):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(50)])
+    _analyze()
+
+    with capture_queries() as queries:
+        estimate = DeleteParent.query.filter(name__startswith="p").estimated_count(
+            threshold=0
+        )
+
+    assert estimate > 0
+    assert len(queries) == 2
+    assert "pg_class" in queries[0]["sql"]
+    assert queries[1]["sql"].startswith("EXPLAIN")
+
+
+def test_unanalyzed_table_is_counted_exactly(db, capture_queries):
+    # ANALYZE isn't rolled back with the test, so use a table no test
+    # analyzes.
+    DefaultQuerySetModel.query.bulk_create(
+        [DefaultQuerySetModel(name=f"p{i}") for i in range(5)]
+    )
+
+    with capture_queries() as queries:
+        estimate = DefaultQuerySetModel.query.filter(
+            name__startswith="p"
+        ).estimated_count(threshold=0)
+
+    # No statistics yet, so no planner guess either.
+    assert estimate == 5
+    assert not any(q["sql"].startswith("EXPLAIN") for q in queries)
+
+
+def test_empty_queryset(db, capture_queries):
+    with capture_queries() as queries:
+        assert DeleteParent.query.none().estimated_count() == 0
+
+    assert len(queries) == 0
+
+
+def test_paginator_opts_in(db, capture_queries):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(50)])
+    _analyze()
+
+    paginator = Paginator(DeleteParent.query.order_by("id"), 10, estimate_count=True)
+    with capture_queries() as queries:
+        assert paginator.num_pages == 5
+
+    # Below the threshold the estimate is confirmed with an exact count.
+    assert "pg_class" in queries[0]["sql"]
+
+
+def test_paginator_pages_past_the_estimate(db):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(1000)])
+    _analyze()
+    # Rows added since the last ANALYZE aren't in the estimate.
+    DeleteParent.query.bulk_create([DeleteParent(name=f"q{i}") for i in range(50)])
+
+    paginator = Paginator(DeleteParent.query.order_by("id"), 10, estimate_count=True)
+    assert paginator.num_pages == 100
+
+    page = paginator.page(100)
+    assert page.has_next()
+    assert page.next_page_number() == 101
+    assert page.end_index() == 1000
+    # The next page exists, so the estimate grows to include it.
+    assert paginator.num_pages == 101
+
+    page = paginator.get_page(105)
+    assert page.number == 105
+    assert len(page) == 10
+    assert not page.has_next()
+    assert (page.start_index(), page.end_index()) == (1041, 1050)
+    assert paginator.count == 1050
+    assert paginator.num_pages == 105
+
+    page = paginator.page(107)
+    assert len(page) == 0
+    assert (page.start_index(), page.end_index()) == (0, 0)
+    assert paginator.num_pages == 105
+
+
+def test_paginator_pages_short_of_the_estimate(db):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(1050)])
+    _analyze()
+    # Rows deleted since the last ANALYZE are still in the estimate.
+    ids = list(DeleteParent.query.order_by("id").values_list("id", flat=True))
+    DeleteParent.query.filter(id__in=ids[989:]).delete()
+
+    paginator = Paginator(DeleteParent.query.order_by("id"), 10, estimate_count=True)
+    assert paginator.num_pages == 105
+
+    assert len(paginator.page(105)) == 0
+    assert paginator.num_pages == 104
+
+    page = paginator.page(99)
+    assert len(page) == 9
+    assert not page.has_next()
+    assert page.end_index() == paginator.count == 989
+    assert paginator.num_pages == 99
+
+
+def test_paginator_has_next_from_the_rows(db):
+    DeleteParent.query.bulk_create([DeleteParent(name=f"p{i}") for i in range(20)])
+
+    paginator = Paginator(DeleteParent.query.order_by("id"), 10, estimate_count=True)
+
+    assert paginator.page(1).has_next()
+    last = paginator.page(2)
+    assert len(last) == 10
+    assert not last.has_next()
+    assert len(paginator.page(3)) == 0
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import uuid
+
+import pytest
+from app.examples.models.forms import FormsExample
+from app.examples.models.relationships import Tag, Widget, WidgetTag
+from plain.paginator import KeysetPaginator
+
+BASE = datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC)
+
+
+def _make(n: int) -> None:
+    for i in range(n):
+        FormsExample.query.create(
+            name=f"row{i}",
+            count=i,
+            ratio=0.5,
+            amount=decimal.Decimal("1.50"),
+            event_date=datetime.date(2026, 1, 1),
+            event_time=datetime.time(12, 0),
+            # Three rows share each timestamp, so the id breaks the tie.
+            event_datetime=BASE + datetime.timedelta(microseconds=i // 3),
+            duration=datetime.timedelta(minutes=5),
+            external_id=uuid.uuid4(),
+        )
+
+
+def _counts(page) -> list[int]:
+    return [obj.count for obj in page]
+
+
+def test_walks_forward_through_every_row(db):
+    _make(10)
+    paginator = KeysetPaginator(FormsExample.query.all(), 3, ("-event_datetime", "-id"))
+
+    page = paginator.page(None)
+    seen = _counts(page)
+    while page.has_next():
+        page = paginator.page(page.next_cursor)
+        seen += _counts(page)
+
+    assert seen == list(range(9, -1, -1))
+    assert not page.has_next()
+    assert page.next_cursor is None
+
+
+def test_walks_back(db):
+    _make(10)
+    paginator = KeysetPaginator(FormsExample.query.all(), 4, ("event_datetime", "id"))
+
+    second = paginator.page(paginator.page(None).next_cursor)
+    assert _counts(second) == [4, 5, 6, 7]
+
+    first = paginator.page(second.previous_cursor)
+    assert _counts(first) == [0, 1, 2, 3]
+    assert first.has_next()
+    assert not first.has_previous()
+    assert first.previous_cursor is None
+
+
+def test_respects_filters(db):
+    _make(10)
+    paginator = KeysetPaginator(
+        FormsExample.query.filter(count__gte=5), 3, ("count", "id")
+    )
+
+    page = paginator.page(paginator.page(None).next_cursor)
+
+    assert _counts(page) == [8, 9]
+    assert not page.has_next()
+
+
+def test_does_not_count(db, capture_queries):
+    _make(5)
+    paginator = KeysetPaginator(FormsExample.query.all(), 2, ("id",))
+    cursor = paginator.page(None).next_cursor
+    assert cursor
+
+    with capture_queries() as queries:
+        page = paginator.page(cursor)
+        assert len(page) == 2
+
+    assert len(queries) == 1
+    # FormsExample has a "count" column, so look for the function call
+    assert "COUNT(" not in queries[0]["sql"].upper()
+    assert "OFFSET" not in queries[0]["sql"].upper()
+
+
+def test_invalid_cursor_falls_back_to_first_page(db):
+    _make(3)
+    paginator = KeysetPaginator(FormsExample.query.all(), 2, ("id",))
+
+    assert _counts(paginator.get_page("not-a-cursor")) == [0, 1]
+
+
+def test_keys_on_the_column_of_a_relation(db):
+    tags = [Tag.query.create(name=f"tag{i}") for i in range(3)]
+    widget = Widget.query.create(name="w", size="s")
+    for tag in tags:
+        WidgetTag.query.create(widget=widget, tag=tag)
+    paginator = KeysetPaginator(WidgetTag.query.all(), 2, ("-tag", "id"))
+
+    first = paginator.page(None)
+    second = paginator.page(first.next_cursor)
+
+    assert [obj.tag for obj in [*first, *second]] == tags[::-1]
+
+
+def test_rejects_keys_that_are_not_columns():
+    with pytest.raises(ValueError, match="'tag__name'"):
+        KeysetPaginator(WidgetTag.query.all(), 2, ("tag__name", "id"))
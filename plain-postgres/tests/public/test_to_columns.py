@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import datetime
+import decimal
+import uuid
+from array import array
+
+from app.examples.models.delete import ChildSetNull, DeleteParent
+from app.examples.models.forms import FormsExample
+from plain.postgres.aggregates import Count, Sum
+
+
+def _make(name: str, count: int, ratio: float, status: str = "draft") -> None:
+    FormsExample.query.create(
+        name=name,
+        status=status,
+        count=count,
+        ratio=ratio,
+        amount=decimal.Decimal("1.50"),
+        event_date=datetime.date(2026, 1, 1),
+        event_time=datetime.time(12, 0),
+        event_datetime=datetime.datetime(2026, 1, 1, tzinfo=datetime.UTC),
+        duration=datetime.timedelta(minutes=5),
+        external_id=uuid.uuid4(),
+    )
+
+
+def test_numeric_columns_are_packed(db):
+    _make("a", 1, 0.5)
+    _make("b", 2, 1.5)
+
+    columns = FormsExample.query.order_by("id").to_columns("count", "ratio", "name")
+
+    assert list(columns) == ["count", "ratio", "name"]
+    assert columns["count"] == array("q", [1, 2])
+    assert columns["ratio"] == array("d", [0.5, 1.5])
+    assert columns["name"] == ["a", "b"]
+
+
+def test_matches_values_list(db):
+    for i in range(20):
+        _make(f"row{i}", i, i / 2)
+
+    qs = FormsExample.query.order_by("id")
+    columns = qs.to_columns("id", "count", "amount")
+    rows = list(qs.values_list("id", "count", "amount"))
+
+    assert list(zip(*columns.values())) == rows
+
+
+def test_reads_fields_from_values_list(db):
+    _make("a", 1, 0.5)
+
+    columns = FormsExample.query.values_list("ratio", "name").to_columns()
+
+    assert list(columns) == ["ratio", "name"]
+    assert columns["name"] == ["a"]
+
+
+def test_aggregates(db):
+    _make("a", 1, 0.5, status="draft")
+    _make("b", 2, 1.5, status="draft")
+    _make("c", 4, 2.5, status="published")
+
+    columns = (
+        FormsExample.query.values("status")
+        .annotate(rows=Count("id"), total=Sum("count"))
+        .order_by("status")
+        .to_columns()
+    )
+
+    assert columns["status"] == ["draft", "published"]
+    assert columns["rows"] == array("q", [2, 1])
+    assert columns["total"] == array("q", [3, 4])
+
+
+def test_null_falls_back_to_a_list(db):
+    parent = DeleteParent.query.create(name="Parent")
+    ChildSetNull.query.create(parent=parent)
+    # The field is required, so skip validation to store a null parent
+    ChildSetNull.query.bulk_create([ChildSetNull(parent=None)])
+
+    columns = ChildSetNull.query.order_by("id").to_columns("parent")
+
+    assert columns["parent"] == [parent.id, None]
+
+
+def test_empty(db):
+    assert FormsExample.query.none().to_columns("count") == {"count": array("q")}
@@ -36,6 +36,11 @@ def pytest_configure(config: Any) -> None:
     else:
         load_dotenv_files()
 
+    # Keep compiled templates from piling up in the project's .plain
+    # directory on every run. It has to be in place before setup(), which
+    # builds the template environment, and is ignored without plain.templates.
+    os.environ.setdefault("PLAIN_TEMPLATES_JINJA_BYTECODE_CACHE", "false")
+
     # Run Plain setup before anything else
     setup()
 
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import sys
+from pathlib import PurePosixPath
+
+import click
+from jinja2 import TemplateSyntaxError
+from plain.cli import register_cli
+
+from .jinja import environment
+
+
+@register_cli("templates")
+@click.group()
+def cli() -> None:
+    """Template management"""
+
+
+@cli.command(name="compile")
+def compile_cmd() -> None:
+    """Compile every template into the bytecode cache."""
+    if environment.bytecode_cache is None:
+        click.secho(
+            "The Jinja environment has no bytecode cache, only checking syntax",
+            fg="yellow",
+        )
+
+    compiled = 0
+    errors = 0
+
+    for name in environment.list_templates():
+        if any(part.startswith(".") for part in PurePosixPath(name).parts):
+            continue
+
+        try:
+            environment.get_template(name)
+        except (TemplateSyntaxError, UnicodeDecodeError) as e:
+            click.secho(f"{name}: {e}", fg="red", err=True)
+            errors += 1
+        else:
+            compiled += 1
+
+    click.secho(f"Compiled {compiled} templates", fg="green")
+
+    if errors:
+        click.secho(f"{errors} templates failed to compile", fg="red", err=True)
+        sys.exit(1)
@@ -1,3 +1,5 @@
+from collections.abc import Generator, Iterator
+
 import jinja2
 from opentelemetry import trace
 from opentelemetry.semconv.attributes.code_attributes import (
@@ -5,6 +7,7 @@ from opentelemetry.semconv.attributes.code_attributes import (
 )
 
 from .jinja import environment
+from .profiling import collecting, new_profile
 
 tracer = trace.get_tracer("plain.templates")
 
@@ -35,6 +38,55 @@ class Template:
                 "template.filename": self.filename,
                 "template.engine": "jinja2",
             },
-        ):
-            result = self._jinja_template.render(context)
+        ) as span:
+            profile = new_profile()
+            with collecting(profile):
+                result = self._jinja_template.render(context)
+            if profile is not None:
+                profile.add_to_span(span)
             return result
+
+    def stream(self, context: dict, buffer_size: int = 8192) -> Generator[str]:
+        """Render the template in chunks of about `buffer_size` characters.
+
+        The first chunk stops as soon as the template's `</head>` is
+        rendered, so a page's head can go out before its body is.
+        """
+        span = tracer.start_span(
+            f"render {self.filename}",
+            kind=trace.SpanKind.INTERNAL,
+            attributes={
+                CODE_FUNCTION_NAME: f"{self.__class__.__module__}.{self.__class__.__qualname__}.stream",
+                "template.filename": self.filename,
+                "template.engine": "jinja2",
+            },
+        )
+        pieces = self._jinja_template.generate(context)
+        profile = new_profile()
+        until_head = True
+        try:
+            while True:
+                # The span is current only while a chunk renders — the
+                # caller's code runs between chunks.
+                with trace.use_span(span), collecting(profile):
+                    chunk = _next_chunk(pieces, buffer_size, until_head)
+                if not chunk:
+                    return
+                until_head = until_head and "</head>" not in chunk
+                yield chunk
+        finally:
+            pieces.close()
+            if profile is not None:
+                profile.add_to_span(span)
+            span.end()
+
+
+def _next_chunk(pieces: Iterator[str], buffer_size: int, until_head: bool) -> str:
+    buffer: list[str] = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= buffer_size or (until_head and "</head>" in piece):
+            break
+    return "".join(buffer)
@@ -1,2 +1,9 @@
 # Dotted path or callable returning a Jinja2 Environment used to render templates.
 TEMPLATES_JINJA_ENVIRONMENT: str = "plain.templates.jinja.DefaultEnvironment"
+
+# Keep compiled templates in .plain/templates so new processes skip compiling them.
+TEMPLATES_JINJA_BYTECODE_CACHE: bool = True
+
+# Time every template, block, macro and element a render uses, and add the
+# totals to the render's span (see `plain request` and the toolbar).
+TEMPLATES_PROFILE: bool = False
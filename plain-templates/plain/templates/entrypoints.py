@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from .cli import compile_cmd
+
+
+def run_compile() -> None:
+    # Standalone mode prevents it from exit()ing
+    compile_cmd([], standalone_mode=False)
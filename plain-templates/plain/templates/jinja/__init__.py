@@ -3,12 +3,18 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from jinja2.ext import Extension
 from plain.packages import packages_registry
 from plain.runtime import settings
 from plain.utils.functional import LazyObject
 from plain.utils.module_loading import import_string
 
-from .environments import DefaultEnvironment, get_template_dirs
+from .environments import (
+    DefaultEnvironment,
+    get_template_dirs,
+    record_template_load,
+    recording_template_loads,
+)
 
 
 class JinjaEnvironment(LazyObject):
@@ -20,6 +26,12 @@ class JinjaEnvironment(LazyObject):
         else:
             env = environment_setting()
 
+        if settings.TEMPLATES_PROFILE:
+            from ..profiling import ProfiledTemplate
+
+            # Before anything loads, since a template keeps the class it loaded with
+            env.template_class = ProfiledTemplate
+
         # We have to set _wrapped before we trigger the autoloading of "register" commands
         self._wrapped = env
 
@@ -30,7 +42,7 @@ class JinjaEnvironment(LazyObject):
 environment = JinjaEnvironment()
 
 
-def register_template_extension(extension_class: type) -> type:
+def register_template_extension[T: type[Extension]](extension_class: T) -> T:
     environment.add_extension(extension_class)
     return extension_class
 
@@ -72,6 +84,8 @@ __all__ = [
     "DefaultEnvironment",
     "environment",
     "get_template_dirs",
+    "record_template_load",
+    "recording_template_loads",
     "register_template_extension",
     "register_template_filter",
     "register_template_global",
@@ -1,11 +1,17 @@
 import functools
+import os
+from collections.abc import Generator, Iterable, MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, StrictUndefined
+import jinja2
+from jinja2 import Environment, StrictUndefined, Template
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
 from jinja2.loaders import FileSystemLoader
 from plain.packages import packages_registry
-from plain.runtime import settings
+from plain.runtime import PLAIN_TEMP_PATH, settings
 
 from .filters import default_filters
 from .globals import default_globals
@@ -47,6 +53,107 @@ def _get_app_template_dirs() -> tuple[Path, ...]:
     return tuple(template_dirs)
 
 
+# The files loaded while `recording_template_loads()` is active in this
+# context, or None when nothing is recording.
+_template_loads: ContextVar[set[str] | None] = ContextVar(
+    "plain.templates.loads", default=None
+)
+
+
+@contextmanager
+def recording_template_loads() -> Generator[set[str]]:
+    """
+    Collect the file of every template loaded inside the block, including
+    the ones the environment already had cached.
+
+    Only loads in the current context are recorded, so renders on other
+    threads and requests are unaffected.
+    """
+    loaded: set[str] = set()
+    token = _template_loads.set(loaded)
+    try:
+        yield loaded
+    finally:
+        _template_loads.reset(token)
+
+
+def record_template_load(template: Template) -> None:
+    """Report a template to `recording_template_loads()`, for code that
+    keeps loaded templates in a cache of its own."""
+    if (loaded := _template_loads.get()) is not None and template.filename:
+        loaded.add(template.filename)
+
+
+def get_bytecode_cache_path() -> Path:
+    return PLAIN_TEMP_PATH / "templates" / "bytecode"
+
+
+def _compile_options(environment: Environment) -> str:
+    """The environment settings that change the code Jinja generates."""
+
+    def describe(value: Any) -> str:
+        if callable(value):
+            return f"{value.__module__}.{value.__qualname__}"
+        return repr(value)
+
+    return ",".join(
+        describe(value)
+        for value in (
+            environment.block_start_string,
+            environment.block_end_string,
+            environment.variable_start_string,
+            environment.variable_end_string,
+            environment.comment_start_string,
+            environment.comment_end_string,
+            environment.line_statement_prefix,
+            environment.line_comment_prefix,
+            environment.trim_blocks,
+            environment.lstrip_blocks,
+            environment.newline_sequence,
+            environment.keep_trailing_newline,
+            environment.optimized,
+            environment.is_async,
+            environment.autoescape,
+            environment.finalize,
+        )
+    )
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    Compiled templates on disk, shared by every process of the app.
+
+    Jinja discards an entry whose source checksum doesn't match the template,
+    and the cache key includes the Jinja version, the environment's extensions
+    and its compile options (autoescape, finalize, delimiters and so on), so
+    an upgrade or a settings change never loads code compiled for something
+    else.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        super().__init__(str(directory), pattern="%s.cache")
+
+    def get_bucket(
+        self, environment: Environment, name: str, filename: str | None, source: str
+    ) -> Bucket:
+        extensions = ",".join(sorted(environment.extensions))
+        options = _compile_options(environment)
+        key = self.get_cache_key(
+            f"{jinja2.__version__}|{extensions}|{options}|{name}", filename
+        )
+        bucket = Bucket(environment, key, self.get_source_checksum(source))
+        self.load_bytecode(bucket)
+        return bucket
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            super().dump_bytecode(bucket)
+        except OSError:
+            # A read-only filesystem still renders, it just compiles in memory.
+            pass
+
+
 class DefaultEnvironment(Environment):
     def __init__(self):
         super().__init__(
@@ -56,8 +163,31 @@ class DefaultEnvironment(Environment):
             undefined=StrictUndefined,
             finalize=_finalize_callable_error,
             extensions=["jinja2.ext.loopcontrols", "jinja2.ext.debug"],
+            bytecode_cache=TemplateBytecodeCache(get_bytecode_cache_path())
+            if settings.TEMPLATES_JINJA_BYTECODE_CACHE
+            else None,
         )
 
         # Load the top-level defaults
         self.globals.update(default_globals)  # ty: ignore[no-matching-overload]
         self.filters.update(default_filters)
+
+    def get_template(
+        self,
+        name: str | Template,
+        parent: str | None = None,
+        globals: MutableMapping[str, Any] | None = None,
+    ) -> Template:
+        template = super().get_template(name, parent, globals)
+        record_template_load(template)
+        return template
+
+    def select_template(
+        self,
+        names: Iterable[str | Template],
+        parent: str | None = None,
+        globals: MutableMapping[str, Any] | None = None,
+    ) -> Template:
+        template = super().select_template(names, parent, globals)
+        record_template_load(template)
+        return template
@@ -0,0 +1,199 @@
+"""
+Per-template render timings, collected when `TEMPLATES_PROFILE` is on.
+
+A top-level `Template.render()` collects one `TemplateProfile` for
+everything rendered inside it — includes, the templates it extends, blocks,
+macros, inclusion tags and elements — and adds it to its span as a single
+`template.profile` event, rather than starting a span for each of them.
+
+Timings are wall clock while a template's render function runs, so a
+template that calls a slow function or query is charged for it.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+import jinja2
+from jinja2.runtime import Context, Macro
+from opentelemetry.trace import Span
+from plain.runtime import settings
+
+__all__ = ["ProfiledTemplate", "TemplateProfile", "TemplateTiming", "current_profile"]
+
+PROFILE_EVENT = "template.profile"
+
+_current_profile: ContextVar[TemplateProfile | None] = ContextVar(
+    "plain.templates.profile", default=None
+)
+
+
+@dataclass
+class TemplateTiming:
+    """Calls and time for one template, block or macro."""
+
+    kind: str  # "template", "block" or "macro"
+    name: str
+    calls: int = 0
+    total_ns: int = 0
+    self_ns: int = 0
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_ns / 1_000_000
+
+    @property
+    def self_ms(self) -> float:
+        """Time not spent in the templates, blocks or macros this one called."""
+        return self.self_ns / 1_000_000
+
+
+class TemplateProfile:
+    def __init__(self) -> None:
+        self._timings: dict[tuple[str, str], TemplateTiming] = {}
+        # Time spent in nested renders, one slot per render running
+        self._children_ns = [0]
+
+    def timing(self, kind: str, name: str) -> TemplateTiming:
+        key = (kind, name)
+        if (timing := self._timings.get(key)) is None:
+            timing = self._timings[key] = TemplateTiming(kind, name)
+        return timing
+
+    def timings(self) -> list[TemplateTiming]:
+        """Every timing, the most self time first."""
+        return sorted(self._timings.values(), key=lambda t: t.self_ns, reverse=True)
+
+    def measure(
+        self, timing: TemplateTiming, func: Callable[..., Any], *args: Any
+    ) -> Any:
+        """Call `func`, charging its time to `timing`."""
+        self._children_ns.append(0)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            timing.total_ns += elapsed
+            timing.self_ns += elapsed - self._children_ns.pop()
+            self._children_ns[-1] += elapsed
+
+    def add_to_span(self, span: Span) -> None:
+        timings = self.timings()
+        if not timings:
+            return
+
+        span.add_event(
+            PROFILE_EVENT,
+            attributes={
+                "template.profile.kind": [t.kind for t in timings],
+                "template.profile.name": [t.name for t in timings],
+                "template.profile.calls": [t.calls for t in timings],
+                "template.profile.total_ms": [round(t.total_ms, 3) for t in timings],
+                "template.profile.self_ms": [round(t.self_ms, 3) for t in timings],
+            },
+        )
+
+
+def current_profile() -> TemplateProfile | None:
+    """The profile of the render in progress, if it is being profiled."""
+    return _current_profile.get()
+
+
+def new_profile() -> TemplateProfile | None:
+    """
+    A profile for a top-level render to collect, or None when profiling is off
+    or an outer render is already collecting one.
+    """
+    if not settings.TEMPLATES_PROFILE or _current_profile.get() is not None:
+        return None
+    return TemplateProfile()
+
+
+@contextmanager
+def collecting(profile: TemplateProfile | None) -> Generator[None]:
+    """Make `profile` the one renders inside the block record to."""
+    if profile is None:
+        yield
+        return
+
+    token = _current_profile.set(profile)
+    try:
+        yield
+    finally:
+        _current_profile.reset(token)
+
+
+def _profiled_render(
+    kind: str, name: str, render_func: Callable[[Context], Iterator[str]]
+) -> Callable[[Context], Iterator[str]]:
+    def render(context: Context) -> Iterator[str]:
+        profile = _current_profile.get()
+        if profile is None:
+            yield from render_func(context)
+            return
+
+        timing = profile.timing(kind, name)
+        timing.calls += 1
+        events = render_func(context)
+        # Render functions are generators the caller pulls from, so the time
+        # is what each step of the generator takes.
+        try:
+            while True:
+                try:
+                    event = profile.measure(timing, next, events)
+                except StopIteration:
+                    return
+                yield event
+        finally:
+            events.close()
+
+    return render
+
+
+class _ProfiledMacro(Macro):
+    template_name: str = ""
+
+    def _invoke(self, arguments: list[Any], autoescape: bool) -> str:
+        profile = _current_profile.get()
+        if profile is None or self.name == "caller":
+            return super()._invoke(arguments, autoescape)
+
+        timing = profile.timing("macro", f"{self.template_name}:{self.name}")
+        timing.calls += 1
+        return profile.measure(timing, super()._invoke, arguments, autoescape)
+
+
+class ProfiledTemplate(jinja2.Template):
+    """
+    The environment's `template_class` while profiling: the template's render
+    function, its blocks and its macros record to the current profile.
+    """
+
+    @classmethod
+    def _from_namespace(
+        cls,
+        environment: jinja2.Environment,
+        namespace: Any,
+        globals: Any,
+    ) -> jinja2.Template:
+        # The compiled module looks `Macro` up in this namespace when a
+        # macro is defined, so macros are swapped in here too
+        namespace["Macro"] = type(
+            "Macro", (_ProfiledMacro,), {"template_name": namespace["name"]}
+        )
+
+        template = super()._from_namespace(environment, namespace, globals)
+        template.root_render_func = _profiled_render(
+            "template", template.name or "", template.root_render_func
+        )
+        for block, func in template.blocks.items():
+            template.blocks[block] = _profiled_render(
+                "block", f"{template.name}:{block}", func
+            )
+        return template
@@ -1,18 +1,23 @@
 from __future__ import annotations
 
+import asyncio
+import contextvars
 from abc import ABC, abstractmethod
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Generator
+from concurrent.futures import Executor, Future
 from functools import cached_property
-from typing import Any, NoReturn
+from typing import Any, NoReturn, cast
 
 from plain.exceptions import ImproperlyConfigured
 from plain.forms import BaseForm, Form
 from plain.http import (
+    AsyncStreamingResponse,
     NotFoundError404,
     RedirectResponse,
     Response,
     status_for_exception,
 )
+from plain.internal.handlers.pools import get_request_executor
 from plain.logs import get_framework_logger
 from plain.paginator import Page, Paginator
 from plain.runtime import settings
@@ -23,8 +28,10 @@ from .core import Template, TemplateFileMissing
 logger = get_framework_logger("plain.templates")
 
 try:
+    from plain.postgres import get_connection
     from plain.postgres.exceptions import ObjectDoesNotExist
 except ImportError:
+    get_connection = None  # ty: ignore[invalid-assignment]
     ObjectDoesNotExist = None  # ty: ignore[invalid-assignment]
 
 
@@ -35,6 +42,9 @@ class TemplateView(View):
 
     template_name: str | None = None
 
+    # Send the page in chunks as it renders instead of all at once.
+    stream_template: bool = False
+
     def get_template_context(self) -> dict[str, Any]:
         return {
             "request": self.request,
@@ -86,9 +96,40 @@ class TemplateView(View):
         way to render a template at a non-200 status. The name is
         reserved: a template variable called `status_code` has to come
         from `get_template_context()` instead.
+
+        With `stream_template`, the `<head>` is rendered here and the rest
+        of the page as the client receives it (see `stream_response()`).
+        """
+        template = self.get_template()
+        context = {**self.get_template_context(), **context}
+
+        if self.stream_template:
+            return self.stream_response(template.stream(context), status_code)
+
+        return Response(template.render(context), status_code=status_code)
+
+    def stream_response(
+        self, chunks: Generator[str], status_code: int
+    ) -> AsyncStreamingResponse:
+        """Wrap rendered chunks in a response that renders on a thread.
+
+        The first chunk is rendered before returning, so an error in the
+        head still gets an error page. Later chunks render in a copy of the
+        request's context (its DB connection included), one hop per chunk
+        onto the executor the view ran on. An error after the headers are
+        sent cuts the response off without its terminator, so the client
+        sees it as incomplete.
         """
-        return Response(
-            self.get_template().render({**self.get_template_context(), **context}),
+        if get_connection is not None:
+            # Create the request's connection wrapper (it connects lazily)
+            # so the template's queries share it, and the connection
+            # middleware returns it once the stream is drained.
+            get_connection()
+
+        ctx = contextvars.copy_context()
+        first = next(chunks, None)
+        return AsyncStreamingResponse(
+            _render_rest(first, chunks, ctx, get_request_executor()),
             status_code=status_code,
         )
 
@@ -128,6 +169,41 @@ class TemplateView(View):
             return Response(status_code=status)
 
 
+async def _render_rest(
+    first: str | None,
+    chunks: Generator[str],
+    ctx: contextvars.Context,
+    executor: Executor | None,
+) -> AsyncIterator[str]:
+    in_flight: Future[str | None] | None = None
+    try:
+        chunk = first
+        while chunk is not None:
+            yield chunk
+            if executor is None:
+                # Not served by a worker (a test client), so there is no
+                # event loop to keep free.
+                chunk = ctx.run(_render_next, chunks)
+            else:
+                in_flight = cast(
+                    "Future[str | None]",
+                    executor.submit(ctx.run, _render_next, chunks),
+                )
+                chunk = await asyncio.wrap_future(in_flight)
+    finally:
+        if in_flight is not None and not in_flight.done():
+            # Cancelled mid-chunk: a thread is still in the generator, so
+            # close it once that chunk returns.
+            in_flight.add_done_callback(lambda _: ctx.run(chunks.close))
+        else:
+            ctx.run(chunks.close)
+
+
+def _render_next(chunks: Generator[str]) -> str | None:
+    """Render the next chunk; None at the end."""
+    return next(chunks, None)
+
+
 class NotFoundView(TemplateView):
     """Catchall view: raises 404 before method dispatch, renders `404.html`."""
 
@@ -316,11 +392,14 @@ class ListView(TemplateView, ABC):
     A paginated queryset needs a deterministic order (an `order_by()` or a
     model default) — unordered results can shift between pages. An empty
     `Page` is falsy, so check `page_obj is not none` to test whether
-    pagination is on.
+    pagination is on. Set `estimate_count` on a very large table to size
+    the pages from the queryset's `estimated_count()` instead of a full
+    `COUNT(*)`.
     """
 
     context_object_name = ""
     page_size: int | None = None
+    estimate_count = False
 
     @cached_property
     def objects(self) -> Any:
@@ -337,9 +416,9 @@ class ListView(TemplateView, ABC):
     def page_obj(self) -> Page | None:
         if (page_size := self.get_page_size()) is None:
             return None
-        return Paginator(self.objects, page_size).get_page(
-            self.request.query_params.get("page", 1)
-        )
+        return Paginator(
+            self.objects, page_size, estimate_count=self.estimate_count
+        ).get_page(self.request.query_params.get("page", 1))
 
     def get_template_context(self) -> dict[str, Any]:
         """Insert the list of objects (or the current page of it) into the context dict."""
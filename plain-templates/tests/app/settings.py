@@ -3,3 +3,4 @@ URLS_ROUTER = "app.urls.AppRouter"
 INSTALLED_PACKAGES = [
     "plain.templates",
 ]
+TEMPLATES_JINJA_BYTECODE_CACHE = False
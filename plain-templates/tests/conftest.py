@@ -47,3 +47,12 @@ def list_client():
     """Client routed to the list views in `list_routers.py`."""
     with swap_router("list_routers.ListRouter") as client:
         yield client
+
+
+@pytest.fixture
+def stream_client():
+    """Client routed to the streaming template views in `stream_routers.py`."""
+    with swap_router(
+        "stream_routers.StreamRouter", debug=False, raise_request_exception=False
+    ) as client:
+        yield client
@@ -0,0 +1,86 @@
+import pytest
+from click.testing import CliRunner
+from jinja2 import FileSystemLoader
+from plain.runtime import settings
+from plain.templates import cli
+from plain.templates.jinja import environments
+from plain.templates.jinja.environments import DefaultEnvironment
+
+
+@pytest.fixture
+def make_environment(tmp_path, monkeypatch):
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "hello.html").write_text("Hello {{ name }}")
+
+    monkeypatch.setattr(settings, "TEMPLATES_JINJA_BYTECODE_CACHE", True)
+    monkeypatch.setattr(
+        environments, "get_bytecode_cache_path", lambda: tmp_path / "bytecode"
+    )
+
+    def make():
+        env = DefaultEnvironment()
+        env.loader = FileSystemLoader(templates)
+        return env
+
+    return make
+
+
+def _count_compiles(env, monkeypatch) -> list[str | None]:
+    compiled: list[str | None] = []
+    original = env.compile
+
+    def compile(source, name=None, filename=None, *args, **kwargs):
+        compiled.append(name)
+        return original(source, name, filename, *args, **kwargs)
+
+    monkeypatch.setattr(env, "compile", compile)
+    return compiled
+
+
+def test_new_environment_loads_compiled_templates(
+    make_environment, tmp_path, monkeypatch
+):
+    first = make_environment()
+    assert first.get_template("hello.html").render(name="a") == "Hello a"
+    assert len(list((tmp_path / "bytecode").iterdir())) == 1
+
+    second = make_environment()
+    compiled = _count_compiles(second, monkeypatch)
+    assert second.get_template("hello.html").render(name="b") == "Hello b"
+    assert compiled == []
+
+
+def test_changed_source_is_recompiled(make_environment, tmp_path, monkeypatch):
+    make_environment().get_template("hello.html")
+    (tmp_path / "templates" / "hello.html").write_text("Bye {{ name }}")
+
+    env = make_environment()
+    compiled = _count_compiles(env, monkeypatch)
+    assert env.get_template("hello.html").render(name="b") == "Bye b"
+    assert compiled == ["hello.html"]
+
+
+def test_compile_options_are_part_of_the_key(make_environment, tmp_path):
+    escaped = make_environment()
+    assert escaped.get_template("hello.html").render(name="<b>") == "Hello &lt;b&gt;"
+
+    raw = make_environment()
+    raw.autoescape = False
+    assert raw.get_template("hello.html").render(name="<b>") == "Hello <b>"
+    assert len(list((tmp_path / "bytecode").iterdir())) == 2
+
+
+def test_compile_command(make_environment, tmp_path, monkeypatch):
+    env = make_environment()
+    monkeypatch.setattr(cli, "environment", env)
+
+    result = CliRunner().invoke(cli.cli, ["compile"])
+    assert result.exit_code == 0, result.output
+    assert "Compiled 1 templates" in result.output
+    assert len(list((tmp_path / "bytecode").iterdir())) == 1
+
+    (tmp_path / "templates" / "broken.html").write_text("{% if %}")
+    result = CliRunner().invoke(cli.cli, ["compile"])
+    assert result.exit_code == 1
+    assert "broken.html" in result.output
@@ -0,0 +1,23 @@
+from plain.templates import Template
+from plain.templates.jinja import recording_template_loads
+
+
+def test_records_cached_templates_and_includes():
+    Template("profile/page.html").render({"rows": [1]})
+
+    with recording_template_loads() as loaded:
+        Template("profile/page.html").render({"rows": [1]})
+
+    assert sorted(path.rsplit("/templates/", 1)[1] for path in loaded) == [
+        "profile/base.html",
+        "profile/page.html",
+        "profile/row.html",
+    ]
+
+
+def test_nothing_is_recorded_outside_the_block():
+    with recording_template_loads() as loaded:
+        pass
+
+    Template("profile/page.html").render({"rows": [1]})
+    assert loaded == set()
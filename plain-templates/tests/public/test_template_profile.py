@@ -0,0 +1,89 @@
+import pytest
+from jinja2.utils import LRUCache
+from plain.runtime import settings
+from plain.templates import Template
+from plain.templates.jinja import environment
+from plain.templates.profiling import ProfiledTemplate, current_profile
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    monkeypatch.setattr(settings, "TEMPLATES_PROFILE", True)
+    monkeypatch.setattr(environment, "template_class", ProfiledTemplate)
+    # Templates keep the class they were loaded with
+    monkeypatch.setattr(environment, "cache", LRUCache(100))
+
+
+def _profile_event(otel_spans):
+    (span,) = [
+        s
+        for s in otel_spans.get_finished_spans()
+        if s.name == "render profile/page.html"
+    ]
+    (event,) = [e for e in span.events if e.name == "template.profile"]
+    attributes = event.attributes
+    return {
+        (kind, name): (calls, total_ms, self_ms)
+        for kind, name, calls, total_ms, self_ms in zip(
+            attributes["template.profile.kind"],
+            attributes["template.profile.name"],
+            attributes["template.profile.calls"],
+            attributes["template.profile.total_ms"],
+            attributes["template.profile.self_ms"],
+            strict=True,
+        )
+    }
+
+
+def test_profile_counts_includes_blocks_and_macros(profiling, otel_spans):
+    html = Template("profile/page.html").render({"rows": [1, 2, 3]})
+    assert html.count("<span>") == 3
+
+    timings = _profile_event(otel_spans)
+    calls = {key: value[0] for key, value in timings.items()}
+    assert calls == {
+        ("template", "profile/page.html"): 1,
+        ("template", "profile/base.html"): 1,
+        ("block", "profile/page.html:content"): 1,
+        ("template", "profile/row.html"): 3,
+        ("macro", "profile/page.html:badge"): 3,
+    }
+
+    # The page's own time excludes the base template it extends
+    page_total = timings[("template", "profile/page.html")][1]
+    base_total = timings[("template", "profile/base.html")][1]
+    assert page_total >= base_total
+    page_self = timings[("template", "profile/page.html")][2]
+    assert page_self <= page_total - base_total + 0.01  # rounded to the µs
+
+
+def test_nested_renders_share_the_outer_profile(profiling, otel_spans):
+    profiles = []
+
+    def badge(value):
+        profiles.append(current_profile())
+        return Template("profile/base.html").render({})
+
+    Template("profile/row.html").render({"row": 1, "badge": badge})
+    assert profiles[0] is not None
+    assert current_profile() is None
+
+    # Only the outermost render reports, and the nested one is in it
+    (span,) = [s for s in otel_spans.get_finished_spans() if s.events]
+    assert span.name == "render profile/row.html"
+    assert "profile/base.html" in span.events[0].attributes["template.profile.name"]
+
+
+def test_profiling_off_adds_no_event(otel_spans):
+    Template("profile/page.html").render({"rows": [1]})
+    (span,) = otel_spans.get_finished_spans()
+    assert not span.events
+
+
+def test_streamed_render_is_profiled(profiling, otel_spans):
+    chunks = list(Template("profile/page.html").stream({"rows": [1, 2]}, 16))
+    assert len(chunks) > 1
+    assert current_profile() is None
+
+    timings = _profile_event(otel_spans)
+    assert timings[("template", "profile/row.html")][0] == 2
@@ -0,0 +1,94 @@
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from plain.http import AsyncStreamingResponse
+from plain.templates import Template
+from plain.templates.views import _render_rest
+from plain.test import RequestFactory
+from stream_routers import BodyErrorView, rows
+
+
+def test_stream_flushes_the_head_first():
+    template = Template("page.html")
+    context = {"title": "Report", "rows": rows}
+
+    chunks = list(template.stream(context, buffer_size=1024))
+
+    assert "</head>" in chunks[0]
+    assert "row" not in chunks[0]
+    assert all(len(chunk) >= 1024 for chunk in chunks[1:-1])
+    assert "".join(chunks) == template.render(context)
+
+
+def test_streamed_view(stream_client):
+    response = stream_client.get("/page")
+    assert response.status_code == 200
+    assert response.content.decode() == Template("page.html").render(
+        {"title": "Report", "rows": rows}
+    )
+
+
+def test_error_in_the_head_is_an_error_response(stream_client):
+    response = stream_client.get("/head-error")
+    assert response.status_code == 500
+
+
+def test_error_after_the_head_ends_the_stream():
+    view = BodyErrorView(request=RequestFactory().get("/body-error"))
+    response = view.get()
+    assert isinstance(response, AsyncStreamingResponse)
+
+    chunks = []
+
+    async def collect():
+        try:
+            async for chunk in response:
+                chunks.append(chunk)
+        finally:
+            await response.aclose()
+
+    with pytest.raises(RuntimeError, match="row failed"):
+        asyncio.run(collect())
+    assert b"</head>" in chunks[0]
+    assert b"row 500" in b"".join(chunks)
+
+
+def test_cancelled_mid_chunk_closes_the_template_once_the_chunk_returns():
+    started = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+
+    def render():
+        try:
+            yield "head"
+            started.set()
+            release.wait(5)
+            yield "body"
+        finally:
+            closed.set()
+
+    chunks = render()
+    first = next(chunks)
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def cancel_mid_chunk():
+        stream = _render_rest(first, chunks, contextvars.copy_context(), executor)
+        assert await anext(stream) == "head"
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.to_thread(started.wait, 5)
+        pending.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await pending
+
+    try:
+        asyncio.run(cancel_mid_chunk())
+        # The thread is still rendering, so the close waits for it.
+        assert not closed.is_set()
+        release.set()
+        assert closed.wait(5)
+    finally:
+        release.set()
+        executor.shutdown(wait=True)
@@ -0,0 +1,47 @@
+"""Views and routers for test_template_streaming.py."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from plain.templates.views import TemplateView
+from plain.urls import Router, path
+
+
+def rows(count: int = 500, fail_at: int | None = None):
+    for i in range(count):
+        if i == fail_at:
+            raise RuntimeError("row failed")
+        yield f"row {i}"
+
+
+class PageView(TemplateView):
+    template_name = "page.html"
+    stream_template = True
+
+    def get_template_context(self) -> dict[str, Any]:
+        return {**super().get_template_context(), "title": "Report", "rows": rows}
+
+
+class HeadErrorView(PageView):
+    def get_template_context(self) -> dict[str, Any]:
+        context = super().get_template_context()
+        del context["title"]
+        return context
+
+
+class BodyErrorView(PageView):
+    def get_template_context(self) -> dict[str, Any]:
+        return {
+            **super().get_template_context(),
+            "rows": lambda: rows(count=2000, fail_at=1500),
+        }
+
+
+class StreamRouter(Router):
+    namespace = ""
+    urls = (
+        path("page", PageView),
+        path("head-error", HeadErrorView),
+        path("body-error", BodyErrorView),
+    )
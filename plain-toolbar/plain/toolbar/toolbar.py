@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Any
 from jinja2.runtime import Context
 from plain.runtime import settings
 from plain.templates import Template
+from plain.templates.profiling import TemplateProfile, current_profile
 from plain.utils.safestring import SafeString, mark_safe
 
 from .registry import register_toolbar_item, registry
@@ -110,3 +111,23 @@ class _ExceptionToolbarItem(ToolbarItem):
 class _RequestToolbarItem(ToolbarItem):
     name = "Request"
     panel_template_name = "toolbar/request.html"
+
+
+@register_toolbar_item
+class _TemplatesToolbarItem(ToolbarItem):
+    name = "Templates"
+    panel_template_name = "toolbar/templates.html"
+
+    def __init__(self, context: Context) -> None:
+        super().__init__(context)
+        # The page's render is still going, so this covers what rendered
+        # before the toolbar did.
+        self.profile: TemplateProfile | None = current_profile()
+
+    def is_enabled(self) -> bool:
+        return self.profile is not None
+
+    def get_template_context(self) -> dict[str, Any]:
+        ctx = super().get_template_context()
+        ctx["timings"] = self.profile.timings() if self.profile else []
+        return ctx
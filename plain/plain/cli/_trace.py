@@ -44,6 +44,20 @@ from opentelemetry.semconv.attributes.url_attributes import URL_PATH, URL_QUERY
 # back to the response the CLI reports for that hop.
 _REQUEST_ID_ATTRIBUTE = "plain.request.id"
 
+# plain.postgres stamps this on the span around each auto-prefetch load: the
+# number of per-instance queries that one batched query replaced.
+_AUTO_PREFETCH_SAVED_QUERIES_ATTRIBUTE = "plain.postgres.auto_prefetch.saved_queries"
+
+# plain.templates adds this event to a top-level render span when
+# TEMPLATES_PROFILE is on: parallel lists with one item per template, block
+# or macro the render used.
+_TEMPLATE_PROFILE_EVENT = "template.profile"
+
+# plain.cache puts these on the span around each `{% cache %}` fragment
+# lookup: the fragment's name and whether the cache had it.
+_CACHE_FRAGMENT_ATTRIBUTE = "plain.cache.fragment"
+_CACHE_HIT_ATTRIBUTE = "plain.cache.hit"
+
 if TYPE_CHECKING:
     from collections.abc import Generator, Mapping, Sequence
 
@@ -99,6 +113,28 @@ class QueryEntry(TypedDict):
     sources: list[str]
 
 
+class TemplateEntry(TypedDict):
+    """One template, block or macro and the time renders spent in it.
+
+    `self_duration_ms` leaves out the templates, blocks and macros it called,
+    so the entries add up to the render time rather than overlapping.
+    """
+
+    kind: str
+    name: str
+    count: int
+    total_duration_ms: float
+    self_duration_ms: float
+
+
+class FragmentEntry(TypedDict):
+    """One cached template fragment and how its lookups went."""
+
+    name: str
+    hits: int
+    misses: int
+
+
 class TraceException(TypedDict):
     """An exception recorded on a span."""
 
@@ -182,8 +218,11 @@ class TraceAnalysis(TypedDict):
     span_count: int
     query_count: int
     transaction_count: int
+    auto_prefetch_saved_queries: int
     exceptions: list[TraceException]
     queries: list[QueryEntry]
+    templates: list[TemplateEntry]
+    fragments: list[FragmentEntry]
 
 
 class CapturedTrace(TypedDict):
@@ -257,11 +296,27 @@ def _analyze_trace(spans: list[ReadableSpan]) -> CapturedTrace:
     """Analyze one trace's spans, which arrive ordered by start time."""
     queries_by_sql: dict[str, QueryEntry] = {}
     transaction_count = 0
+    auto_prefetch_saved_queries = 0
     exceptions: list[TraceException] = []
+    templates_by_name: dict[tuple[str, str], TemplateEntry] = {}
+    fragments_by_name: dict[str, FragmentEntry] = {}
 
     for span in spans:
         attributes = span.attributes or {}
 
+        if (fragment := attributes.get(_CACHE_FRAGMENT_ATTRIBUTE)) is not None:
+            fragment_entry = fragments_by_name.setdefault(
+                str(fragment), {"name": str(fragment), "hits": 0, "misses": 0}
+            )
+            if attributes.get(_CACHE_HIT_ATTRIBUTE):
+                fragment_entry["hits"] += 1
+            else:
+                fragment_entry["misses"] += 1
+
+        saved = attributes.get(_AUTO_PREFETCH_SAVED_QUERIES_ATTRIBUTE)
+        if isinstance(saved, int):
+            auto_prefetch_saved_queries += saved
+
         if (raw_sql := attributes.get(DB_QUERY_TEXT)) is not None:
             sql = str(raw_sql)
             if _db_operation(attributes, sql) in _TRANSACTION_OPERATIONS:
@@ -279,7 +334,9 @@ def _analyze_trace(spans: list[ReadableSpan]) -> CapturedTrace:
                     entry["sources"].append(location)
 
         for event in span.events:
-            if event.name == "exception":
+            if event.name == _TEMPLATE_PROFILE_EVENT:
+                _add_template_profile(templates_by_name, event.attributes or {})
+            elif event.name == "exception":
                 event_attributes = event.attributes or {}
                 exceptions.append(
                     {
@@ -303,6 +360,11 @@ def _analyze_trace(spans: list[ReadableSpan]) -> CapturedTrace:
     for query in queries:
         query["total_duration_ms"] = round(query["total_duration_ms"], 2)
 
+    templates = sorted(templates_by_name.values(), key=lambda t: -t["self_duration_ms"])
+    for template in templates:
+        template["total_duration_ms"] = round(template["total_duration_ms"], 2)
+        template["self_duration_ms"] = round(template["self_duration_ms"], 2)
+
     # Trace wall-clock duration: first span start to last span end. Spans
     # arrive sorted by start time, so the earliest is spans[0]; end times can
     # still be out of order, so those do need a scan.
@@ -325,13 +387,44 @@ def _analyze_trace(spans: list[ReadableSpan]) -> CapturedTrace:
             "span_count": len(spans),
             "query_count": query_count,
             "transaction_count": transaction_count,
+            "auto_prefetch_saved_queries": auto_prefetch_saved_queries,
             "exceptions": exceptions,
             "queries": queries,
+            "templates": templates,
+            # Most misses first, since those are the renders the cache didn't save
+            "fragments": sorted(fragments_by_name.values(), key=lambda f: -f["misses"]),
         },
         "spans": [_span_dict(s, trace_start) for s in spans],
     }
 
 
+def _add_template_profile(
+    templates: dict[tuple[str, str], TemplateEntry], attributes: Mapping[str, Any]
+) -> None:
+    """Merge one render's template profile into the trace's entries."""
+    for kind, name, calls, total_ms, self_ms in zip(
+        attributes.get("template.profile.kind", ()),
+        attributes.get("template.profile.name", ()),
+        attributes.get("template.profile.calls", ()),
+        attributes.get("template.profile.total_ms", ()),
+        attributes.get("template.profile.self_ms", ()),
+        strict=False,
+    ):
+        entry = templates.setdefault(
+            (kind, name),
+            {
+                "kind": kind,
+                "name": name,
+                "count": 0,
+                "total_duration_ms": 0.0,
+                "self_duration_ms": 0.0,
+            },
+        )
+        entry["count"] += calls
+        entry["total_duration_ms"] += total_ms
+        entry["self_duration_ms"] += self_ms
+
+
 def capture_available() -> bool:
     """Whether `capture_spans` can run.
 
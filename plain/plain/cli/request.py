@@ -55,6 +55,9 @@ def _trace_note(traces: list[CapturedTrace] | None) -> str | None:
 # `--json` is never capped.
 _QUERY_LIST_LIMIT = 10
 
+# Cap on template lines shown in the text Trace section, lifted by `--trace`.
+_TEMPLATE_LIST_LIMIT = 10
+
 # Width SQL is elided to in the terminal.
 _SQL_DISPLAY_WIDTH = 64
 
@@ -160,7 +163,8 @@ def _render_span_tree(spans: list[RawSpan]) -> None:
 
 
 def _render_trace(*, captured: CapturedTrace, detailed: bool, show_hint: bool) -> None:
-    """Render one trace's body — metrics, queries, and recorded exceptions.
+    """Render one trace's body — metrics, queries, templates, cache fragments,
+    and exceptions.
 
     Every listed statement names its call sites. When `detailed`, the query
     list is uncapped and the full span tree is printed after the exceptions.
@@ -182,6 +186,11 @@ def _render_trace(*, captured: CapturedTrace, detailed: bool, show_hint: bool) -
         queries_line += click.style(
             f"  +{transactions} transaction statement{plural}", dim=True
         )
+    if saved := analysis["auto_prefetch_saved_queries"]:
+        plural = "y" if saved == 1 else "ies"
+        queries_line += click.style(
+            f"  ({saved} quer{plural} saved by auto-prefetch)", dim=True
+        )
     click.echo(queries_line)
 
     queries = analysis["queries"]
@@ -207,6 +216,40 @@ def _render_trace(*, captured: CapturedTrace, detailed: bool, show_hint: bool) -
     if len(queries) > len(shown):
         click.echo(f"    + {len(queries) - len(shown)} more — see --trace")
 
+    if templates := analysis["templates"]:
+        # Only there when TEMPLATES_PROFILE is on. Self time, so the rows
+        # add up to the render instead of every layout counting the page.
+        click.echo(
+            f"  Templates: {len(templates)}"
+            + click.style("  (time in each, without what it rendered)", dim=True)
+        )
+        shown_templates = templates if detailed else templates[:_TEMPLATE_LIST_LIMIT]
+        for template in shown_templates:
+            click.echo(
+                f"    {template['count']:>3}×  {template['self_duration_ms']:>7.2f}ms  "
+                f"{template['kind']} {template['name']}"
+                + click.style(
+                    f"  {template['total_duration_ms']:.2f}ms total", dim=True
+                )
+            )
+        if len(templates) > len(shown_templates):
+            click.echo(
+                f"    + {len(templates) - len(shown_templates)} more — see --trace"
+            )
+
+    if fragments := analysis["fragments"]:
+        hits = sum(f["hits"] for f in fragments)
+        lookups = hits + sum(f["misses"] for f in fragments)
+        click.echo(
+            f"  Cache fragments: {len(fragments)}"
+            + click.style(f"  ({hits} of {lookups} lookups hit)", dim=True)
+        )
+        for fragment in fragments:
+            click.echo(
+                f"    {fragment['hits']:>3} hit  {fragment['misses']:>3} miss  "
+                f"{fragment['name']}"
+            )
+
     if exceptions := analysis["exceptions"]:
         click.secho("  Exceptions:", fg="red", bold=True)
         for exception in exceptions:
@@ -22,6 +22,7 @@ from .request import (
     UnreadablePostError,
 )
 from .response import (
+    AsyncStreamingJsonResponse,
     AsyncStreamingResponse,
     BadHeaderError,
     FileResponse,
@@ -30,6 +31,7 @@ from .response import (
     NotModifiedResponse,
     RedirectResponse,
     Response,
+    StreamingJsonResponse,
     StreamingResponse,
     content_length_forbidden,
     response_omits_body,
@@ -37,6 +39,7 @@ from .response import (
 )
 
 __all__ = [
+    "AsyncStreamingJsonResponse",
     "AsyncStreamingResponse",
     "BadHeaderError",
     "BadRequestError400",
@@ -55,6 +58,7 @@ __all__ = [
     "Request",
     "RequestHeaders",
     "Response",
+    "StreamingJsonResponse",
     "StreamingResponse",
     "SuspiciousFileOperationError400",
     "SuspiciousMultipartFormError400",
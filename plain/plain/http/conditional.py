@@ -0,0 +1,169 @@
+"""
+Conditional GET (RFC 9110 Section 13): ETag and Last-Modified validators,
+and the 304 Not Modified answer when the client's copy is still current.
+
+Two ways in, which compose:
+
+- `ConditionalGetMiddleware` hashes the rendered body of any GET/HEAD 200
+  that has no ETag and answers a matching `If-None-Match` with a 304. It
+  saves the bytes on the wire, not the render.
+- Views that can tell cheaply whether anything changed define
+  `get_response_etag()` / `get_response_last_modified()`;
+  `View.get_response` checks them before the handler runs, so a match
+  skips the render entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from plain.utils.http import http_date, parse_http_date
+from plain.utils.regex_helper import _lazy_re_compile
+
+from .middleware import HttpMiddleware
+from .response import NotModifiedResponse
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from .request import Request
+    from .response import Response
+
+_etag_re = _lazy_re_compile(r'(?:W/)?"[^"]*"')
+
+# Headers a 304 repeats from the 200 it stands in for, so caches can
+# refresh what they stored (RFC 9110 15.4.5).
+_NOT_MODIFIED_HEADERS = (
+    "Cache-Control",
+    "Content-Location",
+    "Date",
+    "ETag",
+    "Expires",
+    "Last-Modified",
+    "Vary",
+)
+
+
+def quote_etag(etag: str) -> str:
+    """Return `etag` as an entity-tag, adding the quotes if it has none."""
+    if _etag_re.fullmatch(etag):
+        return etag
+    return f'"{etag}"'
+
+
+def etag_for_content(content: bytes) -> str:
+    """A strong ETag for a response body.
+
+    blake2b is in hashlib, faster than md5/sha1 on 64-bit builds, and a
+    128-bit digest is plenty to tell two renders apart.
+    """
+    return f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str | None) -> bool:
+    if if_none_match.strip() == "*":
+        # "*" matches any current representation — the caller only asks
+        # about resources that exist.
+        return True
+    if etag is None:
+        return False
+    # If-None-Match uses weak comparison (RFC 9110 13.1.2).
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.removeprefix("W/") == opaque for tag in _etag_re.findall(if_none_match)
+    )
+
+
+def is_not_modified(
+    request: Request,
+    *,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> bool:
+    """Whether the client's cached copy of a GET/HEAD response is current.
+
+    `etag` and `last_modified` are the response's header values.
+    If-None-Match takes precedence: when it's present, If-Modified-Since
+    is ignored (RFC 9110 13.2.2).
+    """
+    if request.method not in ("GET", "HEAD"):
+        return False
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since and last_modified:
+        since = parse_http_date(if_modified_since)
+        modified = parse_http_date(last_modified)
+        return since is not None and modified is not None and modified <= since
+
+    return False
+
+
+def validator_headers(
+    etag: str | None, last_modified: datetime | None
+) -> dict[str, str]:
+    """ETag / Last-Modified headers for a view's declared validators."""
+    headers = {}
+    if etag is not None:
+        headers["ETag"] = quote_etag(etag)
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified.timestamp())
+    return headers
+
+
+def not_modified_response(response: Response) -> NotModifiedResponse:
+    """Replace a 200 with the 304 a cache can refresh its copy from."""
+    not_modified = NotModifiedResponse(
+        headers={
+            header: response.headers[header]
+            for header in _NOT_MODIFIED_HEADERS
+            if response.headers.get(header) is not None
+        }
+    )
+    # A session refresh or CSRF rotation still has to reach the client.
+    not_modified.cookies = response.cookies
+    not_modified.log_access = response.log_access
+    response.close()
+    return not_modified
+
+
+class ConditionalGetMiddleware(HttpMiddleware):
+    """
+    Adds a body-hash ETag to GET/HEAD 200 responses that don't set one,
+    and turns responses the client already has into 304s.
+
+    Streaming responses pass through untouched — hashing them would mean
+    buffering the whole body. So do `Cache-Control: no-store` responses,
+    which no cache will hold on to for revalidation anyway.
+    """
+
+    def after_response(self, request: Request, response: Response) -> Response:
+        if (
+            request.method not in ("GET", "HEAD")
+            or response.status_code != 200
+            or response.streaming
+        ):
+            return response
+
+        if response.headers.get("ETag") is None and not _is_no_store(response):
+            response.headers["ETag"] = etag_for_content(response.content)
+
+        if is_not_modified(
+            request,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        ):
+            return not_modified_response(response)
+
+        return response
+
+
+def _is_no_store(response: Response) -> bool:
+    cache_control = response.headers.get("Cache-Control") or ""
+    return "no-store" in (
+        directive.strip().lower() for directive in cache_control.split(",")
+    )
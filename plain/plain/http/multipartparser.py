@@ -31,6 +31,8 @@ from .exceptions import (
 )
 
 if TYPE_CHECKING:
+    from typing import IO
+
     from plain.http.request import Request
     from plain.internal.files.uploadhandler import FileUploadHandler
 
@@ -160,6 +162,9 @@ class MultiPartParser:
         self._post = QueryDict(mutable=True)
         self._files = MultiValueDict()
 
+        # A body the server spooled to disk can hand files out in place.
+        body, body_start = self._spooled_body()
+
         # Instantiate the parser and stream:
         stream = LazyStream(ChunkIter(self._request, self._chunk_size))
 
@@ -285,7 +290,9 @@ class MultiPartParser:
                     counters = [0] * len(handlers)
                     uploaded_file = False
                     try:
+                        started = []
                         for handler in handlers:
+                            started.append(handler)
                             try:
                                 handler.new_file(
                                     field_name,
@@ -298,6 +305,17 @@ class MultiPartParser:
                             except StopFutureHandlers:
                                 break
 
+                        if body is not None and transfer_encoding is None:
+                            offset = body_start + field_stream.offset
+                            offset += field_stream.tell()
+                            if all(
+                                handler.new_file_in_body(body, offset)
+                                for handler in started
+                            ):
+                                # The handlers read the file from the body,
+                                # so only its size is needed here.
+                                counters = [field_stream.skip()] * len(handlers)
+
                         for chunk in field_stream:
                             if transfer_encoding == "base64":
                                 # We only special-case base64 transfer encoding
@@ -407,8 +425,23 @@ class MultiPartParser:
         # We should document that...
         # (Maybe add handler.free_file to complement new_file)
         for handler in self._upload_handlers:
-            if hasattr(handler, "file"):
-                handler.file.close()  # ty: ignore[unresolved-attribute]
+            file = getattr(handler, "file", None)
+            if file is not None:
+                file.close()
+
+    def _spooled_body(self) -> tuple[IO[bytes] | None, int]:
+        """
+        Return the request's body file and the parse's start position in it,
+        if the body is a real file (a server-spooled body) that nothing has
+        read into memory. Otherwise return (None, 0).
+        """
+        stream: Any = self._request._stream
+        try:
+            stream.fileno()
+            return stream, stream.tell()
+        except (AttributeError, OSError, ValueError):
+            # io.UnsupportedOperation (a BytesIO) is both of the latter.
+            return None, 0
 
 
 class LazyStream:
@@ -420,14 +453,18 @@ class LazyStream:
     variable in case you need to "unget" some bytes.
     """
 
-    def __init__(self, producer: Iterator[bytes], length: int | None = None):
+    def __init__(
+        self, producer: Iterator[bytes], length: int | None = None, offset: int = 0
+    ):
         """
         Every LazyStream must have a producer when instantiated.
 
         A producer is an iterable that returns a string each time it
-        is called.
+        is called. ``offset`` is where the stream starts in the stream
+        it was cut from, if any.
         """
         self._producer = producer
+        self.offset = offset
         self._empty = False
         self._leftover = b""
         self.length = length
@@ -480,6 +517,22 @@ class LazyStream:
         self.position += len(output)
         return output
 
+    def skip(self) -> int:
+        """
+        Consume the rest of the stream without returning it, and return the
+        number of bytes skipped. Producers with a ``skip()`` of their own are
+        skipped that way, without producing chunks.
+        """
+        skipped = len(self._leftover)
+        self._leftover = b""
+        skip = getattr(self._producer, "skip", None)
+        if skip is not None:
+            skipped += skip()
+        else:
+            skipped += sum(len(chunk) for chunk in self._producer)
+        self.position += skipped
+        return skipped
+
     def close(self) -> None:
         """
         Used to invalidate/disable this lazy stream.
@@ -567,8 +620,9 @@ class InterBoundaryIter:
         return self
 
     def __next__(self) -> LazyStream:
+        offset = self._stream.tell()
         try:
-            return LazyStream(BoundaryIter(self._stream, self._boundary))
+            return LazyStream(BoundaryIter(self._stream, self._boundary), offset=offset)
         except InputStreamExhausted:
             raise StopIteration()
 
@@ -644,6 +698,52 @@ class BoundaryIter:
                 stream.unget(chunk[-rollback:])
                 return chunk[:-rollback]
 
+    def skip(self) -> int:
+        """
+        Consume up to and including the boundary without producing any
+        data, and return the number of data bytes skipped.
+
+        Each chunk is searched where it is; only a boundary-sized tail of
+        the previous chunk is joined to the next, to find a boundary split
+        between them.
+        """
+        if self._done:
+            return 0
+        self._done = True
+
+        stream = self._stream
+        boundary = self._boundary
+        # Enough of the previous chunk for a boundary split across chunks,
+        # and for the CRLF before one at the start of a chunk.
+        tail_size = len(boundary) + 1
+        tail = b""
+        seen = 0
+        for chunk in stream:
+            window = tail + chunk[: len(boundary) - 1]
+            index = window.find(boundary)
+            if index >= 0:
+                before = window[:index]
+                start = seen - len(tail) + index
+                rest = window[index + len(boundary) :] + chunk[len(boundary) - 1 :]
+            else:
+                index = chunk.find(boundary)
+                if index < 0:
+                    seen += len(chunk)
+                    tail = (tail + chunk[-tail_size:])[-tail_size:]
+                    continue
+                before = tail + chunk[max(0, index - 2) : index]
+                start = seen + index
+                rest = chunk[index + len(boundary) :]
+            stream.unget(rest)
+            # Back up over the CRLF, like _find_boundary().
+            if before.endswith(b"\n"):
+                start -= 1
+                before = before[:-1]
+            if before.endswith(b"\r"):
+                start -= 1
+            return start
+        return seen
+
     def _find_boundary(self, data: bytes) -> tuple[int, int] | None:
         """
         Find a multipart boundary in data.
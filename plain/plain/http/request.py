@@ -5,11 +5,11 @@ import copy
 import json
 import secrets
 import uuid
-from collections.abc import Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
 from functools import cached_property
 from io import BytesIO
 from itertools import chain
-from typing import TYPE_CHECKING, Any, Protocol, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, cast, overload
 from urllib.parse import parse_qsl, quote, urlencode, urljoin, urlsplit
 
 if TYPE_CHECKING:
@@ -20,6 +20,7 @@ from plain.http.cookie import parse_cookie, unsign_cookie_value
 from plain.http.multipartparser import (
     MultiPartParser,
 )
+from plain.json import get_json_codec
 from plain.runtime import settings
 from plain.utils.datastructures import CaseInsensitiveMapping, MultiValueDict
 from plain.utils.encoding import iri_to_uri
@@ -72,6 +73,11 @@ class Request:
     # a real server request (test client, h2 requests with no body).
     _body_ingest_seconds: float | None = None
 
+    # time.monotonic() when the server handed the request off for
+    # dispatch, for measuring how long it waited for a worker thread.
+    # None outside a real server request.
+    _queued_at: float | None = None
+
     def __init__(
         self,
         *,
@@ -371,6 +377,27 @@ class Request:
             self._stream = BytesIO(self._body)
         return self._body
 
+    async def stream_body(self, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """
+        Iterate over the request body in chunks, without holding all of it.
+
+        For a view with `stream_request_body`, chunks come off the
+        connection as the view asks for them, while the client is still
+        sending. Otherwise the body has already been received and is read
+        `chunk_size` bytes at a time.
+        """
+        if isinstance(self._stream, AsyncIterable):
+            if self._read_started:
+                raise RawPostDataException(
+                    "You cannot stream the body after reading from it"
+                )
+            self._read_started = True
+            async for chunk in cast(AsyncIterable[bytes], self._stream):
+                yield chunk
+        else:
+            while chunk := self.read(chunk_size):
+                yield chunk
+
     @cached_property
     def _multipart_data(self) -> tuple[QueryDict, MultiValueDict]:
         """Parse multipart/form-data. Used internally by form_data and files properties.
@@ -398,7 +425,7 @@ class Request:
                 f"Request content-type is not JSON (got: {self.content_type})"
             )
         try:
-            parsed = json.loads(self.body)
+            parsed = get_json_codec().loads(self.body)
         except json.JSONDecodeError as e:
             raise BadRequestError400(f"Invalid JSON in request body: {e}") from e
 
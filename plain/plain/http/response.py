@@ -8,14 +8,14 @@ import os
 import re
 import sys
 import time
-from collections.abc import AsyncIterator, Iterator
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
 from email.header import Header
 from http.client import responses
 from http.cookies import SimpleCookie
 from typing import IO, Any
 
 from plain.http.cookie import sign_cookie_value
-from plain.json import PlainJSONEncoder
+from plain.json import PlainJSONEncoder, get_json_codec
 from plain.utils import timezone
 from plain.utils.datastructures import CaseInsensitiveMapping
 from plain.utils.encoding import iri_to_uri
@@ -591,6 +591,138 @@ class AsyncStreamingResponse(Response):
             await close()
 
 
+class _JsonStreamEncoder:
+    """Encodes values one at a time into a JSON array (or NDJSON lines),
+    handing back chunks of about `chunk_size` bytes as they fill."""
+
+    def __init__(self, *, ndjson: bool, chunk_size: int):
+        self._dumps = get_json_codec().dumps_bytes
+        self._ndjson = ndjson
+        self._chunk_size = chunk_size
+        self._parts: list[bytes] = [] if ndjson else [b"["]
+        self._size = 0
+        self._separator = b""
+
+    def encode(self, value: Any) -> bytes | None:
+        data = self._dumps(value)
+        if self._ndjson:
+            self._parts += (data, b"\n")
+        else:
+            self._parts += (self._separator, data)
+            self._separator = b","
+        self._size += len(data) + 1
+        if self._size >= self._chunk_size:
+            return self._flush()
+        return None
+
+    def finish(self) -> bytes:
+        if not self._ndjson:
+            self._parts.append(b"]")
+        return self._flush()
+
+    def _flush(self) -> bytes:
+        chunk = b"".join(self._parts)
+        self._parts = []
+        self._size = 0
+        return chunk
+
+
+def _json_content_type(content_type: str | None, ndjson: bool) -> str:
+    if content_type is not None:
+        return content_type
+    return "application/x-ndjson" if ndjson else "application/json"
+
+
+class StreamingJsonResponse(StreamingResponse):
+    """
+    A streaming HTTP response that encodes an iterable of values as a JSON
+    array, or as newline-delimited JSON with `ndjson=True`.
+
+    Values are encoded one at a time by the JSON_CODEC codec and sent in
+    chunks of about `chunk_size` bytes, so a large export — say
+    `Project.query.values("id", "name").iterator()` — never holds the
+    whole payload in memory.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        values: Iterable[Any],
+        *,
+        ndjson: bool = False,
+        content_type: str | None = None,
+        status_code: int | None = None,
+        reason: str | None = None,
+        charset: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            self._encode(values, ndjson),
+            content_type=_json_content_type(content_type, ndjson),
+            status_code=status_code,
+            reason=reason,
+            charset=charset,
+            headers=headers,
+        )
+        if hasattr(values, "close"):
+            self._resource_closers.append(values.close)
+
+    def _encode(self, values: Iterable[Any], ndjson: bool) -> Iterator[bytes]:
+        encoder = _JsonStreamEncoder(ndjson=ndjson, chunk_size=self.chunk_size)
+        for value in values:
+            if chunk := encoder.encode(value):
+                yield chunk
+        if chunk := encoder.finish():
+            yield chunk
+
+
+class AsyncStreamingJsonResponse(AsyncStreamingResponse):
+    """
+    The async counterpart of StreamingJsonResponse: encodes the values of
+    an async iterable as they arrive, without occupying a thread.
+    """
+
+    chunk_size = 64 * 1024
+
+    def __init__(
+        self,
+        values: AsyncIterable[Any],
+        *,
+        ndjson: bool = False,
+        content_type: str | None = None,
+        status_code: int | None = None,
+        reason: str | None = None,
+        charset: str | None = None,
+        headers: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            self._encode(values, ndjson),
+            content_type=_json_content_type(content_type, ndjson),
+            status_code=status_code,
+            reason=reason,
+            charset=charset,
+            headers=headers,
+        )
+        self._values = values
+
+    async def _encode(
+        self, values: AsyncIterable[Any], ndjson: bool
+    ) -> AsyncIterator[bytes]:
+        encoder = _JsonStreamEncoder(ndjson=ndjson, chunk_size=self.chunk_size)
+        async for value in values:
+            if chunk := encoder.encode(value):
+                yield chunk
+        if chunk := encoder.finish():
+            yield chunk
+
+    async def aclose(self) -> None:
+        await super().aclose()
+        close = getattr(self._values, "aclose", None)
+        if close is not None:
+            await close()
+
+
 class FileResponse(StreamingResponse):
     """
     A streaming HTTP response class optimized for files.
@@ -837,9 +969,11 @@ class JsonResponse(Response):
         charset: str | None = None,
         headers: dict[str, Any] | None = None,
     ):
-        if json_dumps_params is None:
-            json_dumps_params = {}
-        data = json.dumps(data, cls=encoder, **json_dumps_params)
+        if encoder is PlainJSONEncoder and not json_dumps_params:
+            # The default encoding is the JSON_CODEC's to produce.
+            data = get_json_codec().dumps_bytes(data)
+        else:
+            data = json.dumps(data, cls=encoder, **(json_dumps_params or {}))
         super().__init__(
             content=data,
             content_type=content_type,
@@ -4,6 +4,7 @@ Classes representing uploaded files.
 
 from __future__ import annotations
 
+import io
 import os
 from io import BytesIO
 from typing import TYPE_CHECKING
@@ -100,6 +101,141 @@ class TemporaryUploadedFile(UploadedFile):
             pass
 
 
+class BodyRangeUploadedFile(UploadedFile):
+    """
+    A file uploaded inside a request body the server spooled to disk, read
+    in place — the upload's bytes are a range of the body's temp file, not
+    a copy of them.
+
+    ``temporary_file_path()`` copies the range into a file of its own the
+    first time it's called, for code that needs a path.
+    """
+
+    def __init__(
+        self,
+        body: IO[bytes],
+        offset: int,
+        name: str,
+        content_type: str,
+        size: int,
+        charset: str | None,
+        content_type_extra: dict[str, str] | None = None,
+    ) -> None:
+        self._range = _FileRange(body.fileno(), offset, size)
+        self._path_file: Any = None
+        super().__init__(
+            io.BufferedReader(self._range),
+            name,
+            content_type,
+            size,
+            charset,
+            content_type_extra,
+        )
+
+    def temporary_file_path(self) -> str:
+        """Return the path of a temporary copy of this file."""
+        if self._path_file is None:
+            _, ext = os.path.splitext(self.name or "")
+            copy = tempfile.NamedTemporaryFile(
+                suffix=".upload" + ext, dir=settings.FILE_UPLOAD_TEMP_DIR
+            )
+            try:
+                self._range.copy_to(copy.fileno())
+            except BaseException:
+                copy.close()
+                raise
+            self._path_file = copy
+        return self._path_file.name
+
+    def close(self) -> None:
+        self.file.close()
+        if self._path_file is not None:
+            try:
+                self._path_file.close()
+            except FileNotFoundError:
+                # Moved or deleted by the caller, like TemporaryUploadedFile.
+                pass
+
+
+class _FileRange(io.RawIOBase):
+    """A read-only window onto ``size`` bytes of a file, from ``offset``.
+
+    Reads use pread on a duplicate of the descriptor, so they never move
+    the original file's position, and the window stays readable (and
+    can't be confused with a reused descriptor number) after the original
+    is closed.
+    """
+
+    def __init__(self, fd: int, offset: int, size: int) -> None:
+        super().__init__()
+        self._fd = os.dup(fd)
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        n = min(len(buffer), self._size - self._pos)
+        if n <= 0:
+            return 0
+        data = os.pread(self._fd, n, self._offset + self._pos)
+        buffer[: len(data)] = data
+        self._pos += len(data)
+        return len(data)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self._pos
+        elif whence == os.SEEK_END:
+            offset += self._size
+        elif whence != os.SEEK_SET:
+            raise ValueError(f"invalid whence ({whence!r})")
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset!r}")
+        self._pos = offset
+        return offset
+
+    def tell(self) -> int:
+        return self._pos
+
+    def copy_to(self, fd: int) -> None:
+        """Write the whole range to ``fd``, in the kernel when it can."""
+        copied = 0
+        if hasattr(os, "copy_file_range"):
+            try:
+                while copied < self._size:
+                    n = os.copy_file_range(
+                        self._fd, fd, self._size - copied, self._offset + copied
+                    )
+                    if not n:
+                        break
+                    copied += n
+            except OSError:
+                # Not supported between these filesystems; fall back to
+                # copying through userspace from where it stopped.
+                pass
+        while copied < self._size:
+            data = os.pread(
+                self._fd,
+                min(self._size - copied, 1024 * 1024),
+                self._offset + copied,
+            )
+            if not data:
+                break
+            os.write(fd, data)
+            copied += len(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            os.close(self._fd)
+        super().close()
+
+
 class InMemoryUploadedFile(UploadedFile):
     """
     A file uploaded into memory (i.e. stream-to-memory).
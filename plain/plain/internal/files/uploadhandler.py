@@ -10,6 +10,7 @@ from io import BytesIO
 from typing import TYPE_CHECKING
 
 from plain.internal.files.uploadedfile import (
+    BodyRangeUploadedFile,
     InMemoryUploadedFile,
     TemporaryUploadedFile,
     UploadedFile,
@@ -17,7 +18,7 @@ from plain.internal.files.uploadedfile import (
 from plain.runtime import settings
 
 if TYPE_CHECKING:
-    from typing import Any
+    from typing import IO, Any
 
     from plain.http import Request
 
@@ -120,6 +121,19 @@ class FileUploadHandler(ABC):
         self.charset = charset
         self.content_type_extra = content_type_extra
 
+    def new_file_in_body(self, body: IO[bytes], offset: int) -> bool:
+        """
+        Offer the file as a byte range of the request body, called after
+        ``new_file()`` when the server spooled the body to disk.
+
+        The file's bytes start at ``offset`` in ``body``. Return True to
+        take them from there: ``receive_data_chunk()`` then gets no data it
+        has to keep, and ``file_complete()`` builds the file from the range.
+        When every handler that started the file returns True, the parser
+        skips over the file instead of reading it into chunks.
+        """
+        return False
+
     @abstractmethod
     def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes | None:
         """
@@ -154,34 +168,74 @@ class FileUploadHandler(ABC):
 class TemporaryFileUploadHandler(FileUploadHandler):
     """
     Upload handler that streams data into a temporary file.
+
+    When the request body is already on disk, the file is read in place
+    from the body instead (see ``BodyRangeUploadedFile``).
     """
 
     def new_file(self, *args: Any, **kwargs: Any) -> None:
         """
-        Create the file object to append to as data is coming in.
+        Start a new file. The temporary file is created with the first chunk.
         """
         super().new_file(*args, **kwargs)
         assert self.file_name is not None, "file_name should be set by parent new_file"
         assert self.content_type is not None, (
             "content_type should be set by parent new_file"
         )
-        self.file = TemporaryUploadedFile(
-            self.file_name, self.content_type, 0, self.charset, self.content_type_extra
-        )
+        self.file: TemporaryUploadedFile | BodyRangeUploadedFile | None = None
+        self._body_range: tuple[IO[bytes], int] | None = None
+
+    def new_file_in_body(self, body: IO[bytes], offset: int) -> bool:
+        self._body_range = (body, offset)
+        return True
+
+    def _temporary_file(self) -> TemporaryUploadedFile:
+        if self.file is None:
+            assert self.file_name is not None
+            assert self.content_type is not None
+            self.file = TemporaryUploadedFile(
+                self.file_name,
+                self.content_type,
+                0,
+                self.charset,
+                self.content_type_extra,
+            )
+        assert isinstance(self.file, TemporaryUploadedFile)
+        return self.file
 
     def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
-        self.file.write(raw_data)
-
-    def file_complete(self, file_size: int) -> TemporaryUploadedFile:
-        self.file.seek(0)
-        self.file.size = file_size
-        return self.file
+        if self._body_range is None:
+            self._temporary_file().write(raw_data)
+
+    def file_complete(
+        self, file_size: int
+    ) -> TemporaryUploadedFile | BodyRangeUploadedFile:
+        if self._body_range is not None:
+            body, offset = self._body_range
+            assert self.file_name is not None
+            assert self.content_type is not None
+            self.file = BodyRangeUploadedFile(
+                body,
+                offset,
+                self.file_name,
+                self.content_type,
+                file_size,
+                self.charset,
+                self.content_type_extra,
+            )
+            return self.file
+
+        file = self._temporary_file()
+        file.seek(0)
+        file.size = file_size
+        return file
 
     def upload_interrupted(self) -> None:
-        if hasattr(self, "file"):
-            temp_location = self.file.temporary_file_path()
+        file = getattr(self, "file", None)
+        if isinstance(file, TemporaryUploadedFile):
+            temp_location = file.temporary_file_path()
             try:
-                self.file.close()
+                file.close()
                 os.remove(temp_location)
             except FileNotFoundError:
                 pass
@@ -214,6 +268,10 @@ class MemoryFileUploadHandler(FileUploadHandler):
             self.file = BytesIO()
             raise StopFutureHandlers()
 
+    def new_file_in_body(self, body: IO[bytes], offset: int) -> bool:
+        # Inactive, this handler only passes chunks on.
+        return not self.activated
+
     def receive_data_chunk(self, raw_data: bytes, start: int) -> bytes | None:
         """Add the data to the BytesIO file."""
         if self.activated:
@@ -25,19 +25,28 @@ from opentelemetry.semconv.attributes import (
     user_agent_attributes,
 )
 from opentelemetry.semconv.metrics.http_metrics import HTTP_SERVER_REQUEST_DURATION
-from plain.http import RedirectResponse
+from plain.exceptions import ImproperlyConfigured
+from plain.http import RedirectResponse, Response
 from plain.runtime import settings
 from plain.urls import get_resolver
-from plain.urls.exceptions import Resolver308
+from plain.urls.exceptions import Resolver308, Resolver400, Resolver404
 from plain.utils.encoding import iri_to_uri
 from plain.utils.http import escape_leading_slashes
 from plain.utils.module_loading import import_string
 from plain.utils.otel import format_exception_type
 
 from .exception import response_for_exception
+from .pools import (
+    DEFAULT_POOL,
+    ExecutorPool,
+    _request_executor,
+    create_executor_pools,
+)
 
 if TYPE_CHECKING:
-    from plain.http import Request, Response
+    from collections.abc import Iterator
+
+    from plain.http import Request
     from plain.http.middleware import HttpMiddleware
     from plain.urls import ResolverMatch
 
@@ -67,6 +76,16 @@ request_duration_histogram = meter.create_histogram(
     description="Duration of HTTP server requests.",
 )
 
+request_queue_histogram = meter.create_histogram(
+    name="plain.server.request.queue.duration",
+    unit="s",
+    description=(
+        "Time HTTP server requests waited before their pipeline started: in "
+        "the worker's thread pool queue, plus upstream when X-Request-Start "
+        "is trusted."
+    ),
+)
+
 
 @dataclasses.dataclass
 class _AsyncViewPending:
@@ -77,6 +96,61 @@ class _AsyncViewPending:
     ran_before: list[HttpMiddleware]
 
 
+def _request_start_age(value: str, now: float) -> float | None:
+    """Seconds since an X-Request-Start timestamp, or None if unparseable.
+
+    Proxies disagree on the format — Heroku sends epoch milliseconds,
+    nginx `t=` seconds with a fraction, Apache `t=` microseconds — so
+    the unit is inferred from the magnitude.
+    """
+    try:
+        start = float(value.strip().removeprefix("t="))
+    except ValueError:
+        return None
+    if start > 1e17:
+        start /= 1e9  # nanoseconds
+    elif start > 1e14:
+        start /= 1e6  # microseconds
+    elif start > 1e11:
+        start /= 1e3  # milliseconds
+    # Clock skew between the proxy and this host can put the start in the
+    # future; that's no wait, not a negative one.
+    return max(0.0, now - start)
+
+
+def _queue_wait(request: Request) -> float | None:
+    """Seconds the request waited before its pipeline started.
+
+    Measured from when the server finished receiving it — or, with
+    HTTP_X_REQUEST_START, from when the upstream proxy received it, so
+    time queued at the proxy counts too.
+    """
+    if settings.HTTP_X_REQUEST_START and (
+        value := request.headers.get("X-Request-Start")
+    ):
+        age = _request_start_age(value, time.time())
+        if age is not None:
+            return age
+    if request._queued_at is None:
+        return None
+    return time.monotonic() - request._queued_at
+
+
+def _is_healthcheck(request: Request) -> bool:
+    # The server answers HEALTHCHECK_PATH itself, before the handler; this
+    # keeps a load balancer's check from being shed if one gets through.
+    return bool(settings.HEALTHCHECK_PATH) and request.path == settings.HEALTHCHECK_PATH
+
+
+def _overloaded_response() -> Response:
+    return Response(
+        "Service Unavailable",
+        status_code=503,
+        content_type="text/plain",
+        headers={"Retry-After": "1"},
+    )
+
+
 def _redirect_to_canonical(request: Request, canonical: str) -> Response:
     """Build a 308 redirect to `canonical`, carrying the query string through.
 
@@ -95,9 +169,29 @@ def _redirect_to_canonical(request: Request, canonical: str) -> Response:
     return RedirectResponse(escape_leading_slashes(location), status_code=308)
 
 
+def _routed_view_classes() -> Iterator[type]:
+    patterns = list(get_resolver().url_patterns)
+    while patterns:
+        pattern = patterns.pop()
+        if children := getattr(pattern, "url_patterns", None):
+            patterns.extend(children)
+        elif view_class := getattr(pattern, "view_class", None):
+            yield view_class
+
+
 class BaseHandler:
     _middleware_chain: list[HttpMiddleware] | None = None
 
+    def __init__(self) -> None:
+        # The worker's shared pool, wrapped on first use (the executor is
+        # passed to handle()), and the SERVER_EXECUTOR_POOLS bulkheads,
+        # created on first use so each worker process gets its own.
+        self._default_pool: ExecutorPool | None = None
+        self._pools: dict[str, ExecutorPool] | None = None
+        # Whether any routed view sets `stream_request_body`, found on
+        # first use so apps without one never resolve twice.
+        self._has_streaming_views: bool | None = None
+
     def load_middleware(self) -> None:
         """
         Populate middleware list from settings.MIDDLEWARE.
@@ -267,9 +361,36 @@ class BaseHandler:
             request_ctx.run(context.attach, context.get_current())
             start = time.perf_counter()
 
-            result = await self._run_in_executor(
-                executor, request_ctx, self._run_sync_pipeline, request
+            pool = self._select_pool(request, executor)
+            executor = pool.executor
+            request_ctx.run(_request_executor.set, executor)
+            max_depth = (
+                settings.SERVER_MAX_QUEUE_DEPTH
+                if pool is self._default_pool
+                else pool.max_queue
             )
+            if (
+                max_depth is not None
+                and pool.is_full(max_depth)
+                and not _is_healthcheck(request)
+            ):
+                # Shed on the event loop: every thread is busy and enough
+                # requests are already waiting that this one would only
+                # add to the backlog.
+                result = _overloaded_response()
+            else:
+                slot = pool.queue.enter()
+                try:
+                    result = await self._run_in_executor(
+                        executor,
+                        request_ctx,
+                        self._run_queued_pipeline,
+                        request,
+                        pool,
+                        slot,
+                    )
+                finally:
+                    pool.queue.leave(slot)
 
             if isinstance(result, _AsyncViewPending):
                 # Drive the coroutine on a task bound to request_ctx so
@@ -319,6 +440,126 @@ class BaseHandler:
 
             return response
 
+    def _select_pool(
+        self, request: Request, executor: concurrent.futures.Executor
+    ) -> ExecutorPool:
+        """The pool to run the request on: the one its view class names in
+        `executor_pool`, or the worker's shared pool."""
+        default_pool = self._default_pool
+        if default_pool is None or default_pool.executor is not executor:
+            # Not the worker's executor (the test client, or a caller driving
+            # handle() directly), so assume the configured size.
+            self.use_shared_executor(executor, threads=settings.SERVER_THREADS)
+            default_pool = self._default_pool
+            assert default_pool is not None
+        if self._pools is None:
+            self._pools = create_executor_pools(settings.SERVER_EXECUTOR_POOLS)
+        if not self._pools:
+            return default_pool
+
+        # The view class is only known after URL resolution, so resolve
+        # here on the event loop. The match is cached on the request and
+        # reused by the pipeline; a path that doesn't resolve runs on the
+        # shared pool, where the pipeline raises the 404 (or redirect)
+        # as usual.
+        try:
+            resolver_match = self._resolve_request(request)
+        except (Resolver400, Resolver404, Resolver308):
+            return default_pool
+        name = getattr(resolver_match.view_class, "executor_pool", None)
+        if name is None:
+            return default_pool
+        if name not in self._pools:
+            raise ImproperlyConfigured(
+                f"{resolver_match.view_class.__qualname__}.executor_pool is "
+                f"{name!r}, which isn't in SERVER_EXECUTOR_POOLS."
+            )
+        return self._pools[name]
+
+    def streams_request_body(self, method: str, path: str) -> bool:
+        """Whether the view for `method` and `path` reads its body as it
+        arrives, so the server should dispatch before receiving it.
+
+        Called by the server with only the request line parsed. Only an
+        async handler can stream; a sync one gets the received body.
+        """
+        if self._has_streaming_views is None:
+            self._has_streaming_views = any(
+                getattr(view_class, "stream_request_body", False)
+                for view_class in _routed_view_classes()
+            )
+        if not self._has_streaming_views:
+            return False
+        try:
+            resolver_match = get_resolver().resolve(path)
+        except (Resolver400, Resolver404, Resolver308):
+            return False
+        view_class = resolver_match.view_class
+        if not getattr(view_class, "stream_request_body", False):
+            return False
+        return inspect.iscoroutinefunction(getattr(view_class, method.lower(), None))
+
+    def use_shared_executor(
+        self, executor: concurrent.futures.Executor, *, threads: int
+    ) -> None:
+        """Set the worker's shared pool, which views without an
+        `executor_pool` run on, and how many threads it has."""
+        self._default_pool = ExecutorPool(
+            DEFAULT_POOL, threads=threads, executor=executor
+        )
+
+    def shutdown_executor_pools(self, *, cancel_futures: bool = False) -> None:
+        """Stop the SERVER_EXECUTOR_POOLS threads (the worker owns the shared pool)."""
+        for pool in (self._pools or {}).values():
+            pool.shutdown(cancel_futures=cancel_futures)
+
+    def _run_queued_pipeline(
+        self, request: Request, pool: ExecutorPool, slot: list[bool]
+    ) -> Response | _AsyncViewPending:
+        """Start a pipeline that waited in the executor queue.
+
+        Records how long it waited, and answers with a 503 instead of
+        running it when that's past SERVER_MAX_QUEUE_WAIT — the client
+        has likely given up already, and the time is better spent on the
+        requests behind it.
+        """
+        pool.queue.start(slot)
+        try:
+            return self._start_pipeline(request, pool)
+        finally:
+            pool.queue.finish()
+
+    def _start_pipeline(
+        self, request: Request, pool: ExecutorPool
+    ) -> Response | _AsyncViewPending:
+        queue_wait = _queue_wait(request)
+        if queue_wait is None:
+            return self._run_sync_pipeline(request)
+
+        trace.get_current_span().set_attribute(
+            "plain.request.queue_wait_seconds", round(queue_wait, 6)
+        )
+        method = request.method or ""
+        request_queue_histogram.record(
+            queue_wait,
+            {
+                http_attributes.HTTP_REQUEST_METHOD: method
+                if method in _KNOWN_HTTP_METHODS
+                else "_OTHER",
+                "plain.executor.pool": pool.name,
+            },
+        )
+
+        max_wait = settings.SERVER_MAX_QUEUE_WAIT
+        if (
+            max_wait is not None
+            and queue_wait > max_wait
+            and not _is_healthcheck(request)
+        ):
+            return _overloaded_response()
+
+        return self._run_sync_pipeline(request)
+
     def _run_sync_pipeline(self, request: Request) -> Response | _AsyncViewPending:
         """Run the entire sync request pipeline on a single thread.
 
@@ -0,0 +1,184 @@
+"""Named executor pools — bulkheads between groups of views.
+
+Every view runs on its worker's shared thread pool unless its class sets
+`executor_pool` to the name of a pool in `SERVER_EXECUTOR_POOLS`. A slow
+endpoint moved to its own pool can only occupy that pool's threads, so
+it can't starve everything else of the shared ones.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Any
+
+from opentelemetry import metrics
+from plain.exceptions import ImproperlyConfigured
+
+# The worker's shared thread pool, as it's labelled in metrics.
+DEFAULT_POOL = "default"
+
+_POOL_OPTIONS = frozenset({"threads", "max_queue"})
+
+meter = metrics.get_meter("plain")
+
+# Every live pool, for the gauges below.
+_pools: weakref.WeakSet[ExecutorPool] = weakref.WeakSet()
+
+# The executor the current request runs on, set in the request's context.
+_request_executor: ContextVar[Executor | None] = ContextVar(
+    "plain.request_executor", default=None
+)
+
+
+def get_request_executor() -> Executor | None:
+    """The executor the current request runs on, or None outside the server.
+
+    Work a response hands back to a thread after the view returns (like
+    rendering the rest of a streamed page) goes here, so it is bounded by
+    the same pool as the view itself.
+    """
+    return _request_executor.get()
+
+
+class ExecutorQueue:
+    """Counts pipelines handed to an executor that no thread has started,
+    and the ones running.
+
+    Each submission holds a slot until a thread picks the pipeline up or
+    the request stops waiting for it (cancelled), whichever comes first.
+    """
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.busy = 0
+        self._lock = threading.Lock()
+
+    def enter(self) -> list[bool]:
+        with self._lock:
+            self.depth += 1
+        return [True]
+
+    def leave(self, slot: list[bool]) -> None:
+        with self._lock:
+            if slot[0]:
+                slot[0] = False
+                self.depth -= 1
+
+    def start(self, slot: list[bool]) -> None:
+        """A thread picked the pipeline up."""
+        with self._lock:
+            if slot[0]:
+                slot[0] = False
+                self.depth -= 1
+            self.busy += 1
+
+    def finish(self) -> None:
+        with self._lock:
+            self.busy -= 1
+
+
+class ExecutorPool:
+    """A named thread pool and the queue in front of it."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        threads: int,
+        max_queue: int | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self.name = name
+        self.threads = threads
+        self.max_queue = max_queue
+        self.queue = ExecutorQueue()
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix=f"plain-{name}"
+        )
+        _pools.add(self)
+
+    def is_full(self, max_depth: int) -> bool:
+        """Whether a request arriving now would wait behind `max_depth` others.
+
+        A request only waits when every thread is busy, so an idle pool is
+        never full, even with a `max_depth` of 0.
+        """
+        if self.queue.depth:
+            return self.queue.depth >= max_depth
+        return max_depth == 0 and self.queue.busy >= self.threads
+
+    def shutdown(self, *, cancel_futures: bool = False) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=cancel_futures)
+
+
+def parse_executor_pools(
+    config: Mapping[str, Mapping[str, Any]],
+) -> dict[str, dict[str, Any]]:
+    """Validate SERVER_EXECUTOR_POOLS, returning each pool's options.
+
+    Raises ImproperlyConfigured naming the first problem found.
+    """
+    pools = {}
+    for name, options in config.items():
+        if name == DEFAULT_POOL:
+            raise ImproperlyConfigured(
+                f"SERVER_EXECUTOR_POOLS can't define {DEFAULT_POOL!r} — that's "
+                "the worker's shared pool, sized by SERVER_THREADS."
+            )
+        if unknown := set(options) - _POOL_OPTIONS:
+            raise ImproperlyConfigured(
+                f"SERVER_EXECUTOR_POOLS[{name!r}] has unknown options "
+                f"{sorted(unknown)} (expected 'threads' and 'max_queue')."
+            )
+        threads = options.get("threads")
+        if not isinstance(threads, int) or threads < 1:
+            raise ImproperlyConfigured(
+                f"SERVER_EXECUTOR_POOLS[{name!r}]['threads'] must be a positive "
+                f"integer (got {threads!r})."
+            )
+        max_queue = options.get("max_queue")
+        if max_queue is not None and (not isinstance(max_queue, int) or max_queue < 0):
+            raise ImproperlyConfigured(
+                f"SERVER_EXECUTOR_POOLS[{name!r}]['max_queue'] must be None or a "
+                f"non-negative integer (got {max_queue!r})."
+            )
+        pools[name] = {"threads": threads, "max_queue": max_queue}
+    return pools
+
+
+def create_executor_pools(
+    config: Mapping[str, Mapping[str, Any]],
+) -> dict[str, ExecutorPool]:
+    return {
+        name: ExecutorPool(name, **options)
+        for name, options in parse_executor_pools(config).items()
+    }
+
+
+def _observe(value: Callable[[ExecutorPool], float]) -> Any:
+    def callback(options: metrics.CallbackOptions) -> list[metrics.Observation]:
+        return [
+            metrics.Observation(value(pool), {"plain.executor.pool": pool.name})
+            for pool in list(_pools)
+            if pool.threads
+        ]
+
+    return callback
+
+
+meter.create_observable_gauge(
+    "plain.server.executor.utilization",
+    callbacks=[_observe(lambda pool: pool.queue.busy / pool.threads)],
+    unit="1",
+    description="Fraction of an executor pool's threads running a request.",
+)
+meter.create_observable_gauge(
+    "plain.server.executor.queue.depth",
+    callbacks=[_observe(lambda pool: pool.queue.depth)],
+    unit="{request}",
+    description="Requests waiting for a thread in an executor pool.",
+)
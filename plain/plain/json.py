@@ -2,10 +2,14 @@ import datetime
 import decimal
 import json
 import uuid
+from functools import lru_cache
 from typing import Any
 
+from plain.exceptions import ImproperlyConfigured
+from plain.runtime import settings
 from plain.utils.duration import duration_iso_string
 from plain.utils.functional import Promise
+from plain.utils.module_loading import import_string
 from plain.utils.timezone import is_aware
 
 
@@ -39,3 +43,104 @@ class PlainJSONEncoder(json.JSONEncoder):
             return str(o)
         else:
             return super().default(o)
+
+
+class JSONCodec:
+    """Serializes and parses JSON for the framework (the JSON_CODEC setting).
+
+    `dumps` encodes like `json.dumps(obj, cls=PlainJSONEncoder)` — or,
+    with `strict=True`, like `json.dumps(obj)` — and `loads` parses like
+    `json.loads`. A codec may format its output differently (whitespace,
+    escaping) but must produce the same values and reject the same
+    inputs. Invalid input to `loads` raises `json.JSONDecodeError`.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any, *, strict: bool = False) -> str:
+        return json.dumps(obj, cls=None if strict else PlainJSONEncoder)
+
+    def dumps_bytes(self, obj: Any, *, strict: bool = False) -> bytes:
+        return self.dumps(obj, strict=strict).encode()
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """JSONCodec backed by orjson.
+
+    Dates, times and dataclasses are passed through to the same `default`
+    that PlainJSONEncoder uses, so they format (or are refused)
+    identically. Anything orjson refuses — non-string dict keys, integers
+    past 64 bits, an unserializable value — is retried with the stdlib,
+    and so is any input it can't parse, so errors are the stdlib's too.
+
+    Where the two still differ: orjson writes enum members and, with
+    `strict=True`, UUIDs instead of refusing them, writes NaN and
+    infinities as null, and parses integers past 64 bits as floats.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson  # ty: ignore[unresolved-import]
+
+        self._orjson = orjson
+        self._option = (
+            orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        self._default = PlainJSONEncoder().default
+
+    def dumps(self, obj: Any, *, strict: bool = False) -> str:
+        return self.dumps_bytes(obj, strict=strict).decode()
+
+    def dumps_bytes(self, obj: Any, *, strict: bool = False) -> bytes:
+        try:
+            return self._orjson.dumps(
+                obj, default=None if strict else self._default, option=self._option
+            )
+        except TypeError:
+            return super().dumps(obj, strict=strict).encode()
+
+    def loads(self, data: str | bytes | bytearray) -> Any:
+        try:
+            return self._orjson.loads(data)
+        except self._orjson.JSONDecodeError:
+            return super().loads(data)
+
+
+@lru_cache
+def load_json_codec(name: str) -> JSONCodec:
+    """The codec for a JSON_CODEC value.
+
+    "auto" picks orjson when it is installed and quietly falls back to
+    the stdlib; "orjson" insists on it. Any other value is the import
+    path of a JSONCodec subclass.
+    """
+    if name == "json":
+        return JSONCodec()
+    if name in ("orjson", "auto"):
+        try:
+            return OrjsonCodec()
+        except ImportError:
+            if name == "auto":
+                return JSONCodec()
+            raise ImproperlyConfigured(
+                'JSON_CODEC = "orjson" requires the orjson package.'
+            )
+    try:
+        codec_class = import_string(name)
+    except ImportError as e:
+        raise ImproperlyConfigured(
+            f'JSON_CODEC must be "json", "orjson", "auto" or the import path of '
+            f"a JSONCodec subclass (got {name!r}): {e}"
+        ) from e
+    if not (isinstance(codec_class, type) and issubclass(codec_class, JSONCodec)):
+        raise ImproperlyConfigured(f"JSON_CODEC {name!r} is not a JSONCodec subclass.")
+    return codec_class()
+
+
+def get_json_codec() -> JSONCodec:
+    """The codec selected by the JSON_CODEC setting."""
+    return load_json_codec(settings.JSON_CODEC)
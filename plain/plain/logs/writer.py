@@ -0,0 +1,183 @@
+"""Queued log output: handlers on the hot path only enqueue, a background
+thread formats and writes.
+
+A `StreamHandler` writes and flushes inline, so when stdout backs up — a
+container log driver applying back-pressure, a full pipe — every thread
+that logs blocks on it, the server's event loop included, and with it
+every connection on the worker. `start_log_writer` moves a logger's
+stream handlers behind a `QueuedHandler` and has one `LogWriter` thread
+drain the queue in batches, writing each batch to each stream with a
+single `write()` and `flush()`.
+
+When the writer falls `queue_size` records behind, new records are
+dropped and counted rather than blocking the caller; the count is
+reported once the writer catches up.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import threading
+from collections.abc import Iterable
+from logging.handlers import QueueHandler
+from typing import Any, TextIO, cast
+
+# Records written per batch. Bounds how long one batch holds the
+# formatting work before the streams see any of it.
+BATCH_SIZE = 512
+
+# Queued after the last record so the writer drains everything, then exits.
+_STOP = object()
+
+_writer: LogWriter | None = None
+
+
+class QueuedHandler(QueueHandler):
+    """Enqueues records for the `LogWriter` to send through `handlers`."""
+
+    def __init__(self, writer: LogWriter, handlers: Iterable[logging.Handler]):
+        super().__init__(writer.queue)
+        self.writer = writer
+        self.handlers = tuple(handlers)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message now — args may be mutable objects that
+        # change before the writer gets to them — but leave formatting,
+        # exc_info included, to the writer's handlers. (The base class
+        # formats here and flattens the traceback into the message, for
+        # queues that cross a process boundary; this one doesn't.)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait((self.handlers, record))
+        except queue.Full:
+            self.writer.dropped += 1
+
+
+class LogWriter:
+    """Background thread that writes queued records in batches."""
+
+    def __init__(self, *, queue_size: int) -> None:
+        self.queue: queue.Queue[Any] = queue.Queue(maxsize=queue_size)
+        self.dropped = 0
+        self.attached: list[tuple[logging.Logger, QueuedHandler]] = []
+        self._thread = threading.Thread(
+            target=self._run, name="plain-log-writer", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Write everything queued so far, then end the thread.
+
+        The timeout bounds how long shutdown waits on a stream that is
+        still blocked; whatever hasn't been written by then is lost.
+        """
+        if not self._thread.is_alive():
+            return
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self.queue.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = _STOP in batch
+            self._write([item for item in batch if item is not _STOP])
+            if self.dropped:
+                self._report_dropped()
+            if stop:
+                return
+
+    def _write(
+        self, batch: list[tuple[tuple[logging.Handler, ...], logging.LogRecord]]
+    ) -> None:
+        # One write per stream per batch. Lines keep record order within
+        # a stream; records bound for other kinds of handlers (files,
+        # exporters) go through those handlers one by one.
+        pending: dict[TextIO, list[str]] = {}
+        for handlers, record in batch:
+            for handler in handlers:
+                if record.levelno < handler.level or not handler.filter(record):
+                    continue
+                # FileHandler and friends open and rotate their own streams.
+                if type(handler) is not logging.StreamHandler:
+                    handler.handle(record)
+                    continue
+                handler = cast(logging.StreamHandler[TextIO], handler)
+                try:
+                    line = handler.format(record) + handler.terminator
+                except Exception:
+                    handler.handleError(record)
+                    continue
+                pending.setdefault(handler.stream, []).append(line)
+
+        for stream, lines in pending.items():
+            try:
+                stream.write("".join(lines))
+                stream.flush()
+            except (OSError, ValueError):
+                # A closed or broken stream: nothing to report it on.
+                pass
+
+    def _report_dropped(self) -> None:
+        dropped, self.dropped = self.dropped, 0
+        logging.getLogger("plain.logs").warning(
+            "Log records dropped", extra={"count": dropped}
+        )
+
+
+def start_log_writer(loggers: Iterable[logging.Logger], *, queue_size: int) -> None:
+    """Route the stream handlers of `loggers` through a background writer.
+
+    Other handlers stay where they are — an OpenTelemetry handler, for
+    one, reads the active span when the record is emitted, which a
+    background thread can't see.
+    """
+    global _writer
+    stop_log_writer()
+
+    writer = LogWriter(queue_size=queue_size)
+    for logger in loggers:
+        streams = [h for h in logger.handlers if isinstance(h, logging.StreamHandler)]
+        if not streams:
+            continue
+        for handler in streams:
+            logger.removeHandler(handler)
+        queued = QueuedHandler(writer, streams)
+        logger.addHandler(queued)
+        writer.attached.append((logger, queued))
+
+    writer.start()
+    _writer = writer
+
+
+def stop_log_writer() -> None:
+    """Flush and stop the background writer, putting the handlers back."""
+    global _writer
+    if _writer is None:
+        return
+    writer, _writer = _writer, None
+    # Detach first so nothing is queued behind the stop marker.
+    for logger, queued in writer.attached:
+        logger.removeHandler(queued)
+        for handler in queued.handlers:
+            logger.addHandler(handler)
+    writer.stop()
+
+
+atexit.register(stop_log_writer)
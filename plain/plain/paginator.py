@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import collections.abc
+import datetime
+import decimal
+import functools
 import inspect
+import json
+import operator
+import uuid
 import warnings
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from functools import cached_property
 from math import ceil
 from typing import Any
 
+from plain.signing import BadSignature, JSONSerializer, Signer
 from plain.utils.inspect import method_has_no_args
 
 
@@ -27,6 +34,10 @@ class EmptyPage(InvalidPage):
     pass
 
 
+class InvalidCursor(InvalidPage):
+    pass
+
+
 class Paginator:
     def __init__(
         self,
@@ -34,12 +45,18 @@ class Paginator:
         per_page: int,
         orphans: int = 0,
         allow_empty_first_page: bool = True,
+        estimate_count: bool = False,
     ) -> None:
         self.object_list = object_list
         self._check_object_list_is_ordered()
         self.per_page = int(per_page)
         self.orphans = int(orphans)
         self.allow_empty_first_page = allow_empty_first_page
+        self.estimate_count = estimate_count
+        # What the pages fetched so far say about the real total, which an
+        # estimated count can miss in either direction.
+        self._min_count = 0
+        self._max_count: int | None = None
 
     def __iter__(self) -> Iterator[Page]:
         for page_number in self.page_range:
@@ -55,7 +72,9 @@ class Paginator:
             raise PageNotAnInteger("That page number is not an integer")
         if number < 1:
             raise EmptyPage("That page number is less than 1")
-        if number > self.num_pages:
+        # An estimated count can be short, so pages past it may still have
+        # results -- and a page past the end is just empty.
+        if not self.estimate_count and number > self.num_pages:
             raise EmptyPage("That page contains no results")
         return number
 
@@ -77,6 +96,22 @@ class Paginator:
         number = self.validate_number(number)
         bottom = (number - 1) * self.per_page
         top = bottom + self.per_page
+        if self.estimate_count:
+            # The estimate can't say whether there is a next page, so fetch
+            # one extra row to find out.
+            rows = list(self.object_list[bottom : top + 1])
+            has_next = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            if has_next:
+                self._min_count = max(self._min_count, top + 1)
+            elif rows:
+                self._min_count = self._max_count = bottom + len(rows)
+            else:
+                self._max_count = min(self._max_count or bottom, bottom)
+            if "count" in self.__dict__:
+                self.count = self._fit_estimate(self.count)
+                self.__dict__.pop("num_pages", None)
+            return self._get_page(rows, number, self, has_next=has_next)
         if top + self.orphans >= self.count:
             top = self.count
         return self._get_page(self.object_list[bottom:top], number, self)
@@ -92,12 +127,28 @@ class Paginator:
 
     @cached_property
     def count(self) -> int:
-        """Return the total number of objects, across all pages."""
+        """
+        Return the total number of objects, across all pages.
+
+        With `estimate_count`, a queryset's `estimated_count()` is used
+        instead, so large tables aren't scanned on every page view.
+        """
+        if self.estimate_count:
+            estimated = getattr(self.object_list, "estimated_count", None)
+            if callable(estimated):
+                return self._fit_estimate(estimated())
         c = getattr(self.object_list, "count", None)
         if callable(c) and not inspect.isbuiltin(c) and method_has_no_args(c):
             return c()
         return len(self.object_list)
 
+    def _fit_estimate(self, count: int) -> int:
+        """Move an estimated count into the range the fetched pages allow."""
+        count = max(count, self._min_count)
+        if self._max_count is not None:
+            count = min(count, self._max_count)
+        return count
+
     @cached_property
     def num_pages(self) -> int:
         """Return the total number of pages."""
@@ -134,10 +185,18 @@ class Paginator:
 
 
 class Page(collections.abc.Sequence):
-    def __init__(self, object_list: Any, number: int, paginator: Paginator) -> None:
+    def __init__(
+        self,
+        object_list: Any,
+        number: int,
+        paginator: Paginator,
+        *,
+        has_next: bool | None = None,
+    ) -> None:
         self.object_list = object_list
         self.number = number
         self.paginator = paginator
+        self._has_next = has_next
 
     def __repr__(self) -> str:
         return f"<Page {self.number} of {self.paginator.num_pages}>"
@@ -157,6 +216,8 @@ class Page(collections.abc.Sequence):
         return self.object_list[index]
 
     def has_next(self) -> bool:
+        if self._has_next is not None:
+            return self._has_next
         return self.number < self.paginator.num_pages
 
     def has_previous(self) -> bool:
@@ -179,6 +240,8 @@ class Page(collections.abc.Sequence):
         # Special case, return zero if no items.
         if self.paginator.count == 0:
             return 0
+        if self.paginator.estimate_count and not self:
+            return 0
         return (self.paginator.per_page * (self.number - 1)) + 1
 
     def end_index(self) -> int:
@@ -186,7 +249,232 @@ class Page(collections.abc.Sequence):
         Return the 1-based index of the last object on this page,
         relative to total objects found (hits).
         """
+        # An estimated total can be off, but the rows on the page are known.
+        if self.paginator.estimate_count:
+            return self.start_index() + len(self) - 1 if self else 0
         # Special case for the last page because there can be orphans.
         if self.number == self.paginator.num_pages:
             return self.paginator.count
         return self.number * self.paginator.per_page
+
+
+class _CursorSerializer(JSONSerializer):
+    """
+    JSON for cursor key values. Unlike PlainJSONEncoder, datetimes keep their
+    full microsecond precision -- a truncated key would skip or repeat rows.
+    """
+
+    @staticmethod
+    def _default(o: Any) -> Any:
+        if isinstance(o, datetime.datetime | datetime.date | datetime.time):
+            return o.isoformat()
+        if isinstance(o, decimal.Decimal | uuid.UUID):
+            return str(o)
+        raise TypeError(f"Cannot use {type(o).__name__} as a cursor key value")
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=self._default).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data.decode())
+
+
+class KeysetPaginator:
+    """
+    Paginate a queryset by key instead of by offset.
+
+    `ordering` is a set of `order_by()` columns whose values are unique and
+    non-null together, like `("-created_at", "-id")`. Each page is fetched
+    with a `WHERE` on the keys of the previous page's edge row, so a deep page
+    costs the same as the first one (given an index on those columns) and the
+    total is never counted. Pages are addressed by opaque, signed cursors
+    rather than numbers.
+
+    For a model queryset, a foreign key orders and pages by its raw key
+    value, and orderings through a relation (`"author__name"`) are rejected.
+    """
+
+    def __init__(
+        self,
+        object_list: Any,
+        per_page: int,
+        ordering: Sequence[str],
+    ) -> None:
+        if not ordering:
+            raise ValueError("KeysetPaginator needs at least one ordering key")
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+        self.key_fields = self._key_fields()
+        self.signer = Signer(salt="plain.paginator.KeysetPaginator")
+
+    def _key_fields(self) -> dict[str, Any]:
+        """
+        The model field behind each key, or None for an annotation or a
+        non-queryset list. A key that is neither fails here, not when a
+        cursor is built.
+        """
+        names = [field.lstrip("-") for field in self.ordering]
+        model = getattr(self.object_list, "model", None)
+        meta = getattr(model, "_model_meta", None)
+        if meta is None:
+            return dict.fromkeys(names)
+        fields = {field.name: field for field in meta.concrete_fields}
+        annotations = self.object_list.sql_query.annotations
+        for name in names:
+            if name not in fields and name not in annotations:
+                raise ValueError(
+                    f"KeysetPaginator can't order by {name!r}: keys must be "
+                    f"columns or annotations on {meta.model.__name__}"
+                )
+        return {name: fields.get(name) for name in names}
+
+    def get_page(self, cursor: str | None) -> KeysetPage:
+        """Return the page for a cursor, or the first page if it isn't valid."""
+        try:
+            return self.page(cursor)
+        except InvalidCursor:
+            return self.page(None)
+
+    def page(self, cursor: str | None) -> KeysetPage:
+        """Return the page for a cursor, or the first page for `None`."""
+        if not cursor:
+            rows = list(self.object_list.order_by(*self.ordering)[: self.per_page + 1])
+            return self._get_page(
+                rows[: self.per_page],
+                self,
+                has_next=len(rows) > self.per_page,
+                has_previous=False,
+            )
+
+        forward, keys = self.decode_cursor(cursor)
+        ordering = self.ordering if forward else _reverse_ordering(self.ordering)
+        rows = list(
+            self._after(ordering, keys).order_by(*ordering)[: self.per_page + 1]
+        )
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page]
+        if forward:
+            # An empty page past the end has no row to build a cursor from.
+            return self._get_page(
+                rows, self, has_next=has_more, has_previous=bool(rows)
+            )
+        if not rows:
+            # Everything before the cursor is gone -- start over.
+            return self.page(None)
+        rows.reverse()
+        return self._get_page(rows, self, has_next=True, has_previous=has_more)
+
+    def _get_page(self, *args: Any, **kwargs: Any) -> KeysetPage:
+        """
+        Return an instance of a single page.
+
+        This hook can be used by subclasses to use an alternative to the
+        standard :cls:`KeysetPage` object.
+        """
+        return KeysetPage(*args, **kwargs)
+
+    def _after(self, ordering: tuple[str, ...], keys: list[Any]) -> Any:
+        """
+        Filter to the rows after `keys` in `ordering`:
+        `a > x OR (a = x AND b > y) OR ...`, flipping `>` for descending keys.
+        """
+        branches = []
+        for i, field in enumerate(ordering):
+            lookups = {ordering[j].lstrip("-"): keys[j] for j in range(i)}
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            lookups[f"{name}__{lookup}"] = keys[i]
+            branches.append(self.object_list.filter(**lookups))
+        return functools.reduce(operator.or_, branches)
+
+    def encode_cursor(self, obj: Any, *, forward: bool) -> str:
+        """A cursor for the rows after (`forward`) or before `obj`."""
+        keys = [_key_value(obj, name, field) for name, field in self.key_fields.items()]
+        return self.signer.sign_object(
+            {"o": self.ordering, "f": forward, "k": keys},
+            serializer=_CursorSerializer,
+        )
+
+    def decode_cursor(self, cursor: str) -> tuple[bool, list[Any]]:
+        """Return `(forward, keys)` for a cursor made by this paginator."""
+        try:
+            data = self.signer.unsign_object(
+                cursor,
+                serializer=_CursorSerializer,
+            )
+        except (BadSignature, ValueError):
+            raise InvalidCursor("That cursor is not valid")
+        # A cursor from a different ordering would land somewhere arbitrary.
+        if (
+            not isinstance(data, dict)
+            or data.get("o") != list(self.ordering)
+            or not isinstance(data.get("f"), bool)
+            or not isinstance(data.get("k"), list)
+            or len(data["k"]) != len(self.ordering)
+        ):
+            raise InvalidCursor("That cursor is not valid for this ordering")
+        return data["f"], data["k"]
+
+
+class KeysetPage(collections.abc.Sequence):
+    def __init__(
+        self,
+        object_list: list[Any],
+        paginator: KeysetPaginator,
+        *,
+        has_next: bool,
+        has_previous: bool,
+    ) -> None:
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self) -> str:
+        return f"<KeysetPage of {len(self)}>"
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if not isinstance(index, int | slice):
+            raise TypeError(
+                f"Page indices must be integers or slices, not {type(index).__name__}."
+            )
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self._has_next
+
+    def has_previous(self) -> bool:
+        return self._has_previous
+
+    def has_other_pages(self) -> bool:
+        return self.has_previous() or self.has_next()
+
+    @cached_property
+    def next_cursor(self) -> str | None:
+        if not self.has_next():
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1], forward=True)
+
+    @cached_property
+    def previous_cursor(self) -> str | None:
+        if not self.has_previous():
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], forward=False)
+
+
+def _reverse_ordering(ordering: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(f[1:] if f.startswith("-") else f"-{f}" for f in ordering)
+
+
+def _key_value(obj: Any, name: str, field: Any) -> Any:
+    # values() querysets yield dicts, everything else is attribute access --
+    # except model fields, where a foreign key would give the related object.
+    if isinstance(obj, dict):
+        return obj[name]
+    if field is not None:
+        return field.value_from_object(obj)
+    return getattr(obj, name)
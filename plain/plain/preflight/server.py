@@ -28,6 +28,36 @@ class CheckServerKeepaliveTimeout(PreflightCheck):
         ]
 
 
+@register_check(name="server.http_parser")
+class CheckServerHTTPParser(PreflightCheck):
+    """SERVER_HTTP_PARSER must name a parser that can be loaded."""
+
+    def run(self) -> list[PreflightResult]:
+        from plain.exceptions import ImproperlyConfigured
+        from plain.server.http.parsers import get_request_parser
+
+        try:
+            get_request_parser(settings.SERVER_HTTP_PARSER)
+        except ImproperlyConfigured as e:
+            return [PreflightResult(fix=str(e), id="server.http_parser_invalid")]
+        return []
+
+
+@register_check(name="server.event_loop")
+class CheckServerEventLoop(PreflightCheck):
+    """SERVER_EVENT_LOOP must name a loop that can be loaded."""
+
+    def run(self) -> list[PreflightResult]:
+        from plain.exceptions import ImproperlyConfigured
+        from plain.server.eventloop import get_loop_factory
+
+        try:
+            get_loop_factory(settings.SERVER_EVENT_LOOP)
+        except ImproperlyConfigured as e:
+            return [PreflightResult(fix=str(e), id="server.event_loop_invalid")]
+        return []
+
+
 @register_check(name="server.body_limits")
 class CheckServerBodyLimits(PreflightCheck):
     """The server body-size settings must compose into workable limits.
@@ -100,3 +130,70 @@ class CheckServerBodyLimits(PreflightCheck):
                 )
             )
         return results
+
+
+@register_check(name="server.executor_pools")
+class CheckServerExecutorPools(PreflightCheck):
+    """SERVER_EXECUTOR_POOLS must be valid, and every view's
+    `executor_pool` must name one of its pools."""
+
+    def run(self) -> list[PreflightResult]:
+        from plain.exceptions import ImproperlyConfigured
+        from plain.internal.handlers.pools import parse_executor_pools
+        from plain.urls import get_resolver
+
+        try:
+            pools = parse_executor_pools(settings.SERVER_EXECUTOR_POOLS)
+        except ImproperlyConfigured as e:
+            return [PreflightResult(fix=str(e), id="server.executor_pools_invalid")]
+
+        results = []
+        patterns = list(get_resolver().url_patterns)
+        while patterns:
+            pattern = patterns.pop()
+            if children := getattr(pattern, "url_patterns", None):
+                patterns.extend(children)
+                continue
+            view_class = getattr(pattern, "view_class", None)
+            if view_class is None:
+                continue
+            name = getattr(view_class, "executor_pool", None)
+            if name is not None and name not in pools:
+                results.append(
+                    PreflightResult(
+                        fix=f"{view_class.__qualname__}.executor_pool is {name!r}, "
+                        "which isn't in SERVER_EXECUTOR_POOLS.",
+                        id="server.executor_pool_unknown",
+                    )
+                )
+        return results
+
+
+@register_check(name="server.stream_request_body")
+class CheckServerStreamRequestBody(PreflightCheck):
+    """A view's `stream_request_body` only applies to its async handlers."""
+
+    def run(self) -> list[PreflightResult]:
+        import inspect
+
+        from plain.internal.handlers.base import _routed_view_classes
+
+        results = []
+        for view_class in _routed_view_classes():
+            if not getattr(view_class, "stream_request_body", False):
+                continue
+            if not any(
+                inspect.iscoroutinefunction(getattr(view_class, name))
+                for name in getattr(view_class, "implemented_methods", ())
+            ):
+                results.append(
+                    PreflightResult(
+                        fix=f"{view_class.__qualname__} sets stream_request_body "
+                        "but has no async handlers, so its request bodies are "
+                        "received in full before it runs. Make the handlers "
+                        "that read the body async.",
+                        id="server.stream_request_body_sync",
+                        warning=True,
+                    )
+                )
+        return results
@@ -52,3 +52,18 @@ class CheckUnusedEnvVars(PreflightCheck):
                 )
 
         return results
+
+
+@register_check(name="settings.json_codec")
+class CheckJSONCodec(PreflightCheck):
+    """JSON_CODEC must name a codec that can be loaded."""
+
+    def run(self) -> list[PreflightResult]:
+        from plain.exceptions import ImproperlyConfigured
+        from plain.json import load_json_codec
+
+        try:
+            load_json_codec(settings.JSON_CODEC)
+        except ImproperlyConfigured as e:
+            return [PreflightResult(fix=str(e), id="settings.json_codec_invalid")]
+        return []
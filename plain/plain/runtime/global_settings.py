@@ -83,6 +83,13 @@ HTTP_X_FORWARDED_HOST: bool = False
 HTTP_X_FORWARDED_PORT: bool = False
 HTTP_X_FORWARDED_FOR: bool = False
 
+# Whether to use the X-Request-Start header (set by Heroku's router, or
+# nginx/Apache with `t=${msec}`-style config) as the start of a request's
+# queue time, so time spent waiting at the proxy counts toward
+# SERVER_MAX_QUEUE_WAIT and the queue duration metric. Only enable this
+# behind a proxy that sets it.
+HTTP_X_REQUEST_START: bool = False
+
 # A secret key for this particular Plain installation. Used in secret-key
 # hashing algorithms. Set this in your settings, or Plain will complain
 # loudly.
@@ -101,6 +108,14 @@ SECRET_KEY_FALLBACKS: Secret[list[str]] = []
 TIME_ZONE: str = "UTC"
 
 
+# MARK: JSON
+
+# JSON codec used for JsonResponse, request.json_data and JSON columns:
+# "json" (the stdlib), "orjson" (requires the orjson package), "auto"
+# (orjson when it's installed) or the import path of a JSONCodec subclass.
+JSON_CODEC: str = "json"
+
+
 # MARK: URL Configuration
 
 # The base URL of the site, used to generate absolute URLs outside of request contexts.
@@ -182,6 +197,12 @@ SERVER_ACCESS_LOG_FIELDS: list[str] = [
     "user_agent",
     "referer",
 ]
+# Records a worker's log writer thread may fall behind by. Server workers
+# hand stdout/stderr log output (access log included) to a background
+# thread, so a slow or blocked stream never stalls request handling;
+# records past this backlog are dropped and counted instead of waiting.
+# 0 = write synchronously on the logging thread.
+SERVER_LOG_QUEUE_SIZE: int = 10000
 SERVER_GRACEFUL_TIMEOUT: int = 30
 # Idle timeout (seconds) for connections with no request in progress:
 # HTTP/1.1 connections waiting for a request (first or keep-alive reuse)
@@ -237,6 +258,30 @@ SERVER_MAX_INFLIGHT_BODY_SIZE: int | None = 1073741824  # i.e. 1 GB
 # trip it). Violations get a 408. 0 = disabled. Default matches
 # Kestrel's MinRequestBodyDataRate.
 SERVER_BODY_MIN_BYTES_PER_SECOND: int = 240
+# HTTP/1 request-head parser: "python" (the reference) or "httptools"
+# (llhttp, requires the httptools package). Any request the accelerated
+# parser isn't certain about is parsed by the reference, so both accept
+# and reject exactly the same requests.
+SERVER_HTTP_PARSER: str = "python"
+# Event loop for server workers: "asyncio" (the stdlib loop), "uvloop"
+# (requires the uvloop package) or "auto" (uvloop when it's installed).
+SERVER_EVENT_LOOP: str = "asyncio"
+# Load shedding. Requests whose pipeline would start more than this many
+# seconds after they arrived get a 503 with Retry-After instead of
+# running — under overload the client has usually given up, and serving
+# it anyway only delays the requests queued behind. None = never shed.
+SERVER_MAX_QUEUE_WAIT: float | None = None
+# Shed new requests with an immediate 503 while this many are already
+# waiting for a worker thread. None = no limit. HEALTHCHECK_PATH is never
+# shed by either limit.
+SERVER_MAX_QUEUE_DEPTH: int | None = None
+# Extra thread pools per worker, for views that set `executor_pool` to
+# one of these names — a bulkhead so a slow endpoint can only tie up its
+# own pool's threads, not the SERVER_THREADS every other view runs on.
+# Each pool has "threads" and an optional "max_queue": with that many
+# requests already waiting for one of its threads, more get a 503.
+# Example: {"exports": {"threads": 2, "max_queue": 10}}
+SERVER_EXECUTOR_POOLS: dict = {}
 
 # MARK: Preflight Checks
 
@@ -4,6 +4,7 @@ import datetime
 import logging
 import sys
 import traceback
+from collections.abc import Callable
 from typing import Any
 
 from plain.logs import get_framework_logger
@@ -12,6 +13,8 @@ from plain.logs import get_framework_logger
 log = get_framework_logger()
 access_log = get_framework_logger("plain.server.access")
 
+_FieldGetter = Callable[[Any, Any, datetime.timedelta], Any]
+
 # Maps field names that come from request headers
 _HEADER_FIELDS = {
     "user_agent": "USER-AGENT",
@@ -27,6 +30,73 @@ def _get_header(req: Any, header_name: str) -> str:
     return ""
 
 
+def _status(resp: Any, req: Any, request_time: datetime.timedelta) -> int:
+    status = resp.status
+    if isinstance(status, str):
+        status = status.split(None, 1)[0]
+    return int(status)
+
+
+def _ip(resp: Any, req: Any, request_time: datetime.timedelta) -> str:
+    if isinstance(req.peer_addr, tuple):
+        return req.peer_addr[0]
+    elif isinstance(req.peer_addr, str):
+        return req.peer_addr
+    return ""
+
+
+def _url(resp: Any, req: Any, request_time: datetime.timedelta) -> str:
+    if req.query:
+        return f"{req.path}?{req.query}"
+    return req.path
+
+
+_FIELD_GETTERS: dict[str, _FieldGetter] = {
+    "method": lambda resp, req, request_time: req.method,
+    "path": lambda resp, req, request_time: req.path,
+    "status": _status,
+    "duration_ms": lambda resp, req, request_time: int(
+        request_time.total_seconds() * 1000
+    ),
+    "size": lambda resp, req, request_time: getattr(resp, "sent", None) or 0,
+    "ip": _ip,
+    "url": _url,
+    "query": lambda resp, req, request_time: req.query or "",
+    "protocol": lambda resp, req, request_time: (
+        f"HTTP/{req.version[0]}.{req.version[1]}"
+    ),
+}
+
+# The getters for the configured fields, built on first use and rebuilt
+# only if SERVER_ACCESS_LOG_FIELDS changes.
+_compiled: tuple[tuple[str, ...], list[tuple[str, _FieldGetter]]] = ((), [])
+
+
+def _header_getter(header_name: str) -> _FieldGetter:
+    return lambda resp, req, request_time: _get_header(req, header_name)
+
+
+def _compile_fields(fields: tuple[str, ...]) -> list[tuple[str, _FieldGetter]]:
+    getters = []
+    for field in fields:
+        if getter := _FIELD_GETTERS.get(field):
+            getters.append((field, getter))
+        elif header_name := _HEADER_FIELDS.get(field):
+            getters.append((field, _header_getter(header_name)))
+        # Unknown fields are ignored.
+    return getters
+
+
+def _field_getters() -> list[tuple[str, _FieldGetter]]:
+    global _compiled
+    from plain.runtime import settings
+
+    fields = tuple(settings.SERVER_ACCESS_LOG_FIELDS)
+    if fields != _compiled[0]:
+        _compiled = (fields, _compile_fields(fields))
+    return _compiled[1]
+
+
 def log_access(
     resp: Any,
     req: Any,
@@ -36,43 +106,9 @@ def log_access(
     if not access_log.handlers or not access_log.isEnabledFor(logging.INFO):
         return
 
-    from plain.runtime import settings
-
-    status = resp.status
-    if isinstance(status, str):
-        status = status.split(None, 1)[0]
-
-    context: dict[str, Any] = {}
-
-    for field in settings.SERVER_ACCESS_LOG_FIELDS:
-        if field == "method":
-            context["method"] = req.method
-        elif field == "path":
-            context["path"] = req.path
-        elif field == "status":
-            context["status"] = int(status)
-        elif field == "duration_ms":
-            context["duration_ms"] = int(request_time.total_seconds() * 1000)
-        elif field == "size":
-            context["size"] = getattr(resp, "sent", None) or 0
-        elif field == "ip":
-            if isinstance(req.peer_addr, tuple):
-                context["ip"] = req.peer_addr[0]
-            elif isinstance(req.peer_addr, str):
-                context["ip"] = req.peer_addr
-            else:
-                context["ip"] = ""
-        elif field == "url":
-            if req.query:
-                context["url"] = f"{req.path}?{req.query}"
-            else:
-                context["url"] = req.path
-        elif field == "query":
-            context["query"] = req.query or ""
-        elif field == "protocol":
-            context["protocol"] = f"HTTP/{req.version[0]}.{req.version[1]}"
-        elif header_name := _HEADER_FIELDS.get(field):
-            context[field] = _get_header(req, header_name)
+    context = {
+        field: getter(resp, req, request_time) for field, getter in _field_getters()
+    }
 
     try:
         access_log.info("Request", extra=context)
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING
 
 from . import util
 
 if TYPE_CHECKING:
     from .app import ServerApplication
+    from .protocol import ConnectionProtocol, ConnectionWriter
 
 # Per-recv progress timeout (seconds) while actively reading a request's
 # headers or body — slowloris protection, paired with HEADER_READ_TIMEOUT
@@ -26,8 +26,8 @@ class Connection:
     def __init__(
         self,
         app: ServerApplication,
-        reader: asyncio.StreamReader,
-        writer: asyncio.StreamWriter,
+        reader: ConnectionProtocol,
+        writer: ConnectionWriter,
         client: tuple[str, int],
         server: tuple[str, int],
         *,
@@ -43,13 +43,11 @@ class Connection:
         self.is_ssl: bool = is_ssl
         self.req_count: int = 0
 
-        # Bytes read by wait_readable()'s peek, handed back by the next
-        # recv() calls so the peek is never lost — recv() drains this
-        # before touching the reader, so callers don't need to know.
-        # _peek_offset is the consumed prefix: advancing it instead of
-        # re-slicing keeps draining a large peek in small reads O(n).
-        self._peeked: bytes = b""
-        self._peek_offset = 0
+        # Per-recv base timeout of the read phase in progress — what a
+        # worker shutdown landing mid-read shortens the pending read to
+        # (capped by the drain deadline; see h1._recv_timeout). Set by
+        # the h1 loop as it moves between idle, header and body reads.
+        self.recv_base: float = RECV_PROGRESS_TIMEOUT
 
         # True while the current request is a HEAD — latched from the
         # request line the moment its header bytes are read, before any
@@ -63,23 +61,12 @@ class Connection:
         if not self.writer.is_closing():
             self.writer.close()
 
-    async def recv(self, n: int) -> bytes:
-        """Read up to n bytes from a connection."""
-        if self._peeked:
-            available = len(self._peeked) - self._peek_offset
-            if available <= n:
-                data = (
-                    self._peeked[self._peek_offset :]
-                    if self._peek_offset
-                    else self._peeked
-                )
-                self._peeked = b""
-                self._peek_offset = 0
-            else:
-                data = self._peeked[self._peek_offset : self._peek_offset + n]
-                self._peek_offset += n
-            return data
-        return await self.reader.read(n)
+    async def recv(self, n: int, timeout: float | None = None) -> bytes:
+        """Read up to n bytes from a connection.
+
+        Raises TimeoutError when nothing arrives within `timeout`.
+        """
+        return await self.reader.read(n, timeout)
 
     async def sendall(self, data: bytes) -> None:
         """Send all bytes on a connection."""
@@ -97,23 +84,13 @@ class Connection:
             )
         )
 
-    async def wait_readable(self) -> bool:
+    async def wait_readable(self, timeout: float | None = None) -> bool:
         """Wait for the next request's bytes; True when bytes arrived.
 
-        The peeked bytes are handed back by the next recv() calls.
-        Returns False on EOF (the peer closed). Reads a full segment
-        rather than one byte so a small request usually needs no second
-        reader round trip.
+        Nothing is consumed — the bytes stay in the reader's buffer for
+        the header read. Bytes already buffered (e.g. a pipelined
+        request behind an exactly-consumed body) ARE the next request,
+        so those return at once. Returns False on EOF (the peer closed);
+        raises TimeoutError when nothing arrives within `timeout`.
         """
-        if self._peeked:
-            # Bytes from a previous peek are still buffered (e.g. a
-            # pipelined request behind an exactly-consumed body) — they
-            # ARE the next request; blocking on the socket would strand
-            # them until the idle timeout.
-            return True
-        data = await self.reader.read(65536)
-        if data:
-            self._peeked = data
-            self._peek_offset = 0
-            return True
-        return False
+        return await self.reader.wait_readable(timeout)
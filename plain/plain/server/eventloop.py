@@ -0,0 +1,33 @@
+"""Event loop selection for server workers (SERVER_EVENT_LOOP)."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+
+from plain.exceptions import ImproperlyConfigured
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+
+def get_loop_factory(name: str) -> LoopFactory | None:
+    """The loop factory for a SERVER_EVENT_LOOP value (None = stdlib asyncio).
+
+    "auto" picks uvloop when it is installed and quietly falls back to
+    asyncio; "uvloop" insists on it.
+    """
+    if name == "asyncio":
+        return None
+    if name in ("uvloop", "auto"):
+        try:
+            import uvloop  # ty: ignore[unresolved-import]
+        except ImportError:
+            if name == "auto":
+                return None
+            raise ImproperlyConfigured(
+                'SERVER_EVENT_LOOP = "uvloop" requires the uvloop package.'
+            )
+        return uvloop.new_event_loop
+    raise ImproperlyConfigured(
+        f'SERVER_EVENT_LOOP must be "asyncio", "uvloop" or "auto" (got {name!r}).'
+    )
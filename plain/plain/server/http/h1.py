@@ -7,6 +7,7 @@ import time
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from plain.http import BadRequestError400, ContentTooLargeError413, UnreadablePostError
 from plain.logs import get_framework_logger
 
 from ..accesslog import log_access
@@ -30,9 +31,9 @@ from .errors import (
     UnsupportedTransferCoding,
 )
 from .message import LIMIT_REQUEST_FIELD_SIZE, LIMIT_REQUEST_FIELDS, Request
-from .request import create_request
+from .request import _resolve_path, create_request
 from .response import Response
-from .sink import BodyRateFloor, BodySink, ChunkedDecoder
+from .sink import BodyBudget, BodyRateFloor, BodySink, ChunkedDecoder
 
 if TYPE_CHECKING:
     from ..workers.worker import Worker
@@ -83,6 +84,14 @@ HEADER_READ_TIMEOUT = 10
 # from consuming unbounded memory.
 MAX_HEADER_SIZE = LIMIT_REQUEST_FIELDS * (LIMIT_REQUEST_FIELD_SIZE + 2) + 4
 
+# Read-ahead granularity of the header phase. The header block is
+# consumed from the reader's buffer in steps of this size, so body_start
+# holds the bytes past the boundary up to the end of the last step — what
+# the body phase treats as already read (a pipelined tail there gets
+# Connection: close). Bytes beyond stay buffered for bounded body reads
+# and, once a body is consumed exactly, the next keep-alive request.
+HEADER_RECV_SIZE = 8192
+
 # Lingering-close bounds for a request rejected before its body was read
 # (e.g. 413). A client that doesn't use Expect: 100-continue is already
 # sending the body, and closing with unread bytes in the socket sends an
@@ -135,10 +144,7 @@ async def _linger_discard(worker: Worker, conn: Connection) -> None:
         if remaining <= 0:
             break
         try:
-            data = await asyncio.wait_for(
-                conn.recv(65536),
-                timeout=min(remaining, _recv_timeout(worker)),
-            )
+            data = await conn.recv(65536, min(remaining, _recv_timeout(worker)))
         except (TimeoutError, OSError):
             break
         if not data:
@@ -154,10 +160,9 @@ async def _wait_for_next_request(
     """Park on an idle connection until the next request starts.
 
     Runs before every request, the first on a fresh connection included.
-    Returns True when request bytes have arrived (peeked by
-    wait_readable, handed back by the next recv calls), False when the
-    connection should close — idle timeout, shutdown, EOF, or a socket
-    error.
+    Returns True when request bytes have arrived (left buffered in the
+    reader for async_read_headers), False when the connection should
+    close — idle timeout, shutdown, EOF, or a socket error.
 
     The idle window is worker.keepalive_timeout — long, so the router is
     always the side that closes an idle pooled connection (see
@@ -166,25 +171,18 @@ async def _wait_for_next_request(
     wait to one _recv_timeout grace — the same window every drain read
     gets, so it tightens as a published kill deadline approaches: a
     request already in flight is served (framed Connection: close by
-    dispatch), otherwise the connection closes promptly.
+    dispatch), otherwise the connection closes promptly. A shutdown
+    landing mid-wait shortens it via handle_connection's callback.
     """
-    idle_read = asyncio.get_running_loop().create_task(conn.wait_readable())
+    conn.recv_base = RECV_PROGRESS_TIMEOUT
+    if shutdown_wait.done():
+        timeout = _recv_timeout(worker)
+    else:
+        timeout = worker.keepalive_timeout
     try:
-        await asyncio.wait(
-            (idle_read, shutdown_wait),
-            timeout=worker.keepalive_timeout,
-            return_when=asyncio.FIRST_COMPLETED,
-        )
-        if not idle_read.done() and shutdown_wait.done():
-            await asyncio.wait((idle_read,), timeout=_recv_timeout(worker))
-        return idle_read.done() and idle_read.exception() is None and idle_read.result()
-    finally:
-        idle_read.cancel()
-        if idle_read.done() and not idle_read.cancelled():
-            # Retrieve any exception so a connection task cancelled during
-            # drain in the same tick idle_read failed (e.g. a client RST)
-            # doesn't log "Task exception was never retrieved".
-            idle_read.exception()
+        return await conn.wait_readable(timeout)
+    except (TimeoutError, OSError):
+        return False
 
 
 def _expects_continue(req: Request) -> bool:
@@ -218,7 +216,12 @@ async def async_read_headers(worker: Worker, conn: Connection) -> tuple[bytes, b
     for HEAD (RFC 9110 9.3.2).
     """
     conn.request_is_head = False
-    buf = bytearray()
+    conn.recv_base = RECV_PROGRESS_TIMEOUT
+    # Scan the reader's buffer in place: data_received appends to it
+    # directly, so waiting for more bytes costs no per-recv chunk, and
+    # only the finished header block (and any read-ahead) is copied out.
+    reader = conn.reader
+    buf = reader.buffer
     scan_from = 0
     header_deadline = time.monotonic() + HEADER_READ_TIMEOUT
     while True:
@@ -240,7 +243,8 @@ async def async_read_headers(worker: Worker, conn: Connection) -> tuple[bytes, b
             # since passed — the deadline only stops us waiting for more.
             header_end = idx + 4
             conn.request_is_head = buf.startswith(b"HEAD ")
-            return bytes(buf[:header_end]), bytes(buf[header_end:])
+            read_ahead = -(-header_end // HEADER_RECV_SIZE) * HEADER_RECV_SIZE
+            return reader.take(header_end), reader.take(read_ahead - header_end)
 
         if len(buf) > MAX_HEADER_SIZE:
             conn.request_is_head = buf.startswith(b"HEAD ")
@@ -258,20 +262,131 @@ async def async_read_headers(worker: Worker, conn: Connection) -> tuple[bytes, b
         # connection); a request not yet started keeps the keepalive wait.
         if buf and _drain_expired(worker):
             raise TimeoutError("Drain deadline exceeded during header read")
+        buffered = len(buf)
         try:
-            data = await asyncio.wait_for(
-                conn.recv(8192),
-                timeout=min(remaining, _recv_timeout(worker)),
-            )
+            await reader.wait_for_data(min(remaining, _recv_timeout(worker)))
         except TimeoutError:
             if buf:
                 worker.log.debug("Slow client timed out during header read")
             raise
-        if not data:
+        if len(buf) == buffered:
+            # EOF — nothing new arrived.
             return b"", b""
 
-        scan_from = max(0, len(buf) - 3)
-        buf.extend(data)
+        scan_from = max(0, buffered - 3)
+
+
+class _BodyReader:
+    """Receives one request body off the connection, a recv at a time.
+
+    content_length is the parsed message's framing: an int for a
+    declared length (0 = no body), None for chunked. read() returns the
+    next decoded body bytes, b"" once the body is complete — at which
+    point ``pipelined`` says whether bytes beyond it were read (see
+    async_ingest_body).
+
+    Raises ChunkedFramingError for malformed chunked framing (and
+    InvalidHeader and its siblings for a bad trailer) and _IncompleteBody
+    on timeout, disconnect, a drain deadline (a body still trickling at
+    shutdown is abandoned rather than pinning the connection), or a
+    client dripping below the body rate floor.
+    """
+
+    def __init__(
+        self,
+        worker: Worker,
+        conn: Connection,
+        req: Request,
+        body_start: bytes,
+        content_length: int | None,
+    ) -> None:
+        self._worker = worker
+        self._conn = conn
+        self._req = req
+        self._pending = body_start
+        self._remaining = content_length
+        self._decoder = ChunkedDecoder() if content_length is None else None
+        self._rate = BodyRateFloor(worker.body_min_rate)
+        self.complete = False
+        self.pipelined = False
+        if content_length == 0:
+            # No body (RFC 9112 §6): anything past the headers is a
+            # pipelined request — but ignore a stray trailing CRLF (RFC
+            # 9112 §2.2 tolerance), which shouldn't tear down a reusable
+            # connection.
+            self.complete = True
+            self.pipelined = bool(body_start.strip(b"\r\n"))
+        else:
+            # A shutdown landing mid-recv shortens the read to the
+            # drain-capped body timeout (see handle_connection) — the
+            # generous BODY_RECV_TIMEOUT (a large upload legitimately
+            # stalls between packets far longer than a header block)
+            # would otherwise blow past the drain deadline.
+            conn.recv_base = BODY_RECV_TIMEOUT
+
+    async def read(self) -> bytes:
+        while not self.complete:
+            if self._pending:
+                data, self._pending = self._pending, b""
+            else:
+                data = await self._recv()
+
+            if self._decoder is not None:
+                decoded = self._decoder.feed(data)
+                if self._decoder.finished:
+                    if self._decoder.trailers:
+                        # Validated like the in-band headers were; a bad
+                        # trailer is a protocol error (the caller maps it
+                        # to a 400). The parsed result is discarded —
+                        # nothing consumes trailers.
+                        self._req.parse_headers(self._decoder.trailers)
+                    self.complete = True
+                    self.pipelined = bool(self._decoder.leftover)
+            else:
+                assert self._remaining is not None
+                decoded = data[: self._remaining]
+                self._remaining -= len(decoded)
+                if not self._remaining:
+                    self.complete = True
+                    # Bytes past the body are a pipelined request (→
+                    # close), but a stray trailing CRLF is RFC 9112 §2.2
+                    # tolerance — ignore it, like a bodiless request, so
+                    # a client that trails its POST bodies with CRLF
+                    # still keeps the connection alive.
+                    self.pipelined = bool(data[len(decoded) :].strip(b"\r\n"))
+
+            if decoded:
+                return decoded
+        return b""
+
+    async def _recv(self) -> bytes:
+        worker = self._worker
+        if _drain_expired(worker):
+            raise _IncompleteBody("Request body incomplete at drain deadline")
+        # Checked on entry — when more bytes are actually needed — never
+        # after a recv, so the recv that completes the body can't 408 a
+        # complete-but-slow request (a small body after client
+        # think-time, a 100-continue client with a slow producer).
+        if self._rate.violated():
+            raise _IncompleteBody("Request body below minimum transfer rate")
+        # Bounded recv for a declared length: bytes past it belong to the
+        # NEXT request on this connection — they must stay unread in the
+        # reader's buffer for the next loop iteration, not be consumed
+        # here.
+        max_size = 65536 if self._remaining is None else min(self._remaining, 65536)
+        wait_start = time.monotonic()
+        try:
+            chunk = await self._conn.recv(
+                max_size, _recv_timeout(worker, BODY_RECV_TIMEOUT)
+            )
+        except TimeoutError:
+            raise _IncompleteBody("Body read timed out or shutdown")
+        except OSError:
+            raise _IncompleteBody("Body read disconnected")
+        if not chunk:
+            raise _IncompleteBody("Client disconnected during request body")
+        self._rate.record(waited=time.monotonic() - wait_start, received=len(chunk))
+        return chunk
 
 
 async def async_ingest_body(
@@ -281,7 +396,6 @@ async def async_ingest_body(
     req: Request,
     body_start: bytes,
     content_length: int | None,
-    shutdown_wait: asyncio.Task[bool],
 ) -> bool:
     """Receive the entire request body into the sink on the event loop.
 
@@ -295,104 +409,98 @@ async def async_ingest_body(
     would make our boundary detection a request splitter.
 
     Raises LimitRequestBody past the policy cap, BodyBudgetExceeded past
-    the worker-wide budget, ChunkedFramingError for malformed chunked
-    framing, and _IncompleteBody on timeout, disconnect, a drain
-    deadline (a body still trickling at shutdown is abandoned with a 408
-    rather than pinning the connection), or a client dripping below the
-    body rate floor.
+    the worker-wide budget, and whatever _BodyReader raises: framing and
+    trailer errors, and _IncompleteBody when the body doesn't arrive.
     """
-    if content_length == 0:
-        # No body (RFC 9112 §6): anything past the headers is a pipelined
-        # request — but ignore a stray trailing CRLF (RFC 9112 §2.2
-        # tolerance), which shouldn't tear down a reusable connection.
-        return bool(body_start.strip(b"\r\n"))
+    reader = _BodyReader(worker, conn, req, body_start, content_length)
+    while data := await reader.read():
+        sink.feed(data)
+    return reader.pipelined
 
-    rate = BodyRateFloor(worker.body_min_rate)
-    loop = asyncio.get_running_loop()
 
-    async def recv_more(max_size: int = 65536) -> bytes:
-        if _drain_expired(worker):
-            raise _IncompleteBody("Request body incomplete at drain deadline")
-        # Checked on entry — when more bytes are actually needed — never
-        # after a recv, so the recv that completes the body can't 408 a
-        # complete-but-slow request (a small body after client
-        # think-time, a 100-continue client with a slow producer).
-        if rate.violated():
-            raise _IncompleteBody("Request body below minimum transfer rate")
-        wait_start = time.monotonic()
-        # Race the recv against worker shutdown so a body read blocked on
-        # a slow client is interrupted promptly when the drain begins —
-        # the generous BODY_RECV_TIMEOUT (a large upload legitimately
-        # stalls between packets far longer than a header block) would
-        # otherwise blow past the drain deadline. Once shutdown fires,
-        # the deadline caps how long we wait for the rest.
-        recv_task = loop.create_task(conn.recv(max_size))
+class _StreamedBody:
+    """The body of a request dispatched before its body arrived.
+
+    For views that set ``stream_request_body``: this is the request's
+    ``_stream``, and ``request.stream_body()`` iterates it, receiving
+    each chunk off the connection only when the view asks for it — so a
+    view that's slow to forward the bytes slows the client down instead
+    of buffering them. The BodySink policy still applies to received
+    bytes: the per-request cap, and the worker-wide budget, which a
+    chunk holds until the view asks for the next one.
+
+    There's no body to read synchronously, so read() raises (and
+    request.body with it).
+    """
+
+    def __init__(
+        self, reader: _BodyReader, *, max_size: int | None, budget: BodyBudget | None
+    ) -> None:
+        self._reader = reader
+        self._max_size = max_size
+        self._budget = budget
+        self.received = 0
+        self._held = 0
+
+    @property
+    def complete(self) -> bool:
+        return self._reader.complete
+
+    @property
+    def pipelined(self) -> bool:
+        return self._reader.pipelined
+
+    def __aiter__(self) -> _StreamedBody:
+        return self
+
+    async def __anext__(self) -> bytes:
+        self._release()
         try:
-            await asyncio.wait(
-                (recv_task, shutdown_wait),
-                timeout=_recv_timeout(worker, BODY_RECV_TIMEOUT),
-                return_when=asyncio.FIRST_COMPLETED,
+            data = await self._reader.read()
+        except _IncompleteBody as e:
+            raise UnreadablePostError(str(e)) from e
+        except ParseException as e:
+            raise BadRequestError400(str(e)) from e
+        if not data:
+            raise StopAsyncIteration
+
+        self.received += len(data)
+        if self._max_size is not None and self.received > self._max_size:
+            raise ContentTooLargeError413(
+                str(LimitRequestBody(self.received, self._max_size))
             )
-            if not recv_task.done() and shutdown_wait.done():
-                # Shutdown began mid-recv; finish under the (now short)
-                # drain-capped budget, shielding the recv from wait_for's
-                # cancel so we own its teardown.
-                try:
-                    await asyncio.wait_for(
-                        asyncio.shield(recv_task),
-                        timeout=_recv_timeout(worker, BODY_RECV_TIMEOUT),
-                    )
-                except TimeoutError:
-                    pass
-            if not recv_task.done():
-                recv_task.cancel()
-                # The error path reads this connection again
-                # (_linger_discard) — wait for the cancelled read to
-                # release the StreamReader first. asyncio.wait absorbs
-                # the task's CancelledError but still propagates our own.
-                await asyncio.wait((recv_task,))
-                raise _IncompleteBody("Body read timed out or shutdown")
-            chunk = recv_task.result()
-        except OSError:
-            raise _IncompleteBody("Body read disconnected")
-        finally:
-            if recv_task.done() and not recv_task.cancelled():
-                recv_task.exception()  # retrieve to silence the warning
-        if not chunk:
-            raise _IncompleteBody("Client disconnected during request body")
-        rate.record(waited=time.monotonic() - wait_start, received=len(chunk))
-        return chunk
+        if self._budget is not None:
+            try:
+                self._budget.charge(len(data))
+            except BodyBudgetExceeded as e:
+                raise UnreadablePostError(str(e)) from e
+            self._held = len(data)
+        return data
+
+    def read(self, size: int | None = None, /) -> bytes:
+        raise OSError(
+            "This request's body is streamed to the view "
+            "(stream_request_body); read it with request.stream_body()."
+        )
+
+    def readline(self, size: int | None = None, /) -> bytes:
+        return self.read(size)
+
+    def close(self) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        if self._held and self._budget is not None:
+            self._budget.release(self._held)
+        self._held = 0
 
-    if content_length is None:
-        decoder = ChunkedDecoder()
-        data = body_start
-        while True:
-            if decoded := decoder.feed(data):
-                sink.feed(decoded)
-            if decoder.finished:
-                if decoder.trailers:
-                    # Validated like the in-band headers were; a bad
-                    # trailer is a protocol error, same as before the
-                    # sink (the caller maps it to a 400). The parsed
-                    # result is discarded — nothing consumes trailers.
-                    req.parse_headers(decoder.trailers)
-                return bool(decoder.leftover)
-            data = await recv_more()
-
-    sink.feed(body_start[:content_length])
-    remaining = content_length - len(body_start)
-    while remaining > 0:
-        # Bounded recv: bytes past the declared length belong to the
-        # NEXT request on this connection — they must stay unread in the
-        # socket for the next loop iteration, not be consumed here.
-        chunk = await recv_more(min(remaining, 65536))
-        sink.feed(chunk)
-        remaining -= len(chunk)
-    # Bytes past the body are a pipelined request (→ close), but a stray
-    # trailing CRLF is RFC 9112 §2.2 tolerance — ignore it, like the
-    # bodiless path above, so a client that trails its POST bodies with
-    # CRLF still keeps the connection alive.
-    return bool(body_start[content_length:].strip(b"\r\n"))
+
+def _streams_request_body(worker: Worker, req: Request) -> bool:
+    """True if the request's view reads its body as it arrives."""
+    check = getattr(worker.handler, "streams_request_body", None)
+    if check is None:
+        return False
+    return check((req.method or "GET").upper(), _resolve_path(req.path or ""))
 
 
 def parse_request(
@@ -407,7 +515,13 @@ def parse_request(
     no I/O; HTTP protocol errors (InvalidRequestLine, InvalidHeader,
     etc.) propagate so the caller can send async error responses.
     """
-    req = Request(worker.app.is_ssl, header_data, conn.client, conn.req_count + 1)
+    req = Request(
+        worker.app.is_ssl,
+        header_data,
+        conn.client,
+        conn.req_count + 1,
+        parser=worker.request_parser,
+    )
 
     request_start = datetime.now(UTC)
 
@@ -550,7 +664,7 @@ async def async_handle_dispatch_error(
         return False
 
     if isinstance(exc, ConnectionResetError):
-        # asyncio's _drain_helper raises ConnectionResetError('Connection lost')
+        # ConnectionWriter.drain() raises ConnectionResetError('Connection lost')
         # without an errno, so we handle it before the errno-based OSError check.
         worker.log.debug(
             "Client disconnected during dispatch",
@@ -586,6 +700,7 @@ async def dispatch(
     http_request: Any,
     resp: Response,
     request_start: datetime,
+    body: _StreamedBody | None = None,
 ) -> bool:
     """Dispatch a request through the handler and write the response."""
     try:
@@ -598,6 +713,12 @@ async def dispatch(
         if not worker.alive:
             resp.force_close()
 
+        # A streamed body the view didn't read to the end leaves the
+        # connection mid-message, and one with a request pipelined behind
+        # it is closed like an ingested one.
+        if body is not None and (not body.complete or body.pipelined):
+            resp.force_close()
+
         # Check for async streaming response (SSE, etc.)
         from plain.http import AsyncStreamingResponse
 
@@ -610,6 +731,47 @@ async def dispatch(
         return await async_handle_dispatch_error(worker, req, resp, conn, exc)
 
 
+async def dispatch_streamed(
+    worker: Worker,
+    req: Request,
+    conn: Connection,
+    resp: Response,
+    request_start: datetime,
+    body_start: bytes,
+    content_length: int | None,
+) -> bool:
+    """Dispatch a request before its body is received (see _StreamedBody)."""
+    body = _StreamedBody(
+        _BodyReader(worker, conn, req, body_start, content_length),
+        max_size=worker.max_request_body,
+        budget=worker.body_budget,
+    )
+    http_request = create_request(
+        req,
+        conn.client,
+        conn.server,
+        stream=body,
+        received=0,
+        ingest_seconds=0.0,
+        streamed=True,
+    )
+    conn.req_count += 1
+    worker._count_request()
+    try:
+        keepalive = await dispatch(
+            worker, req, conn, http_request, resp, request_start, body=body
+        )
+    finally:
+        body.close()
+
+    if not body.complete:
+        # The rest of the body may still be inbound; closing now would
+        # RST-clobber the response.
+        await _linger_discard(worker, conn)
+        return False
+    return keepalive
+
+
 async def stream_async_response(
     req: Any,
     resp: Response,
@@ -676,12 +838,18 @@ async def handle_connection(worker: Worker, conn: Connection) -> None:
     loop = asyncio.get_running_loop()
 
     # Completed when worker shutdown starts — one task per connection (as
-    # h2 does), raced against wait_readable in _wait_for_next_request.
-    # Don't "optimize" to one worker-wide task shared across connections:
-    # asyncio.wait registers/removes a done-callback per waiter, which is
-    # O(connections) on a shared task — strictly worse.
+    # h2 does). Its callback shortens whatever read is pending to the
+    # current phase's drain grace, so an idle wait or a body read blocked
+    # on a slow client is interrupted promptly; reads that start later
+    # see shutdown_wait.done() / the drain deadline via _recv_timeout.
     shutdown_wait = loop.create_task(worker.shutdown_event.wait())
 
+    def shorten_pending_read(task: asyncio.Task[bool]) -> None:
+        if not task.cancelled():
+            conn.reader.shorten_deadline(_recv_timeout(worker, conn.recv_base))
+
+    shutdown_wait.add_done_callback(shorten_pending_read)
+
     try:
         while True:
             # Long, shutdown-aware idle wait — first request included.
@@ -772,6 +940,15 @@ async def handle_connection(worker: Worker, conn: Connection) -> None:
                 except OSError:
                     break
 
+            # A view that reads its body as it arrives (stream_request_body)
+            # is dispatched now, with the body still on the wire.
+            if content_length != 0 and _streams_request_body(worker, req):
+                if not await dispatch_streamed(
+                    worker, req, conn, resp, request_start, body_start, content_length
+                ):
+                    break
+                continue
+
             # Ingest the entire body on the event loop before dispatch:
             # memory up to the spool threshold, an anonymous temp file
             # beyond it, the policy cap and worker-wide budget enforced
@@ -793,7 +970,6 @@ async def handle_connection(worker: Worker, conn: Connection) -> None:
                         req,
                         body_start,
                         content_length,
-                        shutdown_wait,
                     )
                 except _IncompleteBody:
                     # Best-effort: the most common cause is the client
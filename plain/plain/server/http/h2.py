@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor
@@ -33,8 +34,13 @@ from .sink import BodyBudget, BodyRateFloor, BodySink
 if TYPE_CHECKING:
     from plain.http.request import RequestStream
 
+    from ..protocol import ConnectionProtocol, ConnectionWriter
+
 log = get_framework_logger()
 
+# Bytes of a sync response body pulled per executor hop (see BodyPump).
+PUMP_BATCH_SIZE = 64 * 1024
+
 # HTTP/1.1 hop-by-hop headers that must not appear in HTTP/2 responses
 _H2_SKIP_HEADERS = frozenset(
     ("connection", "transfer-encoding", "keep-alive", "upgrade")
@@ -318,6 +324,7 @@ def _build_http_request(
     request._read_started = False
     if received:
         request._body_ingest_seconds = ingest_seconds
+    request._queued_at = time.monotonic()
     return request
 
 
@@ -398,7 +405,7 @@ class H2ConnectionState:
     def __init__(
         self,
         conn: h2.connection.H2Connection,
-        writer: asyncio.StreamWriter,
+        writer: ConnectionWriter,
         client: tuple[str, int] | Any,
         server: tuple[str, int] | Any,
         handler: Any,
@@ -418,33 +425,71 @@ class H2ConnectionState:
         self.write_lock = asyncio.Lock()
         self.streams: dict[int, H2Stream] = {}
         self.reset_streams: set[int] = set()
-        self.window_events: dict[int, asyncio.Event] = {}
+        # One future per stream parked on a zero send window, resolved
+        # by the next WINDOW_UPDATE that could credit it.
+        self.window_waiters: dict[int, asyncio.Future[None]] = {}
         self.stream_budget = stream_budget
         self.on_stream_complete = on_stream_complete
+        self._flush_handle: asyncio.Handle | None = None
 
-    def get_window_event(self, stream_id: int) -> asyncio.Event:
-        ev = self.window_events.get(stream_id)
-        if ev is None:
-            ev = asyncio.Event()
-            self.window_events[stream_id] = ev
-        return ev
+    async def wait_for_window(self, stream_id: int, timeout: float) -> bool:
+        """Park until the stream's send window may have opened.
+
+        False when `timeout` passes first. Callers re-read the window
+        either way: a wake only means it is worth checking.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self.window_waiters[stream_id] = waiter
+        try:
+            async with asyncio.timeout(timeout):
+                await waiter
+        except TimeoutError:
+            return False
+        finally:
+            if self.window_waiters.get(stream_id) is waiter:
+                del self.window_waiters[stream_id]
+        return True
+
+    def window_opened(self, stream_id: int) -> None:
+        """Wake the sender parked on `stream_id` (0 = every sender)."""
+        if stream_id == 0:
+            waiters = list(self.window_waiters.values())
+        else:
+            waiter = self.window_waiters.get(stream_id)
+            waiters = [waiter] if waiter is not None else []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
 
     async def flush(self) -> None:
-        """Send any pending h2 data via the asyncio stream writer."""
+        """Send pending h2 frames, coalesced per event loop tick.
+
+        The frames every stream (and the read loop) queue on the h2
+        connection during one tick go out in a single transport write
+        when the tick ends, rather than one write per DATA frame. The
+        drain applies the transport's backpressure to the caller.
+        """
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_soon(
+                self._write_pending
+            )
+        await self.writer.drain()
+
+    def _write_pending(self) -> None:
+        self._flush_handle = None
         outgoing = self.conn.data_to_send()
         if outgoing:
             self.writer.write(outgoing)
-            await self.writer.drain()
 
     def cleanup_stream(self, stream_id: int) -> None:
         """Remove per-stream state after a stream task completes."""
         self.reset_streams.discard(stream_id)
-        self.window_events.pop(stream_id, None)
+        self.window_waiters.pop(stream_id, None)
 
 
 async def async_handle_h2_connection(
-    reader: asyncio.StreamReader,
-    writer: asyncio.StreamWriter,
+    reader: ConnectionProtocol,
+    writer: ConnectionWriter,
     client: tuple[str, int] | Any,
     server: tuple[str, int] | Any,
     handler: Any,
@@ -462,7 +507,7 @@ async def async_handle_h2_connection(
 ) -> None:
     """Async HTTP/2 connection loop.
 
-    Reads frames from the asyncio StreamReader and dispatches each completed
+    Reads frames from the connection's protocol and dispatches each completed
     stream as an independent asyncio task. All I/O goes through asyncio's
     transport layer (memory BIO for TLS), eliminating the need for a
     dedicated reader thread.
@@ -786,12 +831,7 @@ async def async_handle_h2_connection(
                         state.cleanup_stream(event.stream_id)
 
                 elif isinstance(event, h2.events.WindowUpdated):
-                    ev = state.window_events.get(event.stream_id)
-                    if ev is not None:
-                        ev.set()
-                    if event.stream_id == 0:
-                        for ev in state.window_events.values():
-                            ev.set()
+                    state.window_opened(event.stream_id)
 
                 elif isinstance(event, h2.events.RemoteSettingsChanged):
                     # An INITIAL_WINDOW_SIZE change re-credits every
@@ -803,8 +843,7 @@ async def async_handle_h2_connection(
                         h2.settings.SettingCodes.INITIAL_WINDOW_SIZE
                         in event.changed_settings
                     ):
-                        for ev in state.window_events.values():
-                            ev.set()
+                        state.window_opened(0)
 
                 elif isinstance(event, h2.events.PriorityUpdated):
                     pass
@@ -969,6 +1008,96 @@ async def _async_handle_stream_inner(
                 await _async_send_h2_error(state, stream, 500)
 
 
+class BodyPump:
+    """Iterates a sync response body on the executor, a batch per hop.
+
+    One executor job pulls chunks until PUMP_BATCH_SIZE bytes or the end
+    of the body, instead of one run_in_executor hop per chunk. Each chunk
+    is handed over as soon as it is produced, so a slow generator isn't
+    held back for the batch. The event loop is only woken while it is
+    waiting, so a fast producer's chunks arrive together: one wakeup and
+    one flush. The next batch starts only once the sender has taken
+    everything, so a stream parked on flow control doesn't pull further
+    ahead.
+    """
+
+    def __init__(self, iterator: Any, executor: ThreadPoolExecutor) -> None:
+        self._iterator = iterator
+        self._executor = executor
+        self._loop = asyncio.get_running_loop()
+        self._lock = threading.Lock()
+        # Shared with the executor thread, under _lock.
+        self._ready: list[bytes] = []
+        self._pulling = False
+        self._finished = False
+        self._error: BaseException | None = None
+        self._waiter: asyncio.Future[None] | None = None
+        self._stopped = False
+
+    async def next_chunks(self) -> list[bytes] | None:
+        """The chunks produced since the last call; None at the end."""
+        while True:
+            with self._lock:
+                if self._ready:
+                    chunks, self._ready = self._ready, []
+                    return chunks
+                if self._finished:
+                    if self._error is not None:
+                        raise self._error
+                    return None
+                waiter = self._waiter = self._loop.create_future()
+                start = not self._pulling
+                self._pulling = True
+            if start:
+                self._loop.run_in_executor(self._executor, self._pull)
+            await waiter
+
+    async def stop(self) -> None:
+        """Stop a running batch after its current chunk, and wait for it.
+
+        The caller closes the response next, and a generator can't be
+        closed while a thread is still iterating it.
+        """
+        self._stopped = True
+        while True:
+            with self._lock:
+                if not self._pulling:
+                    return
+                waiter = self._waiter = self._loop.create_future()
+            await waiter
+
+    def _pull(self) -> None:
+        pulled = 0
+        finished = False
+        while not finished and pulled < PUMP_BATCH_SIZE and not self._stopped:
+            error: BaseException | None = None
+            try:
+                chunk = next(self._iterator, None)
+            except Exception as e:
+                chunk, error = None, e
+            finished = chunk is None
+            with self._lock:
+                if finished:
+                    self._finished = True
+                    self._error = error
+                elif chunk:
+                    self._ready.append(chunk)
+                    pulled += len(chunk)
+                waiter, self._waiter = self._waiter, None
+            if waiter is not None:
+                self._loop.call_soon_threadsafe(_resolve_waiter, waiter)
+        with self._lock:
+            self._pulling = False
+            waiter, self._waiter = self._waiter, None
+        if waiter is not None:
+            self._loop.call_soon_threadsafe(_resolve_waiter, waiter)
+
+
+def _resolve_waiter(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 async def _async_write_h2_response(
     state: H2ConnectionState,
     stream: H2Stream,
@@ -1036,13 +1165,14 @@ async def _async_write_h2_response(
             await state.flush()
             h2_resp.headers_sent = True
 
-        while True:
-            chunk = await loop.run_in_executor(executor, next, response_iter, None)
-            if chunk is None:
-                break
-            if chunk:
-                h2_resp.sent += len(chunk)
-                await _async_send_h2_data(state, stream_id, chunk, end_stream=False)
+        pump = BodyPump(response_iter, executor)
+        try:
+            while (chunks := await pump.next_chunks()) is not None:
+                body = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+                h2_resp.sent += len(body)
+                await _async_send_h2_data(state, stream_id, body, end_stream=False)
+        finally:
+            await pump.stop()
 
         h2_resp.response_length = h2_resp.sent
 
@@ -1086,51 +1216,42 @@ async def _async_send_h2_data(
     *,
     end_stream: bool = False,
 ) -> None:
-    """Send data respecting HTTP/2 flow control."""
+    """Send data respecting HTTP/2 flow control.
+
+    Every frame the windows allow is queued under one lock hold and
+    flushed once; only a closed window parks the stream.
+    """
     conn = state.conn
     offset = 0
-
-    stream_event = state.get_window_event(stream_id)
-    conn_event = state.get_window_event(0)
+    view = memoryview(data)
 
     while offset < len(data):
-        stream_event.clear()
-        conn_event.clear()
-
         async with state.write_lock:
-            max_size = conn.local_flow_control_window(stream_id)
-            if max_size > 0:
+            while offset < len(data):
+                max_size = conn.local_flow_control_window(stream_id)
+                if max_size <= 0:
+                    break
                 chunk_size = min(
                     max_size, len(data) - offset, conn.max_outbound_frame_size
                 )
-                chunk = data[offset : offset + chunk_size]
                 is_last = (offset + chunk_size >= len(data)) and end_stream
-                conn.send_data(stream_id, chunk, end_stream=is_last)
-                await state.flush()
+                conn.send_data(
+                    stream_id,
+                    bytes(view[offset : offset + chunk_size]),
+                    end_stream=is_last,
+                )
                 offset += chunk_size
-                continue
-
             await state.flush()
+        if offset >= len(data):
+            break
 
-        stream_waiter = asyncio.create_task(stream_event.wait())
-        conn_waiter = asyncio.create_task(conn_event.wait())
-        try:
-            done, pending = await asyncio.wait(
-                [stream_waiter, conn_waiter],
-                timeout=5.0,
-                return_when=asyncio.FIRST_COMPLETED,
-            )
-        except asyncio.CancelledError:
-            stream_waiter.cancel()
-            conn_waiter.cancel()
-            await asyncio.gather(stream_waiter, conn_waiter, return_exceptions=True)
-            raise
-        for p in pending:
-            p.cancel()
-        if pending:
-            await asyncio.gather(*pending, return_exceptions=True)
-
-        if not done:
+        # A WINDOW_UPDATE handled while the flush drained found no waiter
+        # to wake, so check again before parking. Nothing awaits between
+        # this check and wait_for_window() registering its waiter.
+        if conn.local_flow_control_window(stream_id) > 0:
+            continue
+
+        if not await state.wait_for_window(stream_id, timeout=5.0):
             log.warning(
                 "H2 stream timed out waiting for flow-control window update, resetting stream",
                 extra={"stream_id": stream_id},
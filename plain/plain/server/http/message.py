@@ -7,7 +7,7 @@ from __future__ import annotations
 #
 # Vendored and modified for Plain.
 import re
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ..util import bytes_to_str, split_request_uri
 from .errors import (
@@ -23,6 +23,9 @@ from .errors import (
     UnsupportedTransferCoding,
 )
 
+if TYPE_CHECKING:
+    from .parsers import RequestParser
+
 MAX_REQUEST_LINE = 8190
 MAX_HEADERS = 32768
 DEFAULT_MAX_HEADERFIELD_SIZE = 8190
@@ -87,13 +90,13 @@ class Message:
         lines = [bytes_to_str(line) for line in data.split(b"\r\n")]
 
         # Parse headers into key/value pairs paying attention
-        # to continuation lines.
-        while lines:
+        # to continuation lines. Indexed rather than popped from the
+        # front, which would be quadratic in the header count.
+        for i, curr in enumerate(lines):
             if len(headers) >= self.limit_request_fields:
                 raise LimitRequestHeaders("limit request headers fields")
 
             # Parse initial header name: value pair.
-            curr = lines.pop(0)
             header_length = len(curr) + len("\r\n")
             if curr.find(":") <= 0:
                 raise InvalidHeader(curr)
@@ -110,7 +113,7 @@ class Message:
             value = [value.strip(" \t")]
 
             # Consume value continuation lines..
-            while lines and lines[0].startswith((" ", "\t")):
+            if i + 1 < len(lines) and lines[i + 1].startswith((" ", "\t")):
                 # Obsolete folding is not permitted (RFC 7230)
                 raise ObsoleteFolding(name)
             value = " ".join(value)
@@ -222,6 +225,7 @@ class Request(Message):
         header_data: bytes,
         peer_addr: tuple[str, int] | Any,
         req_number: int = 1,
+        parser: RequestParser | None = None,
     ):
         self.method: str | None = None
         self.uri: str | None = None
@@ -235,6 +239,7 @@ class Request(Message):
             self.limit_request_line = MAX_REQUEST_LINE
 
         self.req_number = req_number
+        self.parser = parser
         super().__init__(is_ssl, header_data, peer_addr)
 
     def parse(self, data: bytes) -> None:
@@ -243,7 +248,15 @@ class Request(Message):
         The connection loop reads the block off the socket before this
         runs (async_read_headers), so there is no I/O here — just
         splitting and validating what already arrived.
+
+        This is the reference parser. An accelerated `parser` (see
+        SERVER_HTTP_PARSER) gets the first try and hands back anything
+        it isn't certain this code would accept the same way, so every
+        rejection — and its error — comes from here.
         """
+        if self.parser is not None and self.parser.parse(self, data):
+            return
+
         if len(data) > self.max_buffer_headers:
             raise LimitRequestHeaders("max buffer headers")
 
@@ -265,6 +278,9 @@ class Request(Message):
         else:
             self.headers = self.parse_headers(rest[:end])
 
+        self.check_host_header()
+
+    def check_host_header(self) -> None:
         if self.version >= (1, 1):
             host_headers = [v for name, v in self.headers if name == "HOST"]
             if not host_headers:
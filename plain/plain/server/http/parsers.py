@@ -0,0 +1,138 @@
+"""Accelerated HTTP/1 request-head parsers.
+
+The pure-Python parser in message.Request.parse is the reference. A
+RequestParser here gets the first try at each header block and either
+fills in the request or returns False to hand the block to the
+reference. It must only accept what the reference would accept, with
+the same result — anything unusual goes to the reference, so every
+rejection (and its error) comes from one place.
+tests/internal/test_server_parsers.py holds backends to that
+differentially.
+
+Selected by SERVER_HTTP_PARSER: "python" (the reference alone) or
+"httptools" (llhttp via the optional httptools package).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+from plain.exceptions import ImproperlyConfigured
+
+from .message import RFC9110_5_6_2_TOKEN_SPECIALS
+
+if TYPE_CHECKING:
+    from .message import Request
+
+# Token characters plus the "\n" the field names are joined with, so one
+# translate() over the joined names checks them all.
+_NAME_BYTES = (
+    RFC9110_5_6_2_TOKEN_SPECIALS
+    + "0123456789"
+    + "abcdefghijklmnopqrstuvwxyz"
+    + "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    + "\n"
+).encode("ascii")
+
+
+class RequestParser(Protocol):
+    def parse(self, req: Request, data: bytes) -> bool:
+        """Parse `data` into `req`; False hands it to the reference."""
+        ...
+
+
+class _Fields:
+    """httptools callback target collecting raw field names and values."""
+
+    __slots__ = ("names", "values")
+
+    def __init__(self) -> None:
+        self.names: list[bytes] = []
+        self.values: list[bytes] = []
+
+    def on_header(self, name: bytes, value: bytes) -> None:
+        self.names.append(name)
+        self.values.append(value)
+
+
+class HttptoolsParser:
+    """Header fields split by llhttp, validated by the reference rules.
+
+    The request line still goes through Request.parse_request_line — it
+    is one split, and its errors must be the reference's. llhttp splits
+    the header fields, which is where the per-line Python work was, and
+    the fields are validated in bulk over the joined names and values
+    rather than one by one. The block is handed back to the reference
+    whenever the two could disagree: llhttp rejected it, or it holds bare
+    CR/LF, NUL or obs-fold bytes, more fields than the limit, or is
+    longer than one field may be (so no per-line length check is needed
+    here).
+    """
+
+    def __init__(self) -> None:
+        import httptools  # ty: ignore[unresolved-import]
+
+        self._httptools = httptools
+        self._errors = (httptools.HttpParserError, httptools.HttpParserUpgrade)
+
+    def parse(self, req: Request, data: bytes) -> bool:
+        if (
+            len(data) > req.limit_request_field_size
+            or data.find(b"\r\n\r\n") != len(data) - 4
+            or not data.count(b"\r") == data.count(b"\n") == data.count(b"\r\n")
+            or b"\0" in data
+            or b"\r\n " in data
+            or b"\r\n\t" in data
+        ):
+            return False
+
+        idx = data.find(b"\r\n")
+        if idx > req.limit_request_line > 0:
+            return False
+        req.parse_request_line(data[:idx])
+
+        collected = _Fields()
+        try:
+            self._httptools.HttpRequestParser(collected).feed_data(data)
+        except self._errors:
+            return False
+        names = collected.names
+        if len(names) > req.limit_request_fields or not all(names):
+            return False
+
+        # Neither join is ambiguous: the block holds no bare LF.
+        joined_names = b"\n".join(names)
+        if joined_names.translate(None, _NAME_BYTES):
+            return False
+        # ASCII-only after the token check, so upper() can't change a
+        # name's length (b"\xdf" -> "SS") and the split stays aligned.
+        upper_names = str(joined_names, "latin1").upper()
+        joined_values = b"\n".join(collected.values) + b"\n"
+        values = str(joined_values[:-1], "latin1").split("\n")
+        # llhttp drops a value's leading whitespace; trailing whitespace
+        # only needs stripping when some value ends in it.
+        if b" \n" in joined_values or b"\t\n" in joined_values:
+            values = [value.strip(" \t") for value in values]
+        headers = list(zip(upper_names.split("\n"), values)) if names else []
+        if "_" in upper_names:
+            headers = [(name, value) for name, value in headers if "_" not in name]
+        req.headers = headers
+
+        req.check_host_header()
+        return True
+
+
+def get_request_parser(name: str) -> RequestParser | None:
+    """The parser for a SERVER_HTTP_PARSER value (None = the reference)."""
+    if name == "python":
+        return None
+    if name == "httptools":
+        try:
+            return HttptoolsParser()
+        except ImportError:
+            raise ImproperlyConfigured(
+                'SERVER_HTTP_PARSER = "httptools" requires the httptools package.'
+            )
+    raise ImproperlyConfigured(
+        f'SERVER_HTTP_PARSER must be "python" or "httptools" (got {name!r}).'
+    )
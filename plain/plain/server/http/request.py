@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import quote, unquote_to_bytes
 
@@ -52,6 +53,7 @@ def create_request(
     stream: RequestStream,
     received: int,
     ingest_seconds: float,
+    streamed: bool = False,
 ) -> HttpRequest:
     """Build a plain.http.Request directly from the server's parsed HTTP message."""
 
@@ -67,8 +69,9 @@ def create_request(
     # is de-chunked here exactly like a buffering gateway (RFC 9112
     # §7.1.3): drop Transfer-Encoding and advertise the actual length.
     # Content-Length consumers (multipart parsing, request.content_length)
-    # then see chunked and declared bodies identically.
-    if "TRANSFER-ENCODING" in headers:
+    # then see chunked and declared bodies identically. A streamed body
+    # is still arriving, so its framing headers are left as sent.
+    if "TRANSFER-ENCODING" in headers and not streamed:
         del headers["TRANSFER-ENCODING"]
         headers["CONTENT-LENGTH"] = str(received)
     remote_addr = _resolve_remote_addr(client)
@@ -87,11 +90,13 @@ def create_request(
     )
 
     # The fully-ingested body (see BodySink) — never a socket-backed
-    # reader, so app reads can't block on the client.
+    # reader, so app reads can't block on the client. The one exception
+    # is a streamed body, which only async iteration can read.
     request._stream = stream
     request._read_started = False
     if received:
         request._body_ingest_seconds = ingest_seconds
+    request._queued_at = time.monotonic()
 
     return request
 
@@ -22,15 +22,44 @@ from .errors import InvalidHeader, InvalidHeaderName
 from .message import TOKEN_RE
 
 if TYPE_CHECKING:
+    from ..protocol import ConnectionWriter
     from .message import Request as ServerRequest
 
 # RFC9110 5.5: field-vchar = VCHAR / obs-text
 # RFC4234 B.1: VCHAR = 0x21-x07E = printable ASCII
 HEADER_VALUE_RE = re.compile(r"[ \t\x21-\x7e\x80-\xff]*")
 
+# Response bytes held back before they're handed to the transport in
+# one writelines(): the head, a typical body and the chunked terminator
+# go out together, and runs of small streamed chunks are batched, rather
+# than one write and drain each. Anything queued below this goes out as
+# soon as the writing task yields to the event loop (the idle flush), so
+# batching never delays a chunk that a stream (SSE) is waiting on.
+COALESCE_SIZE = 64 * 1024
+
+CONNECTION_CLOSE = b"Connection: close\r\n"
+CONNECTION_KEEP_ALIVE = b"Connection: keep-alive\r\n"
+TRANSFER_ENCODING_CHUNKED = b"Transfer-Encoding: chunked\r\n"
+CHUNKED_TERMINATOR = b"0\r\n\r\n"
+
+# (server, date, encoded lines) — the Server and Date lines pre-encoded,
+# rebuilt when the second ticks over.
+_server_date_cache: tuple[str, str, bytes] = ("", "", b"")
+
 log = logging.getLogger(__name__)
 
 
+def server_date_lines(server: str) -> bytes:
+    """The encoded "Server:" and "Date:" header lines for this second."""
+    global _server_date_cache
+    date = util.http_date()
+    cached_server, cached_date, lines = _server_date_cache
+    if cached_date != date or cached_server != server:
+        lines = f"Server: {server}\r\nDate: {date}\r\n".encode("latin-1")
+        _server_date_cache = (server, date, lines)
+    return lines
+
+
 class FileWrapper:
     def __init__(self, filelike: Any, blksize: int = 8192) -> None:
         self.filelike = filelike
@@ -49,7 +78,7 @@ class Response:
     def __init__(
         self,
         req: ServerRequest,
-        writer: asyncio.StreamWriter,
+        writer: ConnectionWriter,
         *,
         is_ssl: bool = False,
     ) -> None:
@@ -68,6 +97,13 @@ class Response:
         self.response_length: int | None = None
         self.sent = 0
         self.status_code: int | None = None
+        # Bytes queued for the next writelines(); see COALESCE_SIZE.
+        self._pending: list[bytes] = []
+        self._pending_size = 0
+        self._idle_flush: asyncio.Handle | None = None
+        # An idle flush wrote without draining; the next write drains
+        # first so a slow client still pushes back on the stream.
+        self._undrained = False
 
     @property
     def omits_body(self) -> bool:
@@ -147,23 +183,23 @@ class Response:
         # HEAD, 1xx, 204, and 304 responses have no body to frame.
         return not self.omits_body
 
-    def default_headers(self) -> list[str]:
+    def default_headers(self) -> bytes:
         # Set the connection header and latch the close decision so the
         # keepalive loop follows what the client was actually told.
         close = self.should_close()
-        connection = "close" if close else "keep-alive"
 
         self.framed_close = close
 
-        headers = [
-            f"HTTP/{self.req.version[0]}.{self.req.version[1]} {self.status}\r\n",
-            f"Server: {self.version}\r\n",
-            f"Date: {util.http_date()}\r\n",
-            f"Connection: {connection}\r\n",
-        ]
-        if self.chunked:
-            headers.append("Transfer-Encoding: chunked\r\n")
-        return headers
+        major, minor = self.req.version
+        status_line = f"HTTP/{major}.{minor} {self.status}\r\n"
+        return b"".join(
+            [
+                status_line.encode("latin-1"),
+                server_date_lines(self.version),
+                CONNECTION_CLOSE if close else CONNECTION_KEEP_ALIVE,
+                TRANSFER_ENCODING_CHUNKED if self.chunked else b"",
+            ]
+        )
 
     def prepare_response(self, http_response: Any) -> None:
         """Set status and headers from a plain.http.Response without writing body.
@@ -181,21 +217,52 @@ class Response:
         self.set_status_and_headers(status, response_headers)
 
     # ------------------------------------------------------------------
-    # Async write methods — use asyncio StreamWriter for all I/O.
+    # Async write methods — use the ConnectionWriter for all I/O.
+    #
+    # Writes are queued and handed to the transport together (one
+    # writelines(), which is a single sendmsg() on a plain socket):
+    # when COALESCE_SIZE is reached, at async_close(), or once the
+    # writing task yields to the loop. headers_sent means the head is
+    # committed (queued), not necessarily on the wire yet.
     # ------------------------------------------------------------------
 
-    async def _async_send(self, data: bytes) -> None:
-        """Send bytes using the writer (asyncio streams)."""
-        self._writer.write(data)
+    def _queue(self, data: bytes) -> None:
+        self._pending.append(data)
+        self._pending_size += len(data)
+        if self._idle_flush is None:
+            self._idle_flush = asyncio.get_running_loop().call_soon(self._flush_idle)
+
+    def _write_pending(self) -> None:
+        if self._idle_flush is not None:
+            self._idle_flush.cancel()
+            self._idle_flush = None
+        if self._pending:
+            self._writer.writelines(self._pending)
+            self._pending = []
+            self._pending_size = 0
+
+    def _flush_idle(self) -> None:
+        self._idle_flush = None
+        if self._writer.transport.is_closing():
+            # The connection is being torn down (an error after the head
+            # was committed); there is no one left to write to.
+            self._pending = []
+            self._pending_size = 0
+            return
+        self._write_pending()
+        self._undrained = True
+
+    async def _async_flush(self) -> None:
+        """Write everything queued and wait for the transport to drain."""
+        self._write_pending()
+        self._undrained = False
         await self._writer.drain()
 
     async def async_send_headers(self) -> None:
         if self.headers_sent:
             return
-        tosend = self.default_headers()
-        tosend.extend([f"{k}: {v}\r\n" for k, v in self.headers])
-        header_str = "{}\r\n".format("".join(tosend))
-        await self._async_send(util.to_bytestring(header_str, "latin-1"))
+        fields = "".join([f"{k}: {v}\r\n" for k, v in self.headers])
+        self._queue(self.default_headers() + f"{fields}\r\n".encode("latin-1"))
         self.headers_sent = True
 
     async def async_write(self, arg: bytes) -> None:
@@ -214,13 +281,19 @@ class Response:
         if self.chunked and tosend == 0:
             return
 
+        if self._undrained:
+            self._undrained = False
+            await self._writer.drain()
+
         self.sent += tosend
         if self.chunked:
-            chunk_size = f"{len(arg):X}\r\n"
-            chunk = b"".join([chunk_size.encode("utf-8"), arg, b"\r\n"])
-            await self._async_send(chunk)
+            self._queue(f"{len(arg):X}\r\n".encode("latin-1"))
+            self._queue(arg)
+            self._queue(b"\r\n")
         else:
-            await self._async_send(arg)
+            self._queue(arg)
+        if self._pending_size >= COALESCE_SIZE:
+            await self._async_flush()
 
     async def async_write_response(self, http_response: Any) -> None:
         """Write a plain.http.Response using async I/O."""
@@ -263,4 +336,5 @@ class Response:
         if not self.headers_sent:
             await self.async_send_headers()
         if self.chunked:
-            await self._async_send(b"0\r\n\r\n")
+            self._queue(CHUNKED_TERMINATOR)
+        await self._async_flush()
@@ -18,7 +18,7 @@ from __future__ import annotations
 
 import io
 import tempfile
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, BinaryIO, cast
 
 from .errors import BodyBudgetExceeded, ChunkedFramingError, LimitRequestBody
 
@@ -148,17 +148,18 @@ class BodySink:
         self.received = 0
         self._budget = budget
         # Allocated on the first feed — body-less requests (the common
-        # case) never pay for a SpooledTemporaryFile.
-        self._file: tempfile.SpooledTemporaryFile[bytes] | None = None
+        # case) never pay for a buffer.
+        self._file: BinaryIO | None = None
         self._finished = False
 
     @property
     def spooled(self) -> bool:
         """True once the body has spilled from memory to disk.
 
-        SpooledTemporaryFile rolls over when a write takes it strictly
-        past max_size, so this mirrors its state without reaching into
-        its internals.
+        The spill happens when a write takes the body strictly past
+        spool_size. A spooled body's stream is a real file, so the
+        multipart parser can hand out uploads as ranges of it instead of
+        copying them.
         """
         return self.received > self.spool_size
 
@@ -171,11 +172,15 @@ class BodySink:
             self._budget.charge(size)
         self.received += size
         if self._file is None:
+            self._file = io.BytesIO()
+        if self.spooled and isinstance(self._file, io.BytesIO):
             # Held for the request's lifetime, closed via close() — not
             # a context manager by design.
-            self._file = tempfile.SpooledTemporaryFile(  # noqa: SIM115
-                max_size=self.spool_size
-            )
+            spool = tempfile.TemporaryFile()  # noqa: SIM115
+            with self._file.getbuffer() as buffered:
+                spool.write(buffered)
+            self._file.close()
+            self._file = spool
         self._file.write(data)
 
     def finish(self) -> RequestStream:
@@ -185,9 +190,9 @@ class BodySink:
         if self._file is None:
             return io.BytesIO()
         self._file.seek(0)
-        # typeshed's SpooledTemporaryFile.read/readline stubs omit the
-        # None-accepting overload that their runtime delegates (BytesIO,
-        # BufferedRandom) support, so the protocol match needs a cast.
+        # typeshed's BinaryIO.read/readline stubs omit the None-accepting
+        # overload that the runtime classes (BytesIO, BufferedRandom)
+        # support, so the protocol match needs a cast.
         return cast("RequestStream", self._file)
 
     def close(self) -> None:
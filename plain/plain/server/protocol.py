@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable
+from typing import Any, cast
+
+# Unconsumed bytes buffered before the transport stops reading. A reader
+# that needs more (wait_for_data) resumes it, so a header block larger
+# than this still arrives — the bound is on read-ahead nobody asked for.
+READ_HIGH_WATER = 256 * 1024
+
+
+class ConnectionProtocol(asyncio.Protocol):
+    """Read side of a server connection, fed directly by the transport.
+
+    Stands in for asyncio.StreamReader/StreamReaderProtocol:
+    data_received appends straight into `buffer`, which the h1 header
+    scan searches in place, and reads slice it through a memoryview
+    rather than copying chunk by chunk. Read deadlines share one
+    TimerHandle per connection, re-armed only when a deadline moves
+    earlier than the armed one, instead of a wait_for timeout handle per
+    recv. The write side is a ConnectionWriter, whose drain() and
+    wait_closed() wait on this protocol's flow control callbacks.
+    """
+
+    def __init__(
+        self,
+        client_connected_cb: Callable[
+            [ConnectionProtocol, ConnectionWriter], Coroutine[Any, Any, None]
+        ]
+        | None = None,
+    ) -> None:
+        self._loop = asyncio.get_running_loop()
+        self.buffer = bytearray()
+        self.writer: ConnectionWriter | None = None
+        self._client_connected_cb = client_connected_cb
+        self._task: asyncio.Task[None] | None = None
+        self._transport: asyncio.Transport | None = None
+        self._over_ssl = False
+        self._reading_paused = False
+        self._eof = False
+        self._exception: BaseException | None = None
+        self._closed: asyncio.Future[None] = self._loop.create_future()
+        self._connection_lost = False
+
+        # Writers blocked in drain() while the transport's write buffer is
+        # over its high-water mark.
+        self._writing_paused = False
+        self._drain_waiters: deque[asyncio.Future[None]] = deque()
+
+        # The one pending read and its deadline (loop.time()). The timer
+        # outlives individual reads: when it fires after a read already
+        # finished it is simply dropped, and when a later read pushed
+        # the deadline out it re-arms for that deadline.
+        self._waiter: asyncio.Future[None] | None = None
+        self._deadline: float | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        # Not an isinstance check: uvloop's transports implement the
+        # interface without subclassing asyncio.Transport.
+        transport = cast(asyncio.Transport, transport)
+        self._transport = transport
+        self._over_ssl = transport.get_extra_info("sslcontext") is not None
+        writer = ConnectionWriter(transport, self)
+        self.writer = writer
+        if self._client_connected_cb is not None:
+            self._task = self._loop.create_task(self._client_connected_cb(self, writer))
+            self._task.add_done_callback(self._on_task_done)
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        self._wake()
+        if not self._reading_paused and len(self.buffer) > READ_HIGH_WATER:
+            assert self._transport is not None
+            self._transport.pause_reading()
+            self._reading_paused = True
+
+    def eof_received(self) -> bool:
+        self._eof = True
+        self._wake()
+        # Keep the write side open after a client half-close so a
+        # response can still go out; TLS can't half-close.
+        return not self._over_ssl
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        if exc is None:
+            self._eof = True
+        else:
+            self._exception = exc
+        self._wake()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+        self._connection_lost = True
+        self._writing_paused = False
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                if exc is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(exc)
+
+    def pause_writing(self) -> None:
+        self._writing_paused = True
+
+    def resume_writing(self) -> None:
+        self._writing_paused = False
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def drain(self) -> None:
+        """Wait until the transport's write buffer is below its high-water
+        mark; raises ConnectionResetError once the connection is lost."""
+        if self._connection_lost:
+            raise ConnectionResetError("Connection lost")
+        if not self._writing_paused:
+            return
+        waiter = self._loop.create_future()
+        self._drain_waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            self._drain_waiters.remove(waiter)
+
+    async def wait_closed(self) -> None:
+        """Wait until the connection is lost."""
+        await self._closed
+
+    def _on_task_done(self, task: asyncio.Task[None]) -> None:
+        self._task = None
+        if task.cancelled():
+            if self._transport is not None:
+                self._transport.close()
+            return
+        exc = task.exception()
+        if exc is not None:
+            self._loop.call_exception_handler(
+                {
+                    "message": "Unhandled exception in client_connected_cb",
+                    "exception": exc,
+                    "transport": self._transport,
+                }
+            )
+            if self._transport is not None:
+                self._transport.close()
+
+    def exception(self) -> BaseException | None:
+        return self._exception
+
+    def at_eof(self) -> bool:
+        return self._eof and not self.buffer
+
+    async def wait_for_data(self, timeout: float | None = None) -> None:
+        """Wait until more bytes are buffered or the peer closes.
+
+        Raises TimeoutError once `timeout` seconds pass without either
+        (or sooner, if shorten_deadline() moves the deadline in), and the
+        connection's error if it was lost to one. Returns immediately at
+        EOF — callers tell new bytes from EOF by the buffer length.
+        """
+        if self._exception is not None:
+            raise self._exception
+        if self._eof:
+            return
+        if self._reading_paused:
+            # The caller needs more than is buffered.
+            assert self._transport is not None
+            self._reading_paused = False
+            self._transport.resume_reading()
+        self._waiter = self._loop.create_future()
+        if timeout is not None:
+            self._set_deadline(self._loop.time() + timeout)
+        try:
+            await self._waiter
+        finally:
+            self._waiter = None
+            self._deadline = None
+        if self._exception is not None:
+            raise self._exception
+
+    async def wait_readable(self, timeout: float | None = None) -> bool:
+        """Wait for buffered bytes without consuming them; False at EOF."""
+        if not self.buffer:
+            await self.wait_for_data(timeout)
+        return bool(self.buffer)
+
+    async def read(self, n: int = -1, timeout: float | None = None) -> bytes:
+        """Read up to n bytes (all buffered when n < 0); b"" at EOF."""
+        if not self.buffer:
+            await self.wait_for_data(timeout)
+        return self.take(n)
+
+    def take(self, n: int = -1) -> bytes:
+        """Consume up to n already-buffered bytes (all when n < 0)."""
+        buf = self.buffer
+        if n < 0 or n >= len(buf):
+            data = bytes(buf)
+            buf.clear()
+            return data
+        with memoryview(buf) as view:
+            data = bytes(view[:n])
+        del buf[:n]
+        return data
+
+    def shorten_deadline(self, timeout: float) -> None:
+        """Cap the pending read, if any, at `timeout` seconds from now."""
+        if self._waiter is None:
+            return
+        deadline = self._loop.time() + timeout
+        if self._deadline is None or deadline < self._deadline:
+            self._set_deadline(deadline)
+
+    def _set_deadline(self, deadline: float) -> None:
+        self._deadline = deadline
+        if self._timer is not None:
+            if self._timer.when() <= deadline:
+                # Fires first and re-arms for the later deadline.
+                return
+            self._timer.cancel()
+        self._timer = self._loop.call_at(deadline, self._on_timer)
+
+    def _on_timer(self) -> None:
+        assert self._timer is not None
+        when = self._timer.when()
+        self._timer = None
+        if self._waiter is None or self._deadline is None:
+            return
+        if self._deadline <= when:
+            if not self._waiter.done():
+                self._waiter.set_exception(TimeoutError())
+        else:
+            self._timer = self._loop.call_at(self._deadline, self._on_timer)
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+
+class ConnectionWriter:
+    """Write side of a server connection.
+
+    The part of asyncio.StreamWriter the server uses, over the transport
+    directly. drain() and wait_closed() wait on ConnectionProtocol, which
+    tracks them through the public pause_writing/resume_writing and
+    connection_lost callbacks.
+    """
+
+    def __init__(
+        self, transport: asyncio.Transport, protocol: ConnectionProtocol
+    ) -> None:
+        self.transport = transport
+        self._protocol = protocol
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        self.transport.write(data)
+
+    def writelines(self, data: Iterable[bytes | bytearray | memoryview]) -> None:
+        self.transport.writelines(data)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        return self.transport.get_extra_info(name, default)
+
+    def is_closing(self) -> bool:
+        return self.transport.is_closing()
+
+    def close(self) -> None:
+        self.transport.close()
+
+    async def drain(self) -> None:
+        if self.transport.is_closing():
+            # Let connection_lost run, so drain() raises instead of
+            # returning on a connection that is already gone.
+            await asyncio.sleep(0)
+        await self._protocol.drain()
+
+    async def wait_closed(self) -> None:
+        await self._protocol.wait_closed()
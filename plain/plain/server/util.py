@@ -111,10 +111,22 @@ def _error_response_bytes(
     return response.encode("latin1")
 
 
+# (second, formatted) for the current time. The Date header only changes
+# once a second, so every response in that second shares one formatdate().
+_http_date_now: tuple[int, str] = (-1, "")
+
+
 def http_date(timestamp: float | None = None) -> str:
     """Return the current date and time formatted for a message header."""
+    global _http_date_now
     if timestamp is None:
-        timestamp = time.time()
+        second = int(time.time())
+        cached_second, cached = _http_date_now
+        if cached_second == second:
+            return cached
+        s = email.utils.formatdate(second, localtime=False, usegmt=True)
+        _http_date_now = (second, s)
+        return s
     s = email.utils.formatdate(timestamp, localtime=False, usegmt=True)
     return s
 
@@ -92,6 +92,17 @@ def worker_main(
                 log_format=plain.runtime.settings.LOG_FORMAT,
             )
 
+            if queue_size := plain.runtime.settings.SERVER_LOG_QUEUE_SIZE:
+                from plain.logs import app_logger
+                from plain.logs.writer import start_log_writer
+
+                from ..accesslog import access_log
+
+                start_log_writer(
+                    [logging.getLogger("plain"), app_logger, access_log],
+                    queue_size=queue_size,
+                )
+
             # Load the request handler
             handler = app.load()
 
@@ -150,3 +161,8 @@ def worker_main(
             heartbeat.close()
         except Exception:
             log.warning("Exception during worker exit:\n%s", traceback.format_exc())
+
+        # Write out whatever log output is still queued.
+        from plain.logs.writer import stop_log_writer
+
+        stop_log_writer()
@@ -10,8 +10,9 @@ from __future__ import annotations
 # An asyncio event loop runs all I/O (accept, TLS, read, write).
 # A thread pool handles only application code (middleware + views).
 #   New connection:
-#     1. Accept + TLS via asyncio.start_server(ssl=...) → reader/writer
-#     2. Read header bytes (async, until \r\n\r\n)
+#     1. Accept + TLS via loop.create_server(ssl=...) → ConnectionProtocol
+#        (read side, fed by data_received) + ConnectionWriter
+#     2. Read header bytes (async, until \r\n\r\n, scanned in place)
 #     3. Parse headers from buffer (inline, no I/O)
 #     4. Read body bytes (async, based on Content-Length or chunked)
 #     5. Dispatch view (thread pool for sync, event loop for async)
@@ -38,9 +39,12 @@ from plain.logs import get_framework_logger
 
 from .. import sock, util
 from ..connection import Connection
+from ..eventloop import LoopFactory, get_loop_factory
 from ..http import h1
 from ..http.h2 import async_handle_h2_connection
+from ..http.parsers import RequestParser, get_request_parser
 from ..http.sink import BodyBudget
+from ..protocol import ConnectionProtocol, ConnectionWriter
 from .workertmp import WorkerHeartbeat
 
 if TYPE_CHECKING:
@@ -160,8 +164,8 @@ class Worker:
         self.body_max_memory_size: int = memory_size
         if self.max_request_body is not None:
             # Floored at 1: a zero cap rejects every non-empty body
-            # before the spool matters, but SpooledTemporaryFile(0)
-            # disables rollover (unbounded RAM), so never hand the sink 0.
+            # before the spool matters, so keep the sink's threshold
+            # meaningful.
             self.body_max_memory_size = max(
                 1, min(self.body_max_memory_size, self.max_request_body)
             )
@@ -181,6 +185,14 @@ class Worker:
                 f"SERVER_KEEPALIVE_TIMEOUT must be positive "
                 f"(got {self.keepalive_timeout})."
             )
+        # Accelerated HTTP/1 parser, or None for the reference parser.
+        self.request_parser: RequestParser | None = get_request_parser(
+            settings.SERVER_HTTP_PARSER
+        )
+        # Factory for the event loop run() runs on; None = stdlib asyncio.
+        self.loop_factory: LoopFactory | None = get_loop_factory(
+            settings.SERVER_EVENT_LOOP
+        )
         healthcheck_path = settings.HEALTHCHECK_PATH
         self.healthcheck_path_bytes: bytes = (
             healthcheck_path.encode("ascii") if healthcheck_path else b""
@@ -247,6 +259,10 @@ class Worker:
         self.tpool: ThreadPoolExecutor = ThreadPoolExecutor(
             max_workers=self.app.threads
         )
+        # The handler sizes load shedding by the shared pool's threads
+        # (test handlers don't shed).
+        if use_executor := getattr(self.handler, "use_shared_executor", None):
+            use_executor(self.tpool, threads=self.app.threads)
 
         # Reseed the random number generator (must happen before jitter)
         util.seed()
@@ -301,7 +317,7 @@ class Worker:
         # Enter main run loop
         self.booted = True
         try:
-            asyncio.run(self.run())
+            asyncio.run(self.run(), loop_factory=self.loop_factory)
         finally:
             # The loop is closed — stop the reloader callback from
             # scheduling onto it.
@@ -371,8 +387,8 @@ class Worker:
         for listener in self.sockets:
             assert listener.sock is not None, "Listener socket is closed"
             listener.sock.setblocking(False)
-            server = await asyncio.start_server(
-                self._on_connection,
+            server = await loop.create_server(
+                lambda: ConnectionProtocol(self._on_connection),
                 sock=listener.sock,
                 ssl=ssl_ctx,
                 ssl_handshake_timeout=10 if ssl_ctx else None,
@@ -425,9 +441,9 @@ class Worker:
         await self._graceful_shutdown()
 
     async def _on_connection(
-        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+        self, reader: ConnectionProtocol, writer: ConnectionWriter
     ) -> None:
-        """Callback for each new connection from asyncio.start_server."""
+        """Callback for each new connection, started by its ConnectionProtocol."""
         # Reject immediately if at capacity — the connection is already
         # accepted (and TLS-negotiated for SSL) by the time we get here,
         # so queuing behind a semaphore would just waste resources.
@@ -587,7 +603,14 @@ class Worker:
             if pending:
                 await asyncio.wait(pending)
 
-        self.tpool.shutdown(wait=False)
+        self._shutdown_executors()
+
+    def _shutdown_executors(self, *, cancel_futures: bool = False) -> None:
+        self.tpool.shutdown(wait=False, cancel_futures=cancel_futures)
+        # The handler's SERVER_EXECUTOR_POOLS, when it has any (test
+        # handlers don't).
+        if shutdown_pools := getattr(self.handler, "shutdown_executor_pools", None):
+            shutdown_pools(cancel_futures=cancel_futures)
 
     def _begin_drain(self) -> None:
         """Enter graceful shutdown: flip alive, publish the drain state.
@@ -637,13 +660,13 @@ class Worker:
         # shutdown_event is set (connection loops watch the event).
         self.alive = False
         self.shutdown_event.set()
-        self.tpool.shutdown(wait=False, cancel_futures=True)
+        self._shutdown_executors(cancel_futures=True)
         sys.exit(0)
 
     def handle_abort(self, sig: int, frame: FrameType | None) -> None:
         self.alive = False
         self.shutdown_event.set()
-        self.tpool.shutdown(wait=False, cancel_futures=True)
+        self._shutdown_executors(cancel_futures=True)
         sys.exit(1)
 
     def _handle_memory_signal(self) -> None:
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from collections.abc import Generator, Iterable
-from email.utils import formatdate
+from datetime import UTC
+from email.utils import formatdate, parsedate_to_datetime
 from typing import Any
 from urllib.parse import quote, unquote
 from urllib.parse import urlencode as original_urlencode
@@ -69,6 +70,20 @@ def http_date(epoch_seconds: float | None = None) -> str:
     return formatdate(epoch_seconds, usegmt=True)
 
 
+def parse_http_date(date: str) -> float | None:
+    """
+    Parse an HTTP date (any of the three formats RFC 9110 Section 5.6.7
+    accepts) into seconds since the epoch, or None if it isn't one.
+    """
+    try:
+        parsed = parsedate_to_datetime(date)
+    except (TypeError, ValueError):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=UTC)
+    return parsed.timestamp()
+
+
 # Base 36 functions: useful for generating compact URLs
 
 
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import inspect
 from collections.abc import Awaitable, Callable
+from datetime import datetime
 from typing import Any, ClassVar
 
 from plain.http import (
     NotAllowedResponse,
+    NotModifiedResponse,
     Request,
     Response,
     status_for_exception,
     status_omits_body,
 )
+from plain.http.conditional import is_not_modified, validator_headers
 from plain.logs import get_framework_logger, log_exception
 
 from .exceptions import ResponseException
@@ -30,6 +33,14 @@ class View[HandlerResult = Response]:
 
     implemented_methods: ClassVar[frozenset[str]] = frozenset()
 
+    # Name of a SERVER_EXECUTOR_POOLS pool to run on instead of the
+    # worker's shared thread pool.
+    executor_pool: ClassVar[str | None] = None
+
+    # Dispatch async handlers before the request body has arrived, to read
+    # it with `request.stream_body()` as it does.
+    stream_request_body: ClassVar[bool] = False
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
         cls.implemented_methods = frozenset(
@@ -91,6 +102,20 @@ class View[HandlerResult = Response]:
     def before_request(self) -> None:
         """Pre-dispatch hook. Raise to reject the request."""
 
+    def get_response_etag(self) -> str | None:
+        """Validator for GET/HEAD responses, checked before the handler runs.
+
+        Derive it from whatever the body is rendered from (a row's
+        `updated_at`, a version counter) — when it matches the client's
+        `If-None-Match`, the handler is skipped and a 304 goes out.
+        Quotes are added if missing.
+        """
+        return None
+
+    def get_response_last_modified(self) -> datetime | None:
+        """Like `get_response_etag`, matched against `If-Modified-Since`."""
+        return None
+
     def after_response(self, response: Response) -> Response:
         """Post-dispatch hook. Runs for every response — successes, errors, 405s.
 
@@ -128,24 +153,52 @@ class View[HandlerResult = Response]:
                     },
                 )
                 response: Response = NotAllowedResponse(self._allowed_methods())
+            elif (validators := self._get_validators()) and is_not_modified(
+                self.request,
+                etag=validators.get("ETag"),
+                last_modified=validators.get("Last-Modified"),
+            ):
+                response = NotModifiedResponse(headers=validators)
             elif inspect.iscoroutinefunction(handler):
-                return self._dispatch_handler_async(handler)  # ty: ignore[invalid-return-type]
+                return self._dispatch_handler_async(handler, validators)  # ty: ignore[invalid-return-type]
             else:
                 response = self.convert_result_to_response(handler())
+                self._add_validators(response, validators)
         except Exception as e:
             response = self._respond_to_exception(e)
         return self.after_response(response)
 
     async def _dispatch_handler_async(
-        self, handler: Callable[[], Awaitable[Response]]
+        self,
+        handler: Callable[[], Awaitable[Response]],
+        validators: dict[str, str],
     ) -> Response:
         try:
             result = await handler()
             response = self.convert_result_to_response(result)
+            self._add_validators(response, validators)
         except Exception as e:
             response = self._respond_to_exception(e)
         return self.after_response(response)
 
+    def _get_validators(self) -> dict[str, str]:
+        """ETag / Last-Modified headers from the view's declared validators."""
+        if self.request.method not in ("GET", "HEAD"):
+            return {}
+        return validator_headers(
+            self.get_response_etag(), self.get_response_last_modified()
+        )
+
+    @staticmethod
+    def _add_validators(response: Response, validators: dict[str, str]) -> None:
+        # Stamp the 200 with the view's own validators — otherwise
+        # ConditionalGetMiddleware would hash the body, and the client's
+        # next If-None-Match would never match get_response_etag().
+        if response.status_code == 200:
+            for header, value in validators.items():
+                if header not in response.headers:
+                    response.headers[header] = value
+
     def _respond_to_exception(self, exc: Exception) -> Response:
         if isinstance(exc, ResponseException):
             return exc.response
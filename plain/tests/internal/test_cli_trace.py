@@ -179,6 +179,30 @@ def test_transaction_statements_are_counted_apart_from_queries() -> None:
     assert [q["sql"] for q in analysis["queries"]] == ["SELECT * FROM users"]
 
 
+@pytest.mark.usefixtures("_otel_clean")
+def test_sums_queries_saved_by_auto_prefetch() -> None:
+    tracer = trace.get_tracer("test")
+    with tracer.start_as_current_span("GET /"):
+        for saved in (9, 4):
+            with (
+                tracer.start_as_current_span(
+                    "auto_prefetch Post.author",
+                    attributes={"plain.postgres.auto_prefetch.saved_queries": saved},
+                ),
+                tracer.start_as_current_span(
+                    "SELECT users",
+                    kind=trace.SpanKind.CLIENT,
+                    attributes=_query_attributes("SELECT * FROM users"),
+                ),
+            ):
+                pass
+
+    analysis = _only_analysis()
+
+    assert analysis["query_count"] == 2
+    assert analysis["auto_prefetch_saved_queries"] == 13
+
+
 @pytest.mark.usefixtures("_otel_clean")
 def test_emits_flat_raw_spans() -> None:
     tracer = trace.get_tracer("test")
@@ -258,6 +282,60 @@ def test_captures_exceptions() -> None:
     assert any(e["name"] == "exception" for e in raw_events)
 
 
+@pytest.mark.usefixtures("_otel_clean")
+def test_merges_template_profiles_by_self_time() -> None:
+    tracer = trace.get_tracer("test")
+    with tracer.start_as_current_span("GET /"):
+        for _ in range(2):
+            with tracer.start_as_current_span("render page.html") as span:
+                span.add_event(
+                    "template.profile",
+                    attributes={
+                        "template.profile.kind": ["template", "template"],
+                        "template.profile.name": ["page.html", "row.html"],
+                        "template.profile.calls": [1, 3],
+                        "template.profile.total_ms": [5.0, 3.0],
+                        "template.profile.self_ms": [2.0, 3.0],
+                    },
+                )
+
+    analysis = _only_analysis()
+
+    assert analysis["templates"] == [
+        {
+            "kind": "template",
+            "name": "row.html",
+            "count": 6,
+            "total_duration_ms": 6.0,
+            "self_duration_ms": 6.0,
+        },
+        {
+            "kind": "template",
+            "name": "page.html",
+            "count": 2,
+            "total_duration_ms": 10.0,
+            "self_duration_ms": 4.0,
+        },
+    ]
+
+
+@pytest.mark.usefixtures("_otel_clean")
+def test_counts_fragment_cache_hits_and_misses() -> None:
+    tracer = trace.get_tracer("test")
+    with tracer.start_as_current_span("GET /"):
+        for name, hit in [("sidebar", True), ("footer", False), ("sidebar", False)]:
+            with tracer.start_as_current_span(
+                f"cache fragment {name}",
+                attributes={"plain.cache.fragment": name, "plain.cache.hit": hit},
+            ):
+                pass
+
+    assert _only_analysis()["fragments"] == [
+        {"name": "sidebar", "hits": 1, "misses": 1},
+        {"name": "footer", "hits": 0, "misses": 1},
+    ]
+
+
 def _raw_span(*, span_id: str, parent: str | None, name: str) -> RawSpan:
     return {
         "name": name,
@@ -365,8 +443,11 @@ def test_trace_note_states(monkeypatch) -> None:
                 "span_count": 1,
                 "query_count": 0,
                 "transaction_count": 0,
+                "auto_prefetch_saved_queries": 0,
                 "exceptions": [],
                 "queries": [],
+                "templates": [],
+                "fragments": [],
             },
             "spans": [],
         }
@@ -383,8 +464,11 @@ def _captured_with_queries(queries: list) -> CapturedTrace:
             "span_count": len(queries),
             "query_count": sum(q["count"] for q in queries),
             "transaction_count": 0,
+            "auto_prefetch_saved_queries": 0,
             "exceptions": [],
             "queries": queries,
+            "templates": [],
+            "fragments": [],
         },
         "spans": [],
     }
@@ -432,3 +516,37 @@ def test_display_cap_never_cuts_a_repeated_statement(monkeypatch, capsys) -> Non
     # Only the one cut singleton is counted — not the kept repeat.
     assert "+ 1 more — see --trace" in output
     assert "singleton_3" not in output
+
+
+def test_template_section_lists_self_time(capsys) -> None:
+    captured = _captured_with_queries([])
+    captured["analysis"]["templates"] = [
+        {
+            "kind": "block",
+            "name": "page.html:content",
+            "count": 1,
+            "total_duration_ms": 9.5,
+            "self_duration_ms": 1.25,
+        }
+    ]
+
+    _render_traces([captured], detailed=False)
+
+    output = capsys.readouterr().out
+    assert "Templates: 1" in output
+    assert "1×     1.25ms  block page.html:content" in output
+    assert "9.50ms total" in output
+
+
+def test_fragment_section_lists_hits_and_misses(capsys) -> None:
+    captured = _captured_with_queries([])
+    captured["analysis"]["fragments"] = [
+        {"name": "sidebar", "hits": 3, "misses": 1},
+    ]
+
+    _render_traces([captured], detailed=False)
+
+    output = capsys.readouterr().out
+    assert "Cache fragments: 1" in output
+    assert "3 of 4 lookups hit" in output
+    assert "  3 hit    1 miss  sidebar" in output
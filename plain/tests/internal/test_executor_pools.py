@@ -0,0 +1,151 @@
+"""SERVER_EXECUTOR_POOLS: views that name a pool run on its threads, so a
+slow endpoint can't starve the worker's shared pool."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+from typing import Any
+
+import pool_routers
+import pytest
+from plain.exceptions import ImproperlyConfigured
+from plain.internal.handlers.base import BaseHandler
+from plain.internal.handlers.pools import parse_executor_pools
+from plain.preflight.server import CheckServerExecutorPools
+from plain.runtime import settings
+from plain.test import RequestFactory
+from plain.test.otel import install_test_meter
+from plain.urls.resolvers import _get_cached_resolver
+
+_metric_reader = install_test_meter()
+
+rf = RequestFactory()
+
+
+@pytest.fixture
+def handler(monkeypatch):
+    monkeypatch.setattr(settings, "URLS_ROUTER", "pool_routers.PoolRouter")
+    monkeypatch.setattr(
+        settings,
+        "SERVER_EXECUTOR_POOLS",
+        {"exports": {"threads": 1, "max_queue": 1}},
+    )
+    _get_cached_resolver.cache_clear()
+    pool_routers.export_release.clear()
+    handler = BaseHandler()
+    handler.load_middleware()
+    yield handler
+    pool_routers.export_release.set()
+    handler.shutdown_executor_pools()
+    _get_cached_resolver.cache_clear()
+
+
+def _gauge(name: str, pool: str) -> float | None:
+    data = _metric_reader.get_metrics_data()
+    assert data is not None
+    points: list[Any] = [
+        point
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+        if metric.name == name
+        for point in metric.data.data_points
+    ]
+    for point in points:
+        if point.attributes.get("plain.executor.pool") == pool:
+            return point.value
+    return None
+
+
+def test_slow_pool_does_not_starve_the_shared_pool(handler):
+    async def run():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            export = asyncio.create_task(handler.handle(rf.get("/export"), executor))
+            queued_export = asyncio.create_task(
+                handler.handle(rf.get("/export"), executor)
+            )
+            while handler._pools is None or handler._pools["exports"].queue.depth < 1:
+                await asyncio.sleep(0.01)
+
+            # The exports pool is busy and its queue full: the shared pool
+            # still serves, and a third export is shed.
+            fast = await asyncio.wait_for(
+                handler.handle(rf.get("/fast"), executor), timeout=2
+            )
+            shed = await handler.handle(rf.get("/export"), executor)
+            utilization = _gauge("plain.server.executor.utilization", "exports")
+            depth = _gauge("plain.server.executor.queue.depth", "exports")
+
+            pool_routers.export_release.set()
+            return fast, shed, utilization, depth, await export, await queued_export
+
+    fast, shed, utilization, depth, export, queued_export = asyncio.run(run())
+
+    assert fast.status_code == 200
+    assert not fast.content.startswith(b"plain-exports")
+    assert shed.status_code == 503
+    assert utilization == 1.0
+    assert depth == 1
+    assert export.content.startswith(b"plain-exports")
+    assert queued_export.status_code == 200
+
+
+def test_zero_max_queue_serves_an_idle_pool(handler, monkeypatch):
+    monkeypatch.setattr(
+        settings, "SERVER_EXECUTOR_POOLS", {"exports": {"threads": 1, "max_queue": 0}}
+    )
+
+    async def run():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            pool_routers.export_release.set()
+            idle = await handler.handle(rf.get("/export"), executor)
+
+            # With its only thread busy, the next request would have to wait
+            pool_routers.export_release.clear()
+            export = asyncio.create_task(handler.handle(rf.get("/export"), executor))
+            while handler._pools is None or handler._pools["exports"].queue.busy < 1:
+                await asyncio.sleep(0.01)
+            shed = await handler.handle(rf.get("/export"), executor)
+
+            pool_routers.export_release.set()
+            return idle, shed, await export
+
+    idle, shed, export = asyncio.run(run())
+
+    assert idle.status_code == 200
+    assert shed.status_code == 503
+    assert export.status_code == 200
+
+
+def test_unmatched_paths_run_on_the_shared_pool(handler):
+    async def run():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return await handler.handle(rf.get("/nowhere"), executor)
+
+    assert asyncio.run(run()).status_code == 404
+
+
+@pytest.mark.parametrize(
+    ("config", "message"),
+    [
+        ({"default": {"threads": 2}}, "can't define 'default'"),
+        ({"exports": {"threads": 0}}, "must be a positive integer"),
+        ({"exports": {"threads": 2, "max_queue": -1}}, "non-negative"),
+        ({"exports": {"threads": 2, "queue": 5}}, "unknown options ['queue']"),
+    ],
+)
+def test_invalid_pool_config(config, message):
+    with pytest.raises(ImproperlyConfigured, match=message.replace("[", r"\[")):
+        parse_executor_pools(config)
+
+
+def test_preflight_reports_unknown_pool_names(monkeypatch):
+    monkeypatch.setattr(settings, "URLS_ROUTER", "pool_routers.UnknownPoolRouter")
+    _get_cached_resolver.cache_clear()
+    try:
+        results = CheckServerExecutorPools().run()
+    finally:
+        _get_cached_resolver.cache_clear()
+    assert [result.id for result in results] == ["server.executor_pool_unknown"]
+    assert "UnknownPoolView.executor_pool is 'missing'" in results[0].fix
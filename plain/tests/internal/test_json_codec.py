@@ -0,0 +1,201 @@
+"""JSON_CODEC: every codec encodes and parses like the stdlib with
+PlainJSONEncoder.
+
+The orjson half of each parametrized test is skipped when orjson isn't
+installed. Output is compared after parsing — codecs may differ in
+whitespace and escaping, not in values.
+"""
+
+# ruff: noqa: DTZ001 — naive datetimes are deliberate here: codecs must
+# encode them without an offset, exactly as PlainJSONEncoder does.
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import decimal
+import importlib.util
+import json
+import uuid
+from typing import Any
+
+import pytest
+from plain.exceptions import ImproperlyConfigured
+from plain.http import JsonResponse
+from plain.json import JSONCodec, PlainJSONEncoder, load_json_codec
+from plain.preflight.settings import CheckJSONCodec
+from plain.runtime import settings
+from plain.test import RequestFactory
+from plain.utils.functional import lazy
+
+HAS_ORJSON = importlib.util.find_spec("orjson") is not None
+
+CODECS = [
+    pytest.param("json", id="json"),
+    pytest.param(
+        "orjson",
+        id="orjson",
+        marks=pytest.mark.skipif(not HAS_ORJSON, reason="orjson not installed"),
+    ),
+]
+
+UTC = datetime.UTC
+PLUS_TWO = datetime.timezone(datetime.timedelta(hours=2))
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+VALUES: list[Any] = [
+    None,
+    True,
+    0,
+    -1,
+    2**63 - 1,
+    2**70,
+    1.5,
+    "",
+    "snow ☃ and \U0001f600",
+    'quote " backslash \\ control \x00\x1f',
+    [],
+    {},
+    [1, [2, [3, {"a": None}]]],
+    (1, 2),
+    {1: "int key", 2.5: "float key", False: "bool key", None: "null key"},
+    datetime.datetime(2024, 5, 6, 7, 8, 9),
+    datetime.datetime(2024, 5, 6, 7, 8, 9, 123456),
+    datetime.datetime(2024, 5, 6, 7, 8, 9, 999, tzinfo=UTC),
+    datetime.datetime(2024, 5, 6, 7, 8, 9, tzinfo=PLUS_TWO),
+    datetime.date(2024, 5, 6),
+    datetime.time(7, 8, 9),
+    datetime.time(7, 8, 9, 123456),
+    datetime.timedelta(days=2, hours=3, microseconds=5),
+    datetime.timedelta(seconds=-1),
+    decimal.Decimal("1.10"),
+    decimal.Decimal("-0.000000001"),
+    uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    lazy(lambda: "lazy text", str)(),
+]
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize("value", VALUES, ids=repr)
+def test_dumps_matches_plain_json_encoder(name, value):
+    codec = load_json_codec(name)
+    expected = json.dumps(value, cls=PlainJSONEncoder)
+
+    assert json.loads(codec.dumps(value)) == json.loads(expected)
+    assert codec.dumps_bytes(value).decode() == codec.dumps(value)
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize(
+    "value",
+    [
+        object(),
+        {"point": Point(1, 2)},
+        {("tuple", "key"): 1},
+        {"x": datetime.time(7, 8, 9, tzinfo=UTC)},
+    ],
+    ids=repr,
+)
+def test_dumps_refuses_what_plain_json_encoder_refuses(name, value):
+    codec = load_json_codec(name)
+    with pytest.raises((TypeError, ValueError)) as expected:
+        json.dumps(value, cls=PlainJSONEncoder)
+    with pytest.raises(expected.type):
+        codec.dumps(value)
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime.datetime(2024, 5, 6),
+        datetime.date(2024, 5, 6),
+        decimal.Decimal(1),
+        Point(1, 2),
+    ],
+    ids=repr,
+)
+def test_strict_dumps_refuses_what_json_refuses(name, value):
+    with pytest.raises(TypeError):
+        load_json_codec(name).dumps({"v": value}, strict=True)
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": [1, 2.5, "x", null, true, false]}',
+        '"\\u2603 \\ud83d\\ude00"',
+        " [ ] ",
+        "NaN",
+        '{"dup": 1, "dup": 2}',
+    ],
+)
+def test_loads_matches_json(name, text):
+    codec = load_json_codec(name)
+    expected = json.loads(text)
+    # Compared by repr so that NaN matches NaN.
+    assert repr(codec.loads(text)) == repr(expected)
+    assert repr(codec.loads(text.encode())) == repr(expected)
+
+
+@pytest.mark.parametrize("name", CODECS)
+@pytest.mark.parametrize("text", ["", "{", "[1,]", "{'a': 1}", "tru"])
+def test_loads_rejects_invalid_json(name, text):
+    with pytest.raises(json.JSONDecodeError):
+        load_json_codec(name).loads(text.encode())
+
+
+@pytest.mark.parametrize("name", CODECS)
+def test_json_response_and_request_use_the_codec(name, monkeypatch):
+    monkeypatch.setattr(settings, "JSON_CODEC", name)
+    value = {"at": datetime.datetime(2024, 5, 6, tzinfo=UTC), "n": decimal.Decimal(1)}
+
+    response = JsonResponse(value)
+    assert json.loads(response.content) == {"at": "2024-05-06T00:00:00Z", "n": "1"}
+
+    request = RequestFactory().post(
+        "/", data=response.content, content_type="application/json"
+    )
+    assert request.json_data == {"at": "2024-05-06T00:00:00Z", "n": "1"}
+
+
+def test_json_response_custom_encoder_bypasses_the_codec(monkeypatch):
+    monkeypatch.setattr(settings, "JSON_CODEC", "tests.codec_does_not_exist")
+    response = JsonResponse({"a": 1}, json_dumps_params={"indent": 2})
+    assert response.content == b'{\n  "a": 1\n}'
+
+
+class UpperCodec(JSONCodec):
+    def dumps(self, obj: Any, *, strict: bool = False) -> str:
+        return super().dumps(obj, strict=strict).upper()
+
+
+def test_custom_codec_by_import_path(monkeypatch):
+    monkeypatch.setattr(settings, "JSON_CODEC", f"{__name__}.UpperCodec")
+    assert JsonResponse({"a": "b"}).content == b'{"A": "B"}'
+
+
+@pytest.mark.parametrize(
+    ("name", "message"),
+    [
+        ("simplejson", "must be"),
+        ("plain.json.PlainJSONEncoder", "is not a JSONCodec subclass"),
+    ],
+)
+def test_invalid_codec(name, message, monkeypatch):
+    with pytest.raises(ImproperlyConfigured, match=message):
+        load_json_codec(name)
+
+    monkeypatch.setattr(settings, "JSON_CODEC", name)
+    results = CheckJSONCodec().run()
+    assert [result.id for result in results] == ["settings.json_codec_invalid"]
+
+
+def test_auto_uses_orjson_only_when_installed():
+    assert load_json_codec("auto").name == ("orjson" if HAS_ORJSON else "json")
@@ -0,0 +1,132 @@
+"""Queue-time measurement and load shedding in BaseHandler.handle.
+
+Requests that waited past SERVER_MAX_QUEUE_WAIT, or that arrive with
+SERVER_MAX_QUEUE_DEPTH requests already waiting for a thread, get a fast
+503 instead of running; HEALTHCHECK_PATH is never shed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import Any
+
+import pytest
+from plain.internal.handlers.base import BaseHandler, _request_start_age
+from plain.runtime import settings
+from plain.test import RequestFactory
+from plain.test.otel import install_test_meter
+
+_metric_reader = install_test_meter()
+
+rf = RequestFactory()
+
+
+@pytest.fixture
+def handler() -> BaseHandler:
+    handler = BaseHandler()
+    handler.load_middleware()
+    return handler
+
+
+def _handle(handler: BaseHandler, request, *, waited: float = 0.0):
+    # Stand in for the server's stamp: the request was received `waited`
+    # seconds ago.
+    request._queued_at = time.monotonic() - waited
+
+    async def run():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return await handler.handle(request, executor)
+
+    return asyncio.run(run())
+
+
+def test_request_start_formats():
+    now = 1_700_000_010.0
+    assert _request_start_age("1700000000000", now) == pytest.approx(10)  # Heroku
+    assert _request_start_age("t=1700000000.000", now) == pytest.approx(10)  # nginx
+    assert _request_start_age("t=1700000000000000", now) == pytest.approx(10)  # Apache
+    assert _request_start_age("1700000020000", now) == 0.0  # clock skew
+    assert _request_start_age("t=soon", now) is None
+
+
+def test_long_queue_wait_is_shed(handler, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_MAX_QUEUE_WAIT", 1.0)
+
+    response = _handle(handler, rf.get("/"), waited=2.0)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+    assert _handle(handler, rf.get("/")).status_code == 200
+
+
+def test_healthcheck_is_never_shed(handler, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_MAX_QUEUE_WAIT", 1.0)
+    monkeypatch.setattr(settings, "HEALTHCHECK_PATH", "/")
+
+    assert _handle(handler, rf.get("/"), waited=2.0).status_code == 200
+
+
+def test_x_request_start_counts_upstream_wait(handler, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_MAX_QUEUE_WAIT", 1.0)
+    started = f"t={time.time() - 2:.3f}"
+
+    # Untrusted, the header is ignored.
+    request = rf.get("/", headers={"X-Request-Start": started})
+    assert _handle(handler, request).status_code == 200
+
+    monkeypatch.setattr(settings, "HTTP_X_REQUEST_START", True)
+    request = rf.get("/", headers={"X-Request-Start": started})
+    assert _handle(handler, request).status_code == 503
+
+
+def test_full_queue_is_shed_without_queueing(handler, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_MAX_QUEUE_DEPTH", 1)
+    release = threading.Event()
+
+    async def run():
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            # Occupy the only thread so the next request has to wait.
+            busy = executor.submit(release.wait, 5)
+
+            queued = asyncio.create_task(handler.handle(rf.get("/"), executor))
+            while (
+                handler._default_pool is None or handler._default_pool.queue.depth < 1
+            ):
+                await asyncio.sleep(0.01)
+
+            shed = await handler.handle(rf.get("/"), executor)
+            release.set()
+            busy.result()
+            return shed, await queued
+
+    shed, queued = asyncio.run(run())
+    assert shed.status_code == 503
+    assert queued.status_code == 200
+    assert handler._default_pool is not None
+    assert handler._default_pool.queue.depth == 0
+
+
+def test_zero_queue_depth_serves_an_idle_pool(handler, monkeypatch):
+    monkeypatch.setattr(settings, "SERVER_MAX_QUEUE_DEPTH", 0)
+
+    assert _handle(handler, rf.get("/")).status_code == 200
+
+
+def test_queue_wait_is_recorded(handler):
+    _handle(handler, rf.get("/"), waited=0.25)
+
+    data = _metric_reader.get_metrics_data()
+    assert data is not None
+    points: list[Any] = [
+        point
+        for resource in data.resource_metrics
+        for scope in resource.scope_metrics
+        for metric in scope.metrics
+        if metric.name == "plain.server.request.queue.duration"
+        for point in metric.data.data_points
+    ]
+    assert points
+    assert max(point.max for point in points) >= 0.25
@@ -0,0 +1,151 @@
+"""Queued log output: a blocked stdout holds up the log writer thread, not
+the requests that log, and each batch reaches a stream in one write."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+
+import pytest
+from plain.http import Response
+from plain.logs import writer as log_writer
+from plain.logs.configure import create_log_formatter
+from plain.logs.writer import start_log_writer, stop_log_writer
+from plain.server.accesslog import access_log
+from server_stubs import ResponseHandler, h1_connect, make_worker
+
+
+class _GatedStream:
+    """A stream whose first write blocks until released."""
+
+    def __init__(self) -> None:
+        self.writes: list[str] = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data: str) -> None:
+        self.entered.set()
+        self.release.wait(5)
+        self.writes.append(data)
+
+    def flush(self) -> None:
+        pass
+
+
+@pytest.fixture
+def logger():
+    logger = logging.getLogger("plain.tests.log_writer")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger
+    stop_log_writer()
+    logger.handlers.clear()
+
+
+def test_batch_is_one_write_per_stream(logger):
+    stream = _GatedStream()
+    logger.addHandler(logging.StreamHandler(stream))
+    start_log_writer([logger], queue_size=1000)
+
+    logger.info("first")
+    assert stream.entered.wait(5)
+    for i in range(100):
+        logger.info("line %s", i)
+    stream.release.set()
+    stop_log_writer()
+
+    assert stream.writes == [
+        "first\n",
+        "".join(f"line {i}\n" for i in range(100)),
+    ]
+
+
+def test_full_queue_drops_instead_of_blocking(logger):
+    stream = _GatedStream()
+    logger.addHandler(logging.StreamHandler(stream))
+    start_log_writer([logger], queue_size=2)
+
+    logger.info("taken by the writer")
+    assert stream.entered.wait(5)
+    for i in range(5):
+        logger.info("queued or dropped %s", i)
+    assert log_writer._writer is not None
+    assert log_writer._writer.dropped == 3
+
+    stream.release.set()
+    stop_log_writer()
+    assert "".join(stream.writes).splitlines() == [
+        "taken by the writer",
+        "queued or dropped 0",
+        "queued or dropped 1",
+    ]
+
+
+def test_stop_restores_handlers_and_flushes(logger):
+    stream = _GatedStream()
+    stream.release.set()
+    handler = logging.StreamHandler(stream)
+    other = logging.NullHandler()
+    logger.addHandler(handler)
+    logger.addHandler(other)
+
+    start_log_writer([logger], queue_size=1000)
+    # Only stream handlers move behind the queue.
+    assert other in logger.handlers
+    assert handler not in logger.handlers
+
+    # Arguments are resolved when the record is logged, not when written.
+    context = {"n": 1}
+    logger.info("n=%(n)s", context)
+    context["n"] = 2
+    stop_log_writer()
+
+    assert handler in logger.handlers
+    assert other in logger.handlers
+    assert not any(isinstance(h, log_writer.QueuedHandler) for h in logger.handlers)
+    assert "".join(stream.writes) == "n=1\n"
+
+
+def test_blocked_stdout_does_not_stall_requests():
+    # Nothing reads the pipe until the requests are done, so its buffer
+    # (64 KiB on Linux) fills after the first few dozen access lines and
+    # every write after that blocks.
+    path = "/" + "x" * 1000
+    request = f"GET {path} HTTP/1.1\r\nHost: testserver\r\n\r\n".encode()
+
+    async def scenario() -> None:
+        worker = make_worker(handler=ResponseHandler(lambda: Response(b"ok")))
+        client = await h1_connect(worker)
+        try:
+            for _ in range(300):
+                await client.send(request)
+                _, body = await client.read_response()
+                assert body == b"ok"
+        finally:
+            client.teardown()
+
+    read_fd, write_fd = os.pipe()
+
+    def drain() -> None:
+        with open(read_fd, "rb") as reader:
+            while reader.read(65536):
+                pass
+
+    drainer = threading.Thread(target=drain)
+    saved = (access_log.handlers[:], access_log.level, access_log.propagate)
+    with open(write_fd, "w") as pipe:
+        handler = logging.StreamHandler(pipe)
+        handler.setFormatter(create_log_formatter("keyvalue"))
+        access_log.handlers[:] = [handler]
+        access_log.setLevel(logging.INFO)
+        access_log.propagate = False
+        start_log_writer([access_log], queue_size=10000)
+        try:
+            asyncio.run(asyncio.wait_for(scenario(), timeout=10))
+        finally:
+            drainer.start()
+            stop_log_writer()
+            access_log.handlers[:], access_log.level, access_log.propagate = saved
+    drainer.join(5)
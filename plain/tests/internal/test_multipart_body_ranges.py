@@ -0,0 +1,184 @@
+"""Uploads in a body the server spooled to disk are handed out as byte
+ranges of the body file, not copied.
+
+Each case parses the same bytes twice — from a BytesIO (the chunked path)
+and from a real temp file (the range path) — and expects the same result.
+"""
+
+from __future__ import annotations
+
+import base64
+import random
+import tempfile
+from io import BytesIO
+
+import pytest
+from plain.http import Request
+from plain.http.multipartparser import MultiPartParser
+from plain.internal.files.uploadedfile import (
+    BodyRangeUploadedFile,
+    InMemoryUploadedFile,
+    TemporaryUploadedFile,
+)
+from plain.internal.files.uploadhandler import FileUploadHandler
+from plain.runtime import settings
+
+BOUNDARY = "TeStBoUnDaRy"
+
+
+@pytest.fixture(autouse=True)
+def small_memory_limit(monkeypatch):
+    monkeypatch.setattr(settings, "FILE_UPLOAD_MAX_MEMORY_SIZE", 100)
+
+
+def _body(*parts: tuple[str, str | None, bytes], headers: str = "") -> bytes:
+    body = b""
+    for name, filename, content in parts:
+        disposition = f'form-data; name="{name}"'
+        if filename:
+            disposition += f'; filename="{filename}"'
+        body += (
+            f"--{BOUNDARY}\r\nContent-Disposition: {disposition}\r\n{headers}\r\n"
+        ).encode()
+        body += content + b"\r\n"
+    return body + f"--{BOUNDARY}--\r\n".encode()
+
+
+def _parse(body: bytes, stream):
+    request = Request(
+        method="POST",
+        path="/",
+        headers={
+            "Content-Type": f"multipart/form-data; boundary={BOUNDARY}",
+            "Content-Length": str(len(body)),
+        },
+    )
+    request._stream = stream
+    return MultiPartParser(request).parse()
+
+
+def _parse_from_file(body: bytes):
+    # Closed on return, like the server's spool after the request; the
+    # ranges hold their own descriptor.
+    with tempfile.TemporaryFile() as spool:
+        spool.write(body)
+        spool.seek(0)
+        return _parse(body, spool)
+
+
+def _contents(files):
+    return {
+        name: [(upload.name, upload.size, upload.read()) for upload in uploads]
+        for name, uploads in files.lists()
+    }
+
+
+# Data that looks like the start of a boundary, and a random blob.
+TRICKY = b"\r\n--TeStBoUnDa\r\n--\r\r\n-" * 40 + b"\r"
+BLOB = random.Random(3).randbytes(5000)
+
+
+@pytest.mark.parametrize("chunk_size", [4, 13, 64, 4096])
+def test_files_are_ranges_of_the_body(chunk_size, monkeypatch):
+    monkeypatch.setattr(FileUploadHandler, "chunk_size", chunk_size)
+    body = _body(
+        ("note", None, b"hello"),
+        ("doc", "tricky.txt", TRICKY),
+        ("doc", "blob.bin", BLOB),
+        ("empty", "empty.txt", b""),
+    )
+
+    expected_post, expected_files = _parse(body, BytesIO(body))
+    post, files = _parse_from_file(body)
+
+    assert post == expected_post
+    assert _contents(files) == _contents(expected_files)
+    assert {type(upload) for _, uploads in files.lists() for upload in uploads} == {
+        BodyRangeUploadedFile
+    }
+
+
+def test_range_file_reads_and_seeks_within_its_range():
+    _, files = _parse_from_file(_body(("doc", "blob.bin", BLOB)))
+    upload = files["doc"]
+
+    assert b"".join(upload.chunks(chunk_size=999)) == BLOB
+    upload.seek(10)
+    assert upload.read(5) == BLOB[10:15]
+    assert upload.tell() == 15
+    upload.seek(0)
+    assert upload.read() == BLOB
+    assert upload.read() == b""
+
+
+def test_temporary_file_path_copies_the_range(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "FILE_UPLOAD_TEMP_DIR", str(tmp_path))
+    _, files = _parse_from_file(_body(("doc", "blob.bin", BLOB)))
+    upload = files["doc"]
+
+    path = upload.temporary_file_path()
+    assert path.startswith(str(tmp_path))
+    assert path.endswith(".upload.bin")
+    assert upload.temporary_file_path() == path
+    with open(path, "rb") as f:
+        assert f.read() == BLOB
+
+    upload.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_parse_starts_at_the_stream_position():
+    body = _body(("doc", "blob.bin", BLOB))
+    with tempfile.TemporaryFile() as spool:
+        spool.write(b"already read" + body)
+        spool.seek(len(b"already read"))
+        _, files = _parse(body, spool)
+
+    assert isinstance(files["doc"], BodyRangeUploadedFile)
+    assert files["doc"].read() == BLOB
+
+
+def test_encoded_files_are_still_copied():
+    body = _body(
+        ("doc", "blob.bin", base64.b64encode(BLOB)),
+        headers="Content-Transfer-Encoding: base64\r\n",
+    )
+    _, files = _parse_from_file(body)
+
+    assert isinstance(files["doc"], TemporaryUploadedFile)
+    assert files["doc"].read() == BLOB
+
+
+def test_small_bodies_stay_in_memory(monkeypatch):
+    monkeypatch.setattr(settings, "FILE_UPLOAD_MAX_MEMORY_SIZE", 2 * 1024 * 1024)
+    _, files = _parse_from_file(_body(("doc", "blob.bin", BLOB)))
+
+    assert isinstance(files["doc"], InMemoryUploadedFile)
+    assert files["doc"].read() == BLOB
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        # No final boundary.
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="doc"; filename="x.txt"\r\n'
+        "\r\n" + "x" * 500,
+        # Garbage after the final boundary.
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="doc"; filename="x.txt"\r\n'
+        "\r\n" + "x" * 500 + f"\r\n--{BOUNDARY}--\r\ngarbage",
+        # LF-only line endings before the boundary.
+        f"--{BOUNDARY}\r\n"
+        'Content-Disposition: form-data; name="doc"; filename="x.txt"\r\n'
+        "\r\n" + "x" * 500 + f"\n--{BOUNDARY}--\r\n",
+    ],
+    ids=["unterminated", "trailing-garbage", "lf-only"],
+)
+def test_malformed_bodies_parse_like_the_chunked_path(body):
+    body = body.encode()
+    expected_post, expected_files = _parse(body, BytesIO(body))
+    post, files = _parse_from_file(body)
+
+    assert post == expected_post
+    assert _contents(files) == _contents(expected_files)
@@ -18,7 +18,7 @@ import pytest
 from plain.http import Response
 from plain.server.connection import Connection
 from plain.server.http import h1
-from server_stubs import ResponseHandler, make_worker
+from server_stubs import ResponseHandler, make_worker, server_side
 
 _GET = b"GET / HTTP/1.1\r\nHost: testserver\r\n\r\n"
 
@@ -36,7 +36,7 @@ def test_unexpected_handler_error_is_logged_not_raised(
             handler=ResponseHandler(lambda: Response(b"ok", content_type="text/plain"))
         )
         server_sock, client_sock = socket.socketpair()
-        server_reader, server_writer = await asyncio.open_connection(sock=server_sock)
+        server_reader, server_writer = await server_side(server_sock)
         _, client_writer = await asyncio.open_connection(sock=client_sock)
         conn = Connection(
             worker.app,
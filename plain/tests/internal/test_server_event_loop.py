@@ -0,0 +1,180 @@
+"""SERVER_EVENT_LOOP: workers run on the stdlib loop or on uvloop.
+
+The uvloop half of each parametrized test is skipped when uvloop isn't
+installed. A full Worker.run() is driven on each loop — TLS listener,
+ALPN selecting h2 or http/1.1, a real SIGTERM through the loop's signal
+handler, and the Reloader's call_soon_threadsafe drain — since those
+are the places where a third-party loop could behave differently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import shutil
+import signal
+import socket
+import ssl
+import subprocess
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+from plain.exceptions import ImproperlyConfigured
+from plain.http import Response
+from plain.server.eventloop import get_loop_factory
+from server_stubs import H2Client, ResponseHandler, StubApp, make_worker
+
+HAS_UVLOOP = importlib.util.find_spec("uvloop") is not None
+
+LOOPS = [
+    pytest.param("asyncio", id="asyncio"),
+    pytest.param(
+        "uvloop",
+        id="uvloop",
+        marks=pytest.mark.skipif(not HAS_UVLOOP, reason="uvloop not installed"),
+    ),
+]
+
+
+def test_asyncio_is_the_stdlib_loop() -> None:
+    assert get_loop_factory("asyncio") is None
+
+
+def test_auto_uses_uvloop_only_when_installed() -> None:
+    factory = get_loop_factory("auto")
+    if HAS_UVLOOP:
+        import uvloop  # ty: ignore[unresolved-import]
+
+        assert factory is uvloop.new_event_loop
+    else:
+        assert factory is None
+
+
+@pytest.mark.skipif(HAS_UVLOOP, reason="uvloop is installed")
+def test_uvloop_requires_the_package() -> None:
+    with pytest.raises(ImproperlyConfigured, match="requires the uvloop package"):
+        get_loop_factory("uvloop")
+
+
+def test_unknown_loop_is_rejected() -> None:
+    with pytest.raises(ImproperlyConfigured, match="SERVER_EVENT_LOOP"):
+        get_loop_factory("trio")
+
+
+@pytest.fixture
+def tls_app(tmp_path: Path) -> StubApp:
+    if shutil.which("openssl") is None:
+        pytest.skip("openssl not available")
+    certfile, keyfile = tmp_path / "cert.pem", tmp_path / "key.pem"
+    subprocess.run(
+        [
+            *("openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes"),
+            *("-keyout", str(keyfile), "-out", str(certfile)),
+            *("-days", "1", "-subj", "/CN=localhost"),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    app = StubApp()
+    app.is_ssl = True
+    app.certfile = str(certfile)
+    app.keyfile = str(keyfile)
+    return app
+
+
+class _Listener:
+    def __init__(self) -> None:
+        self.sock: socket.socket | None = socket.create_server(("127.0.0.1", 0))
+
+
+def _client_context(alpn: str) -> ssl.SSLContext:
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.set_alpn_protocols([alpn])
+    return context
+
+
+def _run_worker(loop_name: str, app: StubApp, stop: Any) -> dict[str, Any]:
+    """Run a TLS worker on the named loop, talk h1 and h2 to it, stop it."""
+    listener = _Listener()
+    worker = make_worker(
+        sockets=[listener],
+        handler=ResponseHandler(lambda: Response(b"ok", content_type="text/plain")),
+    )
+    worker.app = app  # ty: ignore[invalid-assignment]
+    worker.loop_factory = get_loop_factory(loop_name)
+    assert listener.sock is not None
+    port = listener.sock.getsockname()[1]
+    seen: dict[str, Any] = {}
+
+    async def scenario() -> None:
+        seen["loop"] = type(asyncio.get_running_loop()).__module__
+        run = asyncio.create_task(worker.run())
+        while not worker._servers:
+            await asyncio.sleep(0.01)
+
+        reader, writer = await asyncio.open_connection(
+            "127.0.0.1", port, ssl=_client_context("http/1.1")
+        )
+        writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        seen["h1"] = await reader.readuntil(b"\r\n\r\n")
+        writer.close()
+
+        reader, writer = await asyncio.open_connection(
+            "127.0.0.1", port, ssl=_client_context("h2")
+        )
+        seen["alpn"] = writer.get_extra_info("ssl_object").selected_alpn_protocol()
+        client = H2Client(reader, writer)
+        await client.start()
+        await client.request(1)
+        seen["h2"] = await client.response_status(1)
+        writer.close()
+
+        stop(worker)
+        await asyncio.wait_for(run, timeout=10)
+        seen["alive"] = worker.alive
+
+    # run() installs process-level handlers for these; restore them so the
+    # test doesn't leak signal state into the rest of the suite.
+    saved = {s: signal.getsignal(s) for s in (signal.SIGABRT, signal.SIGWINCH)}
+    try:
+        asyncio.run(scenario(), loop_factory=worker.loop_factory)
+    finally:
+        for sig, handler in saved.items():
+            signal.signal(sig, handler)
+        listener.sock.close()
+        worker.tpool.shutdown(wait=False)
+    return seen
+
+
+@pytest.mark.parametrize("loop_name", LOOPS)
+def test_worker_serves_tls_and_stops_on_sigterm(
+    loop_name: str, tls_app: StubApp
+) -> None:
+    seen = _run_worker(
+        loop_name, tls_app, lambda worker: os.kill(os.getpid(), signal.SIGTERM)
+    )
+    assert seen["loop"].startswith(loop_name)
+    assert seen["h1"].startswith(b"HTTP/1.1 200")
+    assert seen["alpn"] == "h2"
+    assert seen["h2"] == "200"
+    assert seen["alive"] is False
+
+
+@pytest.mark.parametrize("loop_name", LOOPS)
+def test_worker_drains_on_a_threadsafe_callback(
+    loop_name: str, tls_app: StubApp
+) -> None:
+    # The Reloader hands _begin_drain to the loop from its own thread.
+    def stop(worker: Any) -> None:
+        threading.Thread(
+            target=worker._loop.call_soon_threadsafe, args=(worker._begin_drain,)
+        ).start()
+
+    seen = _run_worker(loop_name, tls_app, stop)
+    assert seen["loop"].startswith(loop_name)
+    assert seen["alive"] is False
@@ -34,7 +34,13 @@ import pytest
 from plain.http import Response
 from plain.server.connection import Connection
 from plain.server.http import h1
-from server_stubs import BodyLengthHandler, StubApp, h1_connect, make_worker
+from server_stubs import (
+    BodyLengthHandler,
+    StubApp,
+    h1_connect,
+    make_worker,
+    server_side,
+)
 
 
 class _Handler:
@@ -427,7 +433,7 @@ _BIG_POST = (
 
 def test_pipelined_request_after_exactly_consumed_body_is_served() -> None:
     # A large body can be consumed exactly (recv returns precise slices
-    # of wait_readable's peeked buffer), leaving a pipelined request
+    # of the reader's buffer), leaving a pipelined request
     # buffered with no body over-read to detect. Those bytes ARE the next
     # request — the keepalive wait must notice them instead of blocking
     # on the socket until the idle timeout, which would leave a fully
@@ -502,15 +508,16 @@ def test_large_body_ingest_reads_peeked_bytes() -> None:
     asyncio.run(scenario())
 
 
-def test_wait_readable_notices_already_peeked_bytes() -> None:
-    # Bytes stranded in the peek buffer (a pipelined request behind an
+def test_wait_readable_notices_already_buffered_bytes() -> None:
+    # Bytes left in the reader's buffer (a pipelined request behind an
     # exactly-consumed body) ARE the next request — wait_readable must
-    # return immediately rather than blocking on the socket. Seeds the
-    # buffer directly: whether real traffic strands bytes there depends
-    # on kernel segmentation, so the socket-level tests can't pin this.
+    # return immediately, without consuming them, rather than blocking on
+    # the socket. Seeds the buffer directly: whether real traffic leaves
+    # bytes there depends on kernel segmentation, so the socket-level
+    # tests can't pin this.
     async def scenario() -> None:
         server_sock, client_sock = socket.socketpair()
-        server_reader, server_writer = await asyncio.open_connection(sock=server_sock)
+        server_reader, server_writer = await server_side(server_sock)
         _, client_writer = await asyncio.open_connection(sock=client_sock)
         conn = Connection(
             StubApp(),  # ty: ignore[invalid-argument-type]
@@ -521,9 +528,9 @@ def test_wait_readable_notices_already_peeked_bytes() -> None:
         )
 
         try:
-            conn._peeked = b"GET / HTTP/1.1\r\n"
-            assert await asyncio.wait_for(conn.wait_readable(), timeout=1)
-            assert conn._peeked == b"GET / HTTP/1.1\r\n"
+            server_reader.buffer += b"GET / HTTP/1.1\r\n"
+            assert await conn.wait_readable(timeout=1)
+            assert server_reader.buffer == b"GET / HTTP/1.1\r\n"
         finally:
             client_writer.close()
             server_writer.close()
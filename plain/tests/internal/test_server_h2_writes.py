@@ -0,0 +1,313 @@
+"""The HTTP/2 write path batches work per executor hop and per loop tick.
+
+A sync response body is pulled a batch at a time on the executor
+(BodyPump) rather than one run_in_executor hop per chunk, frames queued
+by any number of streams during one loop tick leave in a single
+transport write, and a stream parked on flow control waits on one
+future that the client's WINDOW_UPDATE resolves.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import h2.config
+import h2.connection
+import h2.events
+import pytest
+from plain.http import StreamingResponse
+from plain.server.http.h2 import (
+    PUMP_BATCH_SIZE,
+    BodyPump,
+    H2ConnectionState,
+    _async_send_h2_data,
+)
+from server_stubs import h2_connect
+
+# ---------------------------------------------------------------------------
+# BodyPump
+# ---------------------------------------------------------------------------
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=1)
+        self.jobs = 0
+
+    def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+        self.jobs += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+async def _drain_pump(pump: BodyPump) -> list[list[bytes]]:
+    batches = []
+    while (chunks := await pump.next_chunks()) is not None:
+        batches.append(chunks)
+    return batches
+
+
+def test_pump_pulls_a_fast_body_in_batches() -> None:
+    async def scenario() -> None:
+        executor = _CountingExecutor()
+        try:
+            chunks = [b"x" * 1024] * 256
+            batches = await _drain_pump(BodyPump(iter(chunks), executor))
+            assert b"".join(b"".join(batch) for batch in batches) == b"".join(chunks)
+            # 256KB in 64KB batches: a handful of hops, not one per chunk.
+            assert executor.jobs <= 256 * 1024 // PUMP_BATCH_SIZE + 2
+        finally:
+            executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_pump_hands_over_each_slow_chunk_as_it_is_produced() -> None:
+    release = threading.Event()
+
+    def body() -> Iterator[bytes]:
+        yield b"first"
+        release.wait(5)
+        yield b"second"
+
+    async def scenario() -> None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pump = BodyPump(body(), executor)
+            # The first chunk isn't held back waiting to fill the batch.
+            assert await asyncio.wait_for(pump.next_chunks(), 2) == [b"first"]
+            release.set()
+            assert await asyncio.wait_for(pump.next_chunks(), 2) == [b"second"]
+            assert await pump.next_chunks() is None
+        finally:
+            release.set()
+            executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_pump_raises_the_body_error_after_its_chunks() -> None:
+    def body() -> Iterator[bytes]:
+        yield b"partial"
+        raise ValueError("boom")
+
+    async def scenario() -> None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pump = BodyPump(body(), executor)
+            assert await pump.next_chunks() == [b"partial"]
+            with pytest.raises(ValueError, match="boom"):
+                await pump.next_chunks()
+        finally:
+            executor.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_stopped_pump_ends_its_batch_early() -> None:
+    pulled = []
+
+    def body() -> Iterator[bytes]:
+        for i in range(1000):
+            pulled.append(i)
+            time.sleep(0.001)
+            yield b"x"
+
+    async def scenario() -> None:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pump = BodyPump(body(), executor)
+            await pump.next_chunks()
+            await pump.stop()
+            # The in-flight next() has returned, so the generator can close.
+            stopped_at = len(pulled)
+            await asyncio.sleep(0.01)
+            assert len(pulled) == stopped_at
+        finally:
+            executor.shutdown(wait=True)
+        assert len(pulled) < 1000
+
+    asyncio.run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# Per-tick frame coalescing
+# ---------------------------------------------------------------------------
+
+
+class _RecordingWriter:
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+
+    async def drain(self) -> None:
+        pass
+
+
+def test_frames_from_several_streams_leave_in_one_write() -> None:
+    async def scenario() -> None:
+        client = h2.connection.H2Connection(h2.config.H2Configuration(client_side=True))
+        client.initiate_connection()
+        server = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False)
+        )
+        server.initiate_connection()
+        for stream_id in (1, 3, 5):
+            client.send_headers(
+                stream_id,
+                [
+                    (":method", "GET"),
+                    (":path", "/"),
+                    (":scheme", "http"),
+                    (":authority", "testserver"),
+                ],
+                end_stream=True,
+            )
+        server.receive_data(client.data_to_send())
+
+        writer = _RecordingWriter()
+        state = H2ConnectionState(
+            server,
+            writer,  # ty: ignore[invalid-argument-type]
+            None,
+            None,
+            None,
+            "http",
+            ThreadPoolExecutor(max_workers=1),
+        )
+
+        async def respond(stream_id: int) -> None:
+            async with state.write_lock:
+                server.send_headers(stream_id, [(":status", "200")])
+                server.send_data(stream_id, b"body", end_stream=True)
+                await state.flush()
+
+        await asyncio.gather(*(respond(stream_id) for stream_id in (1, 3, 5)))
+        await asyncio.sleep(0)
+
+        assert len(writer.writes) == 1
+        ended = [
+            event.stream_id
+            for event in client.receive_data(writer.writes[0])
+            if isinstance(event, h2.events.StreamEnded)
+        ]
+        assert ended == [1, 3, 5]
+
+    asyncio.run(scenario())
+
+
+# ---------------------------------------------------------------------------
+# Flow control over a real connection
+# ---------------------------------------------------------------------------
+
+
+class _WindowOpeningWriter(_RecordingWriter):
+    """Grants the stream its window back while a flush drains."""
+
+    def __init__(self, client: h2.connection.H2Connection, state: Any = None) -> None:
+        super().__init__()
+        self.client = client
+        self.state = state
+
+    async def drain(self) -> None:
+        server = self.state.conn
+        if server.local_flow_control_window(1) == 0:
+            self.client.increment_flow_control_window(65535)
+            self.client.increment_flow_control_window(65535, stream_id=1)
+            server.receive_data(self.client.data_to_send())
+            # As the read loop does -- with no sender parked yet.
+            self.state.window_opened(1)
+
+
+def test_window_opened_during_the_flush_is_not_missed() -> None:
+    async def scenario() -> None:
+        client = h2.connection.H2Connection(h2.config.H2Configuration(client_side=True))
+        client.initiate_connection()
+        server = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False)
+        )
+        server.initiate_connection()
+        client.send_headers(
+            1,
+            [
+                (":method", "GET"),
+                (":path", "/"),
+                (":scheme", "http"),
+                (":authority", "testserver"),
+            ],
+            end_stream=True,
+        )
+        server.receive_data(client.data_to_send())
+        server.send_headers(1, [(":status", "200")])
+
+        writer = _WindowOpeningWriter(client)
+        state = H2ConnectionState(
+            server,
+            writer,  # ty: ignore[invalid-argument-type]
+            None,
+            None,
+            None,
+            "http",
+            ThreadPoolExecutor(max_workers=1),
+        )
+        writer.state = state
+
+        # Without the re-check this parks for the 5s window timeout.
+        await asyncio.wait_for(
+            _async_send_h2_data(state, 1, b"x" * 100_000, end_stream=True),
+            timeout=1,
+        )
+        assert server.local_flow_control_window(1) == 65535 * 2 - 100_000
+
+    asyncio.run(scenario())
+
+
+class _StreamingHandler:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    async def handle(self, request: Any, executor: Any) -> StreamingResponse:
+        size = 4096
+        chunks = [self.body[i : i + size] for i in range(0, len(self.body), size)]
+        return StreamingResponse(iter(chunks))
+
+
+def test_streamed_body_larger_than_the_window_completes_as_window_opens() -> None:
+    body = bytes(range(256)) * 1024  # 256KB, four default windows
+
+    async def scenario() -> None:
+        client, server_task, executor = await h2_connect(
+            _StreamingHandler(body), asyncio.Event()
+        )
+        try:
+            await client.request(1)
+            received = bytearray()
+            while True:
+                event = await client.wait_for(
+                    lambda e: isinstance(
+                        e, h2.events.DataReceived | h2.events.StreamEnded
+                    )
+                )
+                client.events.remove(event)
+                if isinstance(event, h2.events.StreamEnded):
+                    break
+                assert isinstance(event, h2.events.DataReceived)
+                received += event.data
+                # Grant the window back as a client does once it has
+                # consumed the data; the parked sender wakes on it.
+                client.conn.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+                await client.flush()
+            assert bytes(received) == body
+        finally:
+            server_task.cancel()
+            executor.shutdown(wait=False)
+
+    asyncio.run(scenario())
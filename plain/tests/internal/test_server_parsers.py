@@ -0,0 +1,229 @@
+"""Differential contract for the accelerated HTTP/1 request-head parser.
+
+Every header block is parsed twice — by the reference (message.Request
+alone) and with HttptoolsParser in front of it — and the outcomes must
+match exactly: the same parsed request, or the same exception type and
+message. The corpus covers the request-smuggling categories the h1spec
+conformance run exercises (tools/h1spec), plus a seeded mutation fuzzer
+over valid requests so the hand-off gates get hit from odd angles.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+import pytest
+from plain.exceptions import ImproperlyConfigured
+from plain.server.http.errors import ParseException
+from plain.server.http.message import Request
+from plain.server.http.parsers import HttptoolsParser, get_request_parser
+
+pytest.importorskip("httptools")
+
+PEER = ("127.0.0.1", 12345)
+
+
+def _outcome(data: bytes, parser: Any) -> tuple[Any, ...]:
+    try:
+        req = Request(False, data, PEER, parser=parser)
+    except ParseException as e:
+        return ("error", type(e).__name__, str(e))
+    return (
+        "ok",
+        req.method,
+        req.uri,
+        req.path,
+        req.query,
+        req.fragment,
+        req.version,
+        req.headers,
+        req.content_length,
+        req.must_close,
+    )
+
+
+def _assert_same(data: bytes) -> None:
+    assert _outcome(data, HttptoolsParser()) == _outcome(data, None), data
+
+
+def _head(*lines: str | bytes, request_line: bytes = b"GET / HTTP/1.1") -> bytes:
+    fields = [
+        line.encode("latin1") if isinstance(line, str) else line for line in lines
+    ]
+    return b"\r\n".join([request_line, *fields]) + b"\r\n\r\n"
+
+
+BROWSER = _head(
+    "Host: example.com",
+    "User-Agent: Mozilla/5.0 (X11; Linux x86_64) Gecko/20100101 Firefox/128.0",
+    "Accept: text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language: en-US,en;q=0.5",
+    "Accept-Encoding: gzip, deflate, br, zstd",
+    "Connection: keep-alive",
+    "Cookie: sessionid=abc123; csrftoken=def456",
+    "Upgrade-Insecure-Requests: 1",
+    "Sec-Fetch-Dest: document",
+    "Sec-Fetch-Mode: navigate",
+    "Priority: u=0, i",
+    request_line=b"GET /search?q=plain&page=2#results HTTP/1.1",
+)
+
+CORPUS = [
+    # Valid requests
+    BROWSER,
+    _head("Host: a"),
+    _head(request_line=b"GET / HTTP/1.0"),
+    _head("Host: a", "Content-Length: 5", request_line=b"POST /x HTTP/1.1"),
+    _head("Host: a", "Transfer-Encoding: chunked", request_line=b"POST / HTTP/1.1"),
+    _head("Host: a", "Connection: close"),
+    _head("Host: a", "X-Empty:", "X-Also-Empty:   "),
+    _head("Host: a", "X-Colon: a:b:c"),
+    _head("Host: a", "X-Tabs:\tpadded\t"),
+    _head("Host: a", "X-Inner:  two  spaces  inside "),
+    _head("host: a", "content-type: text/plain"),
+    _head("Host: a", "X-Latin: caf\xe9"),
+    _head("Host: a", "X-Token: !#$%&'*+-.^`|~"),
+    _head("Host: a", request_line=b"OPTIONS * HTTP/1.1"),
+    _head("Host: a", request_line=b"GET http://example.com/p?q HTTP/1.1"),
+    _head("Host: a", request_line=b"CONNECT example.com:443 HTTP/1.1"),
+    # Obsolete line folding
+    _head("Host: a", "X-Fold: one", " two"),
+    _head("Host: a", "X-Fold: one", "\ttwo"),
+    _head(" X-Leading: fold", "Host: a"),
+    # Bare LF / bare CR
+    b"GET / HTTP/1.1\nHost: a\r\n\r\n",
+    b"GET / HTTP/1.1\r\nHost: a\n\r\n",
+    b"GET / HTTP/1.1\r\nHost: a\rX: b\r\n\r\n",
+    _head("Host: a", "X-CR: a\rb"),
+    # NUL and other control characters
+    _head("Host: a", b"X-Nul: a\x00b"),
+    _head("Host: a", b"X-Ctl: a\x01b"),
+    _head("Host: a", b"X-Del: a\x7fb"),
+    _head(b"Ho\x00st: a"),
+    # Malformed field lines
+    _head("Host : a"),
+    _head("Host: a", "X-Space : b"),
+    _head("Host: a", ": no-name"),
+    _head("Host: a", "no-colon"),
+    _head("Host: a", "X(bad): b"),
+    _head("Host: a", "X\xe9: b"),
+    _head("Host: a", "X\xdf: b"),
+    # Host header rules
+    _head("X-Other: a"),
+    _head("Host: a", "Host: b"),
+    _head("Host: a b"),
+    _head("Host:\ta\tb"),
+    _head("Host:"),
+    # Framing headers (duplicates and conflicts)
+    _head("Host: a", "Content-Length: 5", "Content-Length: 5"),
+    _head("Host: a", "Content-Length: 5", "Content-Length: 6"),
+    _head("Host: a", "Content-Length: 5", "Transfer-Encoding: chunked"),
+    _head("Host: a", "Content-Length: +5"),
+    _head("Host: a", "Content-Length: 0x5"),
+    _head("Host: a", "Content-Length: 5 "),
+    _head("Host: a", "Transfer-Encoding: gzip, chunked"),
+    _head("Host: a", "Transfer-Encoding: chunked, gzip"),
+    _head("Host: a", "Transfer-Encoding: chunked", "Transfer-Encoding: chunked"),
+    _head("Host: a", "Transfer-Encoding: identity"),
+    _head("Transfer-Encoding: chunked", request_line=b"POST / HTTP/1.0"),
+    # Underscores
+    _head("Host: a", "X_Forwarded_For: 1.2.3.4", "X-Forwarded-For: 5.6.7.8"),
+    _head("Host: a", "Content_Length: 10"),
+    _head("Host: a", "_: x"),
+    # Request line
+    _head("Host: a", request_line=b"get / HTTP/1.1"),
+    _head("Host: a", request_line=b"G#T / HTTP/1.1"),
+    _head("Host: a", request_line=b"FOO / HTTP/1.1"),
+    _head("Host: a", request_line=b"GE / HTTP/1.1"),
+    _head("Host: a", request_line=b"GET / HTTP/2.0"),
+    _head("Host: a", request_line=b"GET / HTTP/1.10"),
+    _head("Host: a", request_line=b"GET / http/1.1"),
+    _head("Host: a", request_line=b"GET  / HTTP/1.1"),
+    _head("Host: a", request_line=b"GET / HTTP/1.1 "),
+    _head("Host: a", request_line=b"GET /"),
+    _head("Host: a", request_line=b"GET"),
+    _head("Host: a", request_line=b"GET //evil HTTP/1.1"),
+    _head("Host: a", request_line=b"GET /\x00 HTTP/1.1"),
+    _head("Host: a", request_line=b"GET /" + b"a" * 5000 + b" HTTP/1.1"),
+    # Size limits
+    _head("Host: a", "X-Long: " + "v" * 8170),
+    _head("Host: a", "X-Long: " + "v" * 8200),
+    _head("Host: a", *[f"X-{i}: v" for i in range(99)]),
+    _head("Host: a", *[f"X-{i}: v" for i in range(100)]),
+    _head("Host: a", *[f"X-{i}: v" for i in range(150)]),
+    _head("Host: a", *[f"X-{i}: {'v' * 100}" for i in range(90)]),
+    # Not a single header block
+    b"GET / HTTP/1.1\r\nHost: a\r\n\r\nX: b\r\n\r\n",
+    b"GET / HTTP/1.1\r\n\r\n",
+    b"\r\n\r\n",
+]
+
+
+@pytest.mark.parametrize("data", CORPUS, ids=range(len(CORPUS)))
+def test_corpus_matches_reference(data: bytes) -> None:
+    _assert_same(data)
+
+
+# Bytes the mutations draw from: the ones that decide tokenization.
+_INTERESTING = b"\r\n\t :\x00\x01\x7f_-Aa0\xdf\xe9/?#"
+
+
+def _mutate(rng: random.Random, data: bytes) -> bytes:
+    buf = bytearray(data)
+    for _ in range(rng.randint(1, 4)):
+        op = rng.randrange(5)
+        pos = rng.randrange(len(buf) + 1)
+        if op == 0:
+            buf.insert(pos, rng.choice(_INTERESTING))
+        elif op == 1 and pos < len(buf):
+            del buf[pos]
+        elif op == 2 and pos < len(buf):
+            buf[pos] = rng.choice(_INTERESTING)
+        elif op == 3:
+            buf[pos:pos] = rng.choice(
+                [b"\r\n", b"\r\n ", b"\r\nHost: b", b"\r\nX_Y: z", b"\r\n\r\n"]
+            )
+        else:
+            # Duplicate a slice, e.g. a whole field line.
+            end = min(len(buf), pos + rng.randint(1, 40))
+            buf[pos:pos] = buf[pos:end]
+    # The connection loop only ever hands over blocks ending in the
+    # blank line, so keep that part of the contract.
+    if not buf.endswith(b"\r\n\r\n"):
+        buf += b"\r\n\r\n"
+    return bytes(buf)
+
+
+def test_mutations_match_reference() -> None:
+    rng = random.Random(20261018)
+    seeds = [data for data in CORPUS if data.endswith(b"\r\n\r\n")]
+    for _ in range(5000):
+        _assert_same(_mutate(rng, rng.choice(seeds)))
+
+
+def test_typical_requests_take_the_fast_path() -> None:
+    parser = HttptoolsParser()
+    for data in [BROWSER, CORPUS[1], CORPUS[3], CORPUS[4]]:
+        req = Request(False, data, PEER)
+        assert parser.parse(req, data)
+
+
+def test_unusual_requests_are_handed_to_the_reference() -> None:
+    parser = HttptoolsParser()
+    req = Request(False, BROWSER, PEER)
+    for data in [
+        _head("Host: a", "X-Fold: one", " two"),
+        b"GET / HTTP/1.1\nHost: a\r\n\r\n",
+        _head("Host: a", b"X-Nul: a\x00b"),
+        _head("Host : a"),
+        _head("Host: a", "X-Long: " + "v" * 8200),
+    ]:
+        assert not parser.parse(req, data)
+
+
+def test_get_request_parser() -> None:
+    assert get_request_parser("python") is None
+    assert isinstance(get_request_parser("httptools"), HttptoolsParser)
+    with pytest.raises(ImproperlyConfigured, match="SERVER_HTTP_PARSER"):
+        get_request_parser("llhttp")
@@ -0,0 +1,195 @@
+"""Unit contract for ConnectionProtocol and its ConnectionWriter.
+
+Driven over a real socketpair: reads come out of the protocol's buffer
+in bounded slices, read deadlines share one timer that is re-armed only
+when a deadline moves in, and shorten_deadline() cuts a pending read
+short the way a worker shutdown does. On the write side, drain() waits
+out the transport's high-water mark and fails once the connection is
+lost.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+
+import pytest
+from plain.server.protocol import READ_HIGH_WATER
+from server_stubs import server_side
+
+
+def test_reads_are_bounded_slices_of_the_buffer() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await server_side(server_sock)
+        try:
+            client_sock.sendall(b"abcdefgh")
+            assert await reader.wait_readable(timeout=1)
+            while len(reader.buffer) < 8:
+                await reader.wait_for_data(timeout=1)
+
+            assert await reader.read(3) == b"abc"
+            assert reader.buffer == b"defgh"
+            assert await reader.read() == b"defgh"
+            assert reader.buffer == b""
+
+            client_sock.close()
+            assert await reader.read(10, timeout=1) == b""
+            assert reader.at_eof()
+        finally:
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_read_deadline_raises_timeout() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await server_side(server_sock)
+        try:
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                await reader.read(10, timeout=0.1)
+            assert time.monotonic() - start < 1
+        finally:
+            client_sock.close()
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_one_timer_serves_consecutive_reads() -> None:
+    # A read that finishes early leaves its timer armed; the next read
+    # with a later deadline reuses it (the timer re-arms when it fires)
+    # instead of scheduling a handle of its own.
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await server_side(server_sock)
+        try:
+            client_sock.sendall(b"x")
+            assert await reader.read(1, timeout=0.2) == b"x"
+            timer = reader._timer
+            assert timer is not None
+
+            client_sock.sendall(b"y")
+            assert await reader.read(1, timeout=5) == b"y"
+            assert reader._timer is timer
+
+            # The first deadline passes mid-read: the timer re-arms for
+            # the later one rather than failing the read.
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.4, client_sock.sendall, b"z")
+            assert await reader.read(1, timeout=5) == b"z"
+        finally:
+            client_sock.close()
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_shorten_deadline_cuts_a_pending_read() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await server_side(server_sock)
+        try:
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.05, reader.shorten_deadline, 0.05)
+            start = time.monotonic()
+            with pytest.raises(TimeoutError):
+                await reader.read(10, timeout=30)
+            assert time.monotonic() - start < 1
+
+            # With no read pending it's a no-op, and never extends one.
+            reader.shorten_deadline(0)
+            client_sock.sendall(b"ok")
+            assert await reader.read(10, timeout=1) == b"ok"
+        finally:
+            client_sock.close()
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_reading_pauses_past_the_high_water_mark_and_resumes_on_demand() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await server_side(server_sock)
+        client_sock.setblocking(False)
+        loop = asyncio.get_running_loop()
+        payload = b"x" * (READ_HIGH_WATER * 3)
+        try:
+            sender = loop.create_task(loop.sock_sendall(client_sock, payload))
+            received = 0
+            while received < len(payload):
+                chunk = await reader.read(65536, timeout=5)
+                assert chunk
+                received += len(chunk)
+                # Read-ahead is bounded by the mark plus one transport read.
+                assert len(reader.buffer) <= READ_HIGH_WATER + 262144
+            await sender
+        finally:
+            client_sock.close()
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_connection_error_is_raised_to_the_reader() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        reader, writer = await server_side(server_sock)
+        try:
+            pending = asyncio.get_running_loop().create_task(reader.read(10))
+            await asyncio.sleep(0)
+            reader.connection_lost(ConnectionResetError("reset"))
+            with pytest.raises(ConnectionResetError):
+                await pending
+            await asyncio.wait_for(writer.wait_closed(), timeout=1)
+        finally:
+            client_sock.close()
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_drain_waits_for_the_peer_to_read() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        _, writer = await server_side(server_sock)
+        client_sock.setblocking(False)
+        loop = asyncio.get_running_loop()
+        writer.transport.set_write_buffer_limits(high=65536)
+        payload = b"x" * (1024 * 1024)
+        try:
+            writer.write(payload)
+            drain = loop.create_task(writer.drain())
+            await asyncio.sleep(0.05)
+            # Nothing read yet, so the write buffer is still over the mark.
+            assert not drain.done()
+
+            received = 0
+            while received < len(payload):
+                received += len(await loop.sock_recv(client_sock, 65536))
+            await asyncio.wait_for(drain, timeout=5)
+        finally:
+            client_sock.close()
+            writer.close()
+
+    asyncio.run(scenario())
+
+
+def test_drain_raises_and_wait_closed_returns_once_the_connection_is_lost() -> None:
+    async def scenario() -> None:
+        server_sock, client_sock = socket.socketpair()
+        _, writer = await server_side(server_sock)
+        client_sock.close()
+        writer.write(b"x")
+        writer.close()
+        assert writer.is_closing()
+
+        await asyncio.wait_for(writer.wait_closed(), timeout=5)
+        with pytest.raises(ConnectionResetError):
+            await writer.drain()
+
+    asyncio.run(scenario())
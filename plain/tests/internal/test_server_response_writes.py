@@ -0,0 +1,156 @@
+"""HTTP/1 response writes are coalesced into few transport calls.
+
+The status line, headers and a small body go to the transport in one
+writelines() (one sendmsg on a plain socket) with one drain, small
+streamed chunks are batched, and anything queued goes out as soon as
+the writing task yields — so a server-sent event is never held back
+waiting for the next one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+from typing import Any
+
+from plain.http import Response as HttpResponse
+from plain.http import StreamingResponse
+from plain.server import util
+from plain.server.http.message import Request
+from plain.server.http.response import COALESCE_SIZE, Response, server_date_lines
+
+
+class _Transport:
+    def __init__(self) -> None:
+        self.closing = False
+
+    def is_closing(self) -> bool:
+        return self.closing
+
+
+class _RecordingWriter:
+    """Stands in for ConnectionWriter, recording each transport call."""
+
+    def __init__(self) -> None:
+        self.transport = _Transport()
+        self.calls: list[list[bytes]] = []
+        self.drains = 0
+
+    def write(self, data: bytes) -> None:
+        self.calls.append([data])
+
+    def writelines(self, data: list[bytes]) -> None:
+        self.calls.append(list(data))
+
+    async def drain(self) -> None:
+        self.drains += 1
+
+    @property
+    def wire(self) -> bytes:
+        return b"".join(b"".join(call) for call in self.calls)
+
+
+def _response(request: bytes = b"GET / HTTP/1.1\r\nHost: a\r\n\r\n") -> Any:
+    writer = _RecordingWriter()
+    req = Request(False, request, ("127.0.0.1", 1))
+    return Response(req, writer), writer  # ty: ignore[invalid-argument-type]
+
+
+def test_small_response_is_one_write_and_one_drain() -> None:
+    async def scenario() -> None:
+        resp, writer = _response()
+        response = HttpResponse(b"hello", content_type="text/plain")
+        response.headers["Content-Length"] = "5"
+        await resp.async_write_response(response)
+
+        assert len(writer.calls) == 1
+        assert writer.drains == 1
+        head, body = writer.wire.split(b"\r\n\r\n", 1)
+        assert head.startswith(b"HTTP/1.1 200 OK\r\nServer: plain\r\nDate: ")
+        assert b"\r\nConnection: keep-alive\r\n" in head
+        assert b"\r\nContent-Length: 5" in head
+        assert body == b"hello"
+
+    asyncio.run(scenario())
+
+
+def test_small_chunks_are_batched_with_the_terminator() -> None:
+    async def scenario() -> None:
+        resp, writer = _response()
+        response = StreamingResponse(iter([b"a", b"bc", b""]))
+        await resp.async_write_response(response)
+
+        assert len(writer.calls) == 1
+        assert writer.drains == 1
+        assert writer.wire.endswith(b"\r\n\r\n1\r\na\r\n2\r\nbc\r\n0\r\n\r\n")
+
+    asyncio.run(scenario())
+
+
+def test_large_bodies_flush_every_coalesce_size() -> None:
+    async def scenario() -> None:
+        resp, writer = _response()
+        chunks = [b"x" * (COALESCE_SIZE // 4)] * 10
+        await resp.async_write_response(StreamingResponse(iter(chunks)))
+
+        # Flushed at each COALESCE_SIZE boundary plus once at close.
+        assert len(writer.calls) == 3
+        assert writer.drains == 3
+        body = writer.wire.split(b"\r\n\r\n", 1)[1]
+        assert body.count(b"x") == COALESCE_SIZE // 4 * 10
+
+    asyncio.run(scenario())
+
+
+def test_queued_chunks_go_out_when_the_task_yields() -> None:
+    # A server-sent event must reach the wire while the stream waits for
+    # the next one, not when the batch fills.
+    async def scenario() -> None:
+        resp, writer = _response()
+        resp.prepare_response(HttpResponse(b""))
+        resp.response_length = None
+        resp.chunked = True
+
+        await resp.async_send_headers()
+        await resp.async_write(b"data: 1\n\n")
+        await resp.async_write(b"data: 2\n\n")
+        assert writer.calls == []
+
+        await asyncio.sleep(0)
+        assert len(writer.calls) == 1
+        assert writer.wire.endswith(b"data: 1\n\n\r\n9\r\ndata: 2\n\n\r\n")
+        assert writer.drains == 0
+
+        # The next write drains what the idle flush left in the transport.
+        await resp.async_write(b"data: 3\n\n")
+        assert writer.drains == 1
+        await resp.async_close()
+        assert writer.wire.endswith(b"data: 3\n\n\r\n0\r\n\r\n")
+
+    asyncio.run(scenario())
+
+
+def test_idle_flush_is_dropped_on_a_closing_transport() -> None:
+    async def scenario() -> None:
+        resp, writer = _response()
+        resp.prepare_response(HttpResponse(b"body"))
+        await resp.async_send_headers()
+        writer.transport.closing = True
+        await asyncio.sleep(0)
+        assert writer.calls == []
+
+    asyncio.run(scenario())
+
+
+def test_server_and_date_lines_are_cached_per_second(monkeypatch: Any) -> None:
+    now = [1_700_000_000.25]
+    monkeypatch.setattr(util.time, "time", lambda: now[0])
+
+    lines = server_date_lines("plain")
+    assert lines == b"Server: plain\r\nDate: Tue, 14 Nov 2023 22:13:20 GMT\r\n"
+    now[0] += 0.5
+    assert server_date_lines("plain") is lines
+
+    now[0] += 1
+    assert server_date_lines("plain").endswith(b"22:13:21 GMT\r\n")
+    assert util.http_date(0) == email.utils.formatdate(0, usegmt=True)
@@ -0,0 +1,183 @@
+"""Views with `stream_request_body` are dispatched before the body
+arrives and read it off the connection with `request.stream_body()`.
+
+Driven over a socketpair with the real BaseHandler, so URL resolution,
+the view's async handler, and h1's body reader are all in play.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+
+import pytest
+import streaming_routers
+from plain.http import UnreadablePostError
+from plain.internal.handlers.base import BaseHandler
+from plain.preflight.server import CheckServerStreamRequestBody
+from plain.runtime import settings
+from plain.test import RequestFactory
+from plain.urls.resolvers import _get_cached_resolver
+from server_stubs import chunked_payload, h1_connect, make_worker
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    monkeypatch.setattr(settings, "URLS_ROUTER", "streaming_routers.StreamingRouter")
+    monkeypatch.setattr(settings, "HTTPS_REDIRECT_ENABLED", False)
+    _get_cached_resolver.cache_clear()
+    handler = BaseHandler()
+    handler.load_middleware()
+    yield make_worker(handler=handler)
+    streaming_routers.first_chunk = None
+    _get_cached_resolver.cache_clear()
+
+
+def _post(path: str, body: bytes) -> bytes:
+    return (
+        f"POST {path} HTTP/1.1\r\nHost: testserver\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+def _digest(body: bytes) -> dict:
+    return {"size": len(body), "sha256": hashlib.sha256(body).hexdigest()}
+
+
+def test_view_reads_the_body_while_it_arrives(worker):
+    body = b"x" * 300_000
+
+    async def run():
+        streaming_routers.first_chunk = asyncio.Event()
+        client = await h1_connect(worker)
+        try:
+            # Only the first half is sent until the view has a chunk.
+            request = _post("/upload", body)
+            half = len(request) - len(body) // 2
+            await client.send(request[:half])
+            await asyncio.wait_for(streaming_routers.first_chunk.wait(), timeout=5)
+            await client.send(request[half:])
+            headers, response = await client.read_response()
+
+            # The connection is reusable once the body was read in full.
+            await client.send(_post("/upload", b"again"))
+            _, second = await client.read_response()
+            return headers, response, second
+        finally:
+            client.teardown()
+
+    headers, response, second = asyncio.run(run())
+    assert b"connection: close" not in headers.lower()
+    assert json.loads(response) == _digest(body)
+    assert json.loads(second) == _digest(b"again")
+    assert worker.body_budget.used == 0
+
+
+def test_chunked_body_streams(worker):
+    body = bytes(range(256)) * 1000
+    request = (
+        b"POST /upload HTTP/1.1\r\nHost: testserver\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n" + chunked_payload(body, 7000)
+    )
+
+    async def run():
+        client = await h1_connect(worker)
+        try:
+            await client.send(request)
+            return await client.read_response()
+        finally:
+            client.teardown()
+
+    _, response = asyncio.run(run())
+    assert json.loads(response) == _digest(body)
+
+
+def test_unread_body_closes_the_connection(worker):
+    async def run():
+        client = await h1_connect(worker)
+        try:
+            await client.send(_post("/ignore", b"x" * 100_000))
+            headers, response = await client.read_response()
+            # Ends the server's linger over the unread body.
+            client.writer.write_eof()
+            await client.assert_closed()
+            return headers, response
+        finally:
+            client.teardown()
+
+    headers, response = asyncio.run(run())
+    assert b"connection: close" in headers.lower()
+    assert json.loads(response) == {"ignored": True}
+    assert worker.body_budget.used == 0
+
+
+def test_body_over_the_cap_is_a_413(worker):
+    worker.max_request_body = 1000
+    request = (
+        b"POST /upload HTTP/1.1\r\nHost: testserver\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n" + chunked_payload(b"x" * 5000, 500)
+    )
+
+    async def run():
+        client = await h1_connect(worker)
+        try:
+            await client.send(request)
+            return await client.read_response()
+        finally:
+            client.teardown()
+
+    headers, _ = asyncio.run(run())
+    assert headers.startswith(b"HTTP/1.1 413")
+    assert worker.body_budget.used == 0
+
+
+def test_sync_view_gets_the_received_body(worker):
+    async def run():
+        client = await h1_connect(worker)
+        try:
+            await client.send(_post("/sync-upload", b"x" * 1000))
+            return await client.read_response()
+        finally:
+            client.teardown()
+
+    _, response = asyncio.run(run())
+    assert json.loads(response) == {"size": 1000}
+
+
+def test_streams_request_body_only_for_async_streaming_views(worker):
+    handler = worker.handler
+    assert handler.streams_request_body("POST", "/upload")
+    assert not handler.streams_request_body("PUT", "/upload")
+    assert not handler.streams_request_body("POST", "/sync-upload")
+    assert not handler.streams_request_body("POST", "/nowhere")
+
+
+def test_stream_body_reads_a_received_body():
+    request = RequestFactory().post(
+        "/", data=b"a" * 100, content_type="application/octet-stream"
+    )
+
+    async def collect():
+        return [chunk async for chunk in request.stream_body(chunk_size=30)]
+
+    assert asyncio.run(collect()) == [b"a" * 30] * 3 + [b"a" * 10]
+
+
+def test_streamed_body_cant_be_read_synchronously(worker):
+    from plain.server.http import h1
+
+    body = h1._StreamedBody(None, max_size=None, budget=None)  # ty: ignore[invalid-argument-type]
+    with pytest.raises(OSError, match="stream_body"):
+        body.read()
+
+    request = RequestFactory().post("/", data=b"", content_type="text/plain")
+    request._stream = body
+    with pytest.raises(UnreadablePostError):
+        request.read()
+
+
+def test_preflight_warns_about_sync_streaming_views(worker):
+    results = CheckServerStreamRequestBody().run()
+    assert [result.id for result in results] == ["server.stream_request_body_sync"]
+    assert "SyncUploadView" in results[0].fix
@@ -18,6 +18,7 @@ import random
 from typing import Any
 
 from plain.http import Response
+from plain.runtime import settings
 from plain.server.workers.worker import Worker
 from server_stubs import (
     chunked_payload,
@@ -169,3 +170,38 @@ def test_keepalive_survives_stray_crlf_between_requests():
             client.teardown()
 
     asyncio.run(scenario())
+
+
+class _UploadDigestHandler:
+    """Returns the uploaded file's class and sha256."""
+
+    async def handle(self, request: Any, executor: Any) -> Response:
+        loop = asyncio.get_running_loop()
+        upload = await loop.run_in_executor(executor, lambda: request.files["doc"])
+        digest = hashlib.sha256(upload.read()).hexdigest()
+        return Response(
+            f"{type(upload).__name__}:{upload.size}:{digest}",
+            content_type="text/plain",
+        )
+
+
+def test_spooled_multipart_upload_is_read_from_the_body(monkeypatch):
+    monkeypatch.setattr(settings, "FILE_UPLOAD_MAX_MEMORY_SIZE", 64 * 1024)
+    data = _pattern(1024 * 1024)
+    multipart_body = (
+        b"--testboundary\r\n"
+        b'Content-Disposition: form-data; name="doc"; filename="data.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n\r\n"
+        + data
+        + b"\r\n--testboundary--\r\n"
+    )
+    request = (
+        b"POST / HTTP/1.1\r\nHost: testserver\r\n"
+        b"Content-Type: multipart/form-data; boundary=testboundary\r\n"
+        + f"Content-Length: {len(multipart_body)}\r\n\r\n".encode()
+        + multipart_body
+    )
+    worker = make_worker(handler=_UploadDigestHandler())
+    worker.body_max_memory_size = 64 * 1024  # force the disk spool
+    response = asyncio.run(_roundtrip(worker, request))
+    assert response == b"BodyRangeUploadedFile:" + _expected(data)
@@ -0,0 +1,48 @@
+"""Routes for exercising SERVER_EXECUTOR_POOLS bulkheads.
+
+`ExportView` runs on the "exports" pool and blocks until the test sets
+`export_release`; `FastView` runs on the worker's shared pool.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from plain.http import Response
+from plain.urls import Router, path
+from plain.views import View
+
+export_release = threading.Event()
+
+
+class ExportView(View):
+    executor_pool = "exports"
+
+    def get(self):
+        export_release.wait(5)
+        return Response(threading.current_thread().name)
+
+
+class FastView(View):
+    def get(self):
+        return Response(threading.current_thread().name)
+
+
+class UnknownPoolView(View):
+    executor_pool = "missing"
+
+    def get(self):
+        return Response("unreachable")
+
+
+class PoolRouter(Router):
+    namespace = ""
+    urls = (
+        path("export", ExportView),
+        path("fast", FastView),
+    )
+
+
+class UnknownPoolRouter(Router):
+    namespace = ""
+    urls = (path("unknown", UnknownPoolView),)
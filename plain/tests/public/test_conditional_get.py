@@ -0,0 +1,152 @@
+"""Conditional GET: body-hash ETags from the middleware, and view-declared
+validators that skip the handler on a match."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+
+from plain.http import Response, StreamingResponse
+from plain.http.conditional import ConditionalGetMiddleware, etag_for_content
+from plain.test import RequestFactory
+from plain.views import View
+
+rf = RequestFactory()
+middleware = ConditionalGetMiddleware()
+
+UPDATED = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+UPDATED_HTTP = "Fri, 02 Jan 2026 03:04:05 GMT"
+
+
+def _after(method: str, response: Response, **headers: str) -> Response:
+    request = rf.generic(method, "/", headers=headers)
+    return middleware.after_response(request, response)
+
+
+class TestConditionalGetMiddleware:
+    def test_adds_a_body_hash_etag(self):
+        response = _after("GET", Response(b"hello"))
+        assert response.status_code == 200
+        assert response.headers["ETag"] == etag_for_content(b"hello")
+
+    def test_matching_if_none_match_is_a_304(self):
+        etag = etag_for_content(b"hello")
+        response = Response(b"hello", headers={"Cache-Control": "max-age=60"})
+        response.set_cookie("rotated", "1")
+        response = _after("GET", response, **{"If-None-Match": f'"x", W/{etag}'})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Cache-Control"] == "max-age=60"
+        assert "Content-Type" not in response.headers
+        assert "rotated" in response.cookies
+
+    def test_stale_etag_gets_the_body(self):
+        response = _after("GET", Response(b"hello"), **{"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert response.content == b"hello"
+
+    def test_if_modified_since(self):
+        def respond(since: str) -> Response:
+            return _after(
+                "HEAD",
+                Response(b"x", headers={"Last-Modified": UPDATED_HTTP}),
+                **{"If-Modified-Since": since},
+            )
+
+        assert respond(UPDATED_HTTP).status_code == 304
+        assert respond("Sat, 03 Jan 2026 00:00:00 GMT").status_code == 304
+        assert respond("Thu, 01 Jan 2026 00:00:00 GMT").status_code == 200
+        assert respond("not a date").status_code == 200
+
+    def test_if_none_match_takes_precedence_over_if_modified_since(self):
+        response = _after(
+            "GET",
+            Response(b"x", headers={"Last-Modified": UPDATED_HTTP}),
+            **{"If-None-Match": '"stale"', "If-Modified-Since": UPDATED_HTTP},
+        )
+        assert response.status_code == 200
+
+    def test_leaves_other_responses_alone(self):
+        etag = etag_for_content(b"hello")
+        for method, response in [
+            ("POST", Response(b"hello")),
+            ("GET", Response(b"hello", status_code=404)),
+            ("GET", StreamingResponse(iter([b"hello"]))),
+        ]:
+            result = _after(method, response, **{"If-None-Match": etag})
+            assert result is response
+            assert "ETag" not in result.headers
+
+    def test_no_store_gets_no_etag(self):
+        response = _after(
+            "GET", Response(b"hello", headers={"Cache-Control": "private, no-store"})
+        )
+        assert "ETag" not in response.headers
+
+
+class _ArticleView(View):
+    renders = 0
+
+    def get_response_etag(self) -> str | None:
+        return "v1"
+
+    def get_response_last_modified(self) -> datetime | None:
+        return UPDATED
+
+    def get(self) -> Response:
+        type(self).renders += 1
+        return Response(b"article")
+
+    def post(self) -> Response:
+        type(self).renders += 1
+        return Response(b"posted")
+
+
+def _view_response(method: str, **headers: str) -> Response:
+    _ArticleView.renders = 0
+    request = rf.generic(method, "/", headers=headers)
+    return _ArticleView(request=request).get_response()
+
+
+class TestViewValidators:
+    def test_match_skips_the_handler(self):
+        response = _view_response("GET", **{"If-None-Match": '"v1"'})
+        assert response.status_code == 304
+        assert _ArticleView.renders == 0
+        assert response.headers["ETag"] == '"v1"'
+        assert response.headers["Last-Modified"] == UPDATED_HTTP
+
+    def test_if_modified_since_skips_the_handler(self):
+        response = _view_response("HEAD", **{"If-Modified-Since": UPDATED_HTTP})
+        assert response.status_code == 304
+        assert _ArticleView.renders == 0
+
+    def test_miss_renders_with_the_view_validators(self):
+        response = _view_response("GET", **{"If-None-Match": '"v0"'})
+        assert response.status_code == 200
+        assert _ArticleView.renders == 1
+        assert response.headers["ETag"] == '"v1"'
+        assert response.headers["Last-Modified"] == UPDATED_HTTP
+
+        # The middleware keeps the view's ETag rather than hashing the body.
+        request = rf.get("/", headers={"If-None-Match": '"v1"'})
+        assert middleware.after_response(request, response).status_code == 304
+
+    def test_unsafe_methods_ignore_validators(self):
+        response = _view_response("POST", **{"If-None-Match": '"v1"'})
+        assert response.status_code == 200
+        assert _ArticleView.renders == 1
+        assert "ETag" not in response.headers
+
+    def test_async_handler_gets_the_view_validators(self):
+        class AsyncView(View):
+            def get_response_etag(self) -> str | None:
+                return '"v2"'
+
+            async def get(self) -> Response:  # ty: ignore[invalid-method-override]
+                return Response(b"async")
+
+        view = AsyncView(request=rf.get("/"))
+        response = asyncio.run(view.get_response())  # ty: ignore[invalid-argument-type]
+        assert response.headers["ETag"] == '"v2"'
@@ -18,6 +18,7 @@ import socket
 from plain.server.connection import Connection
 from plain.server.http.h1 import extract_request_path, handle_connection
 from plain.server.http.sink import BodyBudget
+from plain.server.protocol import ConnectionProtocol, ConnectionWriter
 
 # ---------------------------------------------------------------------------
 # Minimal worker stub — just the attributes handle_connection reads.
@@ -38,6 +39,7 @@ class _StubWorker:
         self.max_request_body: int | None = None
         self.body_min_rate = 0
         self.body_budget = BodyBudget(None)
+        self.request_parser = None
         self.nr_conns = 0
         self.max_keepalived = 10
         self.log = logging.getLogger("test")
@@ -67,9 +69,7 @@ async def _start_healthcheck_server(
     """Start a TCP server that runs handle_connection for each client."""
     worker = _StubWorker(healthcheck_path=healthcheck_path)
 
-    async def on_connect(
-        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
-    ) -> None:
+    async def on_connect(reader: ConnectionProtocol, writer: ConnectionWriter) -> None:
         conn = Connection(
             worker.app,  # ty: ignore[invalid-argument-type]
             reader,
@@ -83,7 +83,9 @@ async def _start_healthcheck_server(
             conn.close()
             await asyncio.sleep(0)  # let the writer flush
 
-    server = await asyncio.start_server(on_connect, "127.0.0.1", 0)
+    server = await asyncio.get_running_loop().create_server(
+        lambda: ConnectionProtocol(on_connect), "127.0.0.1", 0
+    )
     port = server.sockets[0].getsockname()[1]
     return server, port
 
@@ -0,0 +1,81 @@
+"""StreamingJsonResponse and AsyncStreamingJsonResponse encode an iterator
+one value at a time, in chunks of about `chunk_size` bytes."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import json
+
+from plain.http import AsyncStreamingJsonResponse, StreamingJsonResponse
+
+
+def _rows(count: int):
+    for i in range(count):
+        yield {"id": i, "name": f"row {i}", "at": datetime.date(2024, 1, 1)}
+
+
+def test_streams_a_json_array():
+    response = StreamingJsonResponse(_rows(3))
+    assert response.headers["Content-Type"] == "application/json"
+    assert json.loads(b"".join(response)) == [
+        {"id": i, "name": f"row {i}", "at": "2024-01-01"} for i in range(3)
+    ]
+
+
+def test_empty_iterator_is_an_empty_array():
+    assert b"".join(StreamingJsonResponse(iter(()))) == b"[]"
+
+
+def test_streams_ndjson_lines():
+    response = StreamingJsonResponse(_rows(3), ndjson=True)
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    lines = b"".join(response).decode().splitlines()
+    assert [json.loads(line)["id"] for line in lines] == [0, 1, 2]
+
+
+def test_chunks_are_bounded_and_lazy():
+    consumed = []
+
+    def rows():
+        for row in _rows(1000):
+            consumed.append(row)
+            yield row
+
+    response = StreamingJsonResponse(rows())
+    response.chunk_size = 1024
+    chunks = iter(response)
+    first = next(chunks)
+
+    # Only enough rows for the first chunk have been pulled.
+    assert 1024 <= len(first) < 1024 + 100
+    assert len(consumed) < 50
+
+    body = first + b"".join(chunks)
+    assert len(json.loads(body)) == 1000
+
+
+def test_close_closes_the_source_iterator():
+    rows = _rows(10)
+    response = StreamingJsonResponse(rows)
+    next(iter(response), None)
+    response.close()
+    assert rows.gi_frame is None
+
+
+def test_async_streams_a_json_array():
+    async def rows():
+        for row in _rows(3):
+            await asyncio.sleep(0)
+            yield row
+
+    async def collect(response):
+        return b"".join([chunk async for chunk in response])
+
+    response = AsyncStreamingJsonResponse(rows(), ndjson=True)
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    body = asyncio.run(collect(response))
+    assert [json.loads(line)["id"] for line in body.splitlines()] == [0, 1, 2]
+
+    body = asyncio.run(collect(AsyncStreamingJsonResponse(rows())))
+    assert [row["id"] for row in json.loads(body)] == [0, 1, 2]
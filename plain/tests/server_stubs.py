@@ -24,6 +24,7 @@ from plain.server.connection import Connection
 from plain.server.http import h1
 from plain.server.http.h2 import async_handle_h2_connection
 from plain.server.http.sink import BodyBudget
+from plain.server.protocol import ConnectionProtocol, ConnectionWriter
 from plain.server.workers.worker import Worker
 
 
@@ -149,9 +150,20 @@ class H1Client:
         self.worker.tpool.shutdown(wait=False)
 
 
+async def server_side(
+    sock: socket.socket,
+) -> tuple[ConnectionProtocol, ConnectionWriter]:
+    """Wrap the server end of a socketpair the way the worker's listener does."""
+    _, protocol = await asyncio.get_running_loop().connect_accepted_socket(
+        ConnectionProtocol, sock
+    )
+    assert protocol.writer is not None
+    return protocol, protocol.writer
+
+
 async def h1_connect(worker: Worker) -> H1Client:
     server_sock, client_sock = socket.socketpair()
-    server_reader, server_writer = await asyncio.open_connection(sock=server_sock)
+    server_reader, server_writer = await server_side(server_sock)
     client_reader, client_writer = await asyncio.open_connection(sock=client_sock)
 
     conn = Connection(
@@ -369,7 +381,7 @@ async def h2_connect(
 ) -> tuple[H2Client, asyncio.Task[None], ThreadPoolExecutor]:
     """Start async_handle_h2_connection over a socketpair with a real client."""
     server_sock, client_sock = socket.socketpair()
-    server_reader, server_writer = await asyncio.open_connection(sock=server_sock)
+    server_reader, server_writer = await server_side(server_sock)
     client_reader, client_writer = await asyncio.open_connection(sock=client_sock)
 
     executor = ThreadPoolExecutor(max_workers=1)
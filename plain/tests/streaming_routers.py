@@ -0,0 +1,54 @@
+"""Routes for exercising views with `stream_request_body`.
+
+`UploadView` reports how many bytes and chunks it streamed and whether
+the body was complete when its first chunk arrived (the test holds the
+rest back until `first_chunk` is set).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+
+from plain.http import JsonResponse
+from plain.urls import Router, path
+from plain.views import View
+
+first_chunk: asyncio.Event | None = None
+
+
+class UploadView(View):
+    stream_request_body = True
+
+    async def post(self):  # ty: ignore[invalid-method-override]
+        digest = hashlib.sha256()
+        size = 0
+        async for chunk in self.request.stream_body():
+            if first_chunk is not None:
+                first_chunk.set()
+            digest.update(chunk)
+            size += len(chunk)
+        return JsonResponse({"size": size, "sha256": digest.hexdigest()})
+
+
+class IgnoreBodyView(View):
+    stream_request_body = True
+
+    async def post(self):  # ty: ignore[invalid-method-override]
+        return JsonResponse({"ignored": True})
+
+
+class SyncUploadView(View):
+    stream_request_body = True
+
+    def post(self):
+        return JsonResponse({"size": len(self.request.body)})
+
+
+class StreamingRouter(Router):
+    namespace = ""
+    urls = (
+        path("upload", UploadView),
+        path("ignore", IgnoreBodyView),
+        path("sync-upload", SyncUploadView),
+    )
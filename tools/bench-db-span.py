@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Measure the per-query overhead of plain.postgres's db_span.
+
+Times an empty query span with a non-recording tracer (the default when no
+OpenTelemetry SDK is configured) and with an always-on SDK tracer, which adds
+the call-site lookup. No database connection is made.
+
+Usage:
+    uv run python tools/bench-db-span.py
+    uv run python tools/bench-db-span.py --iterations 200000 --depth 40
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, ClassVar
+
+# Change to example directory to have a valid Plain app
+script_dir = Path(__file__).parent
+example_dir = script_dir.parent / "example"
+
+if example_dir.exists():
+    os.chdir(example_dir)
+    sys.path.insert(0, str(example_dir))
+else:
+    print(f"Error: Could not find example at {example_dir}", file=sys.stderr)
+    sys.exit(1)
+
+import plain.runtime
+
+plain.runtime.setup()
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.trace import NoOpTracer
+from plain.postgres import otel
+
+SQL = (
+    'SELECT "tasks_project"."id", "tasks_project"."name", "tasks_project"."owner_id" '
+    'FROM "tasks_project" WHERE "tasks_project"."owner_id" = %s '
+    'ORDER BY "tasks_project"."id" ASC LIMIT 21'
+)
+
+
+class StubDb:
+    settings_dict: ClassVar[dict[str, Any]] = {"DATABASE": "bench", "HOST": "localhost"}
+
+
+def run_spans(iterations: int) -> float:
+    db = StubDb()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        with otel.db_span(db, SQL, params=(1,)):  # ty: ignore[invalid-argument-type]
+            pass
+    return time.perf_counter() - start
+
+
+def at_depth(depth: int, fn: Any, *args: Any) -> Any:
+    # Queries come from deep in a request's stack; the call-site lookup cost
+    # depends on how far it has to walk.
+    if depth <= 0:
+        return fn(*args)
+    return at_depth(depth - 1, fn, *args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--depth", type=int, default=30)
+    args = parser.parse_args()
+
+    for label, tracer in (
+        ("non-recording tracer", NoOpTracer()),
+        ("recording tracer", TracerProvider().get_tracer("bench")),
+    ):
+        otel.tracer = tracer
+        at_depth(args.depth, run_spans, 1000)  # warm up
+        elapsed = at_depth(args.depth, run_spans, args.iterations)
+        print(
+            f"  {label:<22} {elapsed / args.iterations * 1e6:>7.2f}us/query"
+            f"  ({args.iterations:,} queries, stack depth +{args.depth})"
+        )
+
+
+if __name__ == "__main__":
+    main()
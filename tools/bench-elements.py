@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Time a page of plain.elements tags against the previous per-use render.
+
+Renders a page of Card, Badge and Button elements (3 per row) with the
+current Element() and with a copy of the old one, which merged the whole
+context into a new dict and called template.render() for every element.
+
+Usage:
+    uv run python tools/bench-elements.py
+    uv run python tools/bench-elements.py --elements 500 --repeat 50
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# The plain-elements test app is the smallest app with elements installed
+script_dir = Path(__file__).parent
+app_dir = script_dir.parent / "plain-elements" / "tests"
+
+if app_dir.exists():
+    os.chdir(app_dir)
+    sys.path.insert(0, str(app_dir))
+else:
+    print(f"Error: Could not find the test app at {app_dir}", file=sys.stderr)
+    sys.exit(1)
+
+import plain.runtime
+
+plain.runtime.setup()
+
+from jinja2 import DictLoader, pass_context
+from jinja2.runtime import Context
+from plain.templates.jinja import environment
+from plain.utils.safestring import SafeString, mark_safe
+
+TEMPLATES = {
+    "elements/Button.html": (
+        '<button type="{{ type|default("button") }}" class="btn">{{ children }}</button>'
+    ),
+    "elements/Badge.html": '<span class="badge badge-{{ color }}">{{ label }}</span>',
+    "elements/Card.html": '<div class="card"><h3>{{ title }}</h3>{{ children }}</div>',
+    "page.html": (
+        "{% use_elements %}<html><body>{% for i in rows %}"
+        '<Card title={"Row " ~ i}><Badge color="green" label={i} />'
+        '<Button type="submit">Save {{ i }}</Button></Card>'
+        "{% endfor %}</body></html>"
+    ),
+}
+
+# What {% use_elements %} turned page.html into before elements compiled to
+# direct calls.
+LEGACY_PAGE = (
+    "<html><body>{% for i in rows %}"
+    '{% call LegacyElement("Card", title="Row " ~ i) %}'
+    '{% call LegacyElement("Badge", color="green", label=i) %}{% endcall %}'
+    '{% call LegacyElement("Button", type="submit") %}Save {{ i }}{% endcall %}'
+    "{% endcall %}{% endfor %}</body></html>"
+)
+
+
+@pass_context
+def legacy_element(ctx: Context, _element_name: str, **kwargs: Any) -> SafeString:
+    template = ctx.environment.get_template(f"elements/{_element_name}.html")
+    if "caller" in kwargs and "children" not in kwargs:
+        kwargs["children"] = kwargs["caller"]()
+    return mark_safe(template.render({**ctx.get_all(), **kwargs}))
+
+
+def measure(render, repeat: int) -> float:
+    render()
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            render()
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--elements", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    env = environment.overlay(loader=DictLoader(TEMPLATES), auto_reload=False)
+    rows = list(range(args.elements // 3))
+    page = env.get_template("page.html")
+    legacy_page = env.from_string(
+        LEGACY_PAGE, globals={"LegacyElement": legacy_element}
+    )
+
+    assert page.render(rows=rows) == legacy_page.render(rows=rows)
+
+    print(f"{len(rows) * 3} elements, {len(page.render(rows=rows)):,} characters\n")
+    legacy = measure(lambda: legacy_page.render(rows=rows), args.repeat)
+    current = measure(lambda: page.render(rows=rows), args.repeat)
+    print(f"{'per-use render':<16} {legacy * 1000:8.2f}ms")
+    print(f"{'Element()':<16} {current * 1000:8.2f}ms {legacy / current:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Compare the JSON_CODEC codecs on a typical API payload.
+
+Times dumps (the JsonResponse path), strict dumps (JSON columns) and loads
+(request.json_data and JSON columns) for every codec that can be loaded.
+Install orjson to include it.
+
+Usage:
+    uv run python tools/bench-json.py
+    uv run python tools/bench-json.py --rows 1000 --repeat 200
+"""
+
+import argparse
+import datetime
+import decimal
+import time
+import uuid
+from functools import partial
+
+from plain.exceptions import ImproperlyConfigured
+from plain.json import load_json_codec
+
+CODECS = ("json", "orjson")
+
+
+def make_payload(rows: int) -> dict:
+    now = datetime.datetime(2024, 5, 6, 7, 8, 9, 123456, tzinfo=datetime.UTC)
+    return {
+        "count": rows,
+        "results": [
+            {
+                "id": uuid.UUID(int=i),
+                "name": f"Project {i}",
+                "description": "Lorem ipsum dolor sit amet " * 4,
+                "price": decimal.Decimal(f"{i}.99"),
+                "created_at": now - datetime.timedelta(hours=i),
+                "due": (now + datetime.timedelta(days=i)).date(),
+                "tags": ["alpha", "beta", "gamma"],
+                "owner": {"id": i % 17, "email": f"user{i % 17}@example.com"},
+                "active": i % 3 != 0,
+            }
+            for i in range(rows)
+        ],
+    }
+
+
+def make_strict_payload(rows: int) -> dict:
+    # What a JSON column holds: only native JSON types.
+    return {
+        "results": [
+            {"id": i, "name": f"Project {i}", "score": i * 1.5, "tags": ["a", "b"]}
+            for i in range(rows)
+        ]
+    }
+
+
+def measure(fn, value, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn(value)
+        best = min(best, (time.perf_counter() - start) / repeat)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    payload = make_payload(args.rows)
+    strict_payload = make_strict_payload(args.rows)
+    encoded = load_json_codec("json").dumps_bytes(payload)
+    print(f"{args.rows} rows, {len(encoded):,} bytes encoded\n")
+    print(f"{'codec':<8} {'dumps':>12} {'strict dumps':>14} {'loads':>12}")
+
+    baseline: dict[str, float] = {}
+    for name in CODECS:
+        try:
+            codec = load_json_codec(name)
+        except ImproperlyConfigured:
+            print(f"{name:<8} (not installed)")
+            continue
+
+        timings = {
+            "dumps": measure(codec.dumps_bytes, payload, args.repeat),
+            "strict": measure(
+                partial(codec.dumps_bytes, strict=True), strict_payload, args.repeat
+            ),
+            "loads": measure(codec.loads, encoded, args.repeat),
+        }
+        baseline = baseline or timings
+        cells = [
+            f"{timings[key] * 1e6:8.1f}µs {baseline[key] / timings[key]:4.1f}x"
+            for key in ("dumps", "strict", "loads")
+        ]
+        print(f"{name:<8} {cells[0]:>12} {cells[1]:>14} {cells[2]:>12}")
+
+
+if __name__ == "__main__":
+    main()